@@ -13,8 +13,10 @@ For demo purposes only - does not require ZerePy integration.
 """
 
 import os
+import sys
 import json
 import time
+import argparse
 import random
 import uuid
 import subprocess
@@ -24,6 +26,7 @@ from PIL import Image, ImageDraw, ImageFont
 import cv2
 import numpy as np
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Create necessary directories
 os.makedirs("demo/proposals", exist_ok=True)
@@ -40,8 +43,12 @@ DEMO_CONFIG = {
     "ollama_url": "http://localhost:11434/api/generate",
     "ollama_model": "deepseek-r1:1.5b", # or whatever model you have
     "simulation_delay": 1.5,  # seconds between steps for demo pacing
+    "quiet": False,  # suppress step/agent output (batch mode)
 }
 
+# Pipeline stages timed in batch mode, in execution order
+BATCH_STAGES = ["generate_content", "facilitate_voting", "publish_content", "generate_recommendations"]
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -56,11 +63,15 @@ class Colors:
 
 def print_step(step, message):
     """Print a colored step message with a timestamp"""
+    if DEMO_CONFIG["quiet"]:
+        return
     timestamp = datetime.datetime.now().strftime("%H:%M:%S")
     print(f"{Colors.BOLD}{Colors.BLUE}[{timestamp}] STEP {step}:{Colors.ENDC} {Colors.YELLOW}{message}{Colors.ENDC}")
 
 def print_agent(agent, message):
     """Print a colored agent message"""
+    if DEMO_CONFIG["quiet"]:
+        return
     timestamp = datetime.datetime.now().strftime("%H:%M:%S")
     colors = {
         "ContentCreationAgent": Colors.CYAN,
@@ -70,9 +81,16 @@ def print_agent(agent, message):
     color = colors.get(agent, Colors.BLUE)
     print(f"{Colors.BOLD}{color}[{timestamp}] {agent}:{Colors.ENDC} {message}")
 
+def print_error(message):
+    """Print a red error message"""
+    if DEMO_CONFIG["quiet"]:
+        return
+    print(f"{Colors.RED}{message}{Colors.ENDC}")
+
 def simulate_delay():
     """Add a delay between steps for better demo pacing"""
-    time.sleep(DEMO_CONFIG["simulation_delay"])
+    if DEMO_CONFIG["simulation_delay"] > 0:
+        time.sleep(DEMO_CONFIG["simulation_delay"])
 
 def get_llm_response(prompt):
     """Get a response from Ollama LLM"""
@@ -88,11 +106,11 @@ def get_llm_response(prompt):
         if response.status_code == 200:
             return response.json()["response"]
         else:
-            print(f"{Colors.RED}Error calling Ollama: {response.status_code}{Colors.ENDC}")
+            print_error(f"Error calling Ollama: {response.status_code}")
             # Return a fallback response for demo purposes
             return "Fallback response for demo"
     except Exception as e:
-        print(f"{Colors.RED}Exception when calling Ollama: {str(e)}{Colors.ENDC}")
+        print_error(f"Exception when calling Ollama: {str(e)}")
         # Return a fallback response for demo purposes
         return """
         {
@@ -437,7 +455,7 @@ def generate_content(proposal):
         
         content_plan = json.loads(llm_response)
     except json.JSONDecodeError:
-        print(f"{Colors.RED}Error parsing LLM response as JSON. Using fallback content.{Colors.ENDC}")
+        print_error("Error parsing LLM response as JSON. Using fallback content.")
         content_plan = {
             "title": "Blockchain Fundamentals",
             "segments": [
@@ -719,8 +737,9 @@ def generate_recommendations(published_content):
         'calculated_at': datetime.datetime.now().isoformat()
     }
     
-    # Save engagement metrics
-    with open(f"demo/recommendations/engagement_{published_content['channel_id']}.json", 'w') as f:
+    # Save engagement metrics, one file per publication so concurrent batch runs don't collide
+    artifact_key = f"{published_content['channel_id']}_{published_content['published_id']}"
+    with open(f"demo/recommendations/engagement_{artifact_key}.json", 'w') as f:
         json.dump(engagement, f, indent=2)
     
     print_agent("RecommendationAgent", f"Channel #{published_content['channel_id']} engagement: {engagement['views']} views, {engagement['likes']} likes")
@@ -739,13 +758,128 @@ def generate_recommendations(published_content):
     }
     
     # Save reward distribution
-    with open(f"demo/recommendations/reward_{published_content['channel_id']}.json", 'w') as f:
+    with open(f"demo/recommendations/reward_{artifact_key}.json", 'w') as f:
         json.dump(reward, f, indent=2)
     
     print_agent("RecommendationAgent", f"Distributing reward of {reward['reward_amount']} {reward['reward_token']} tokens to channel #{published_content['channel_id']}")
     
     return True
 
+def load_batch_proposals(path):
+    """Load proposals from a JSON list or a JSON-lines file, filling in demo defaults"""
+    with open(path, 'r') as f:
+        raw = f.read().strip()
+    
+    if raw.startswith('['):
+        entries = json.loads(raw)
+    else:
+        entries = [json.loads(line) for line in raw.splitlines() if line.strip()]
+    
+    proposals = []
+    for i, entry in enumerate(entries):
+        proposal = {
+            "proposal_id": DEMO_CONFIG["proposal_id"] + i,
+            "channel_id": DEMO_CONFIG["channel_id"],
+            "title": f"Batch proposal {i + 1}",
+            "approved_at": datetime.datetime.now().isoformat(),
+            "approval_votes": 75,
+            "content_uri": f"ipfs://Qm{uuid.uuid4().hex[:46]}"
+        }
+        proposal.update(entry)
+        if "description" not in proposal:
+            raise ValueError(f"Proposal {i + 1} in {path} has no description")
+        proposals.append(proposal)
+    return proposals
+
+def run_pipeline(proposal):
+    """Run one proposal through every stage, returning per-stage latencies in seconds"""
+    timings = {}
+    
+    started = time.perf_counter()
+    content_draft = generate_content(proposal)
+    timings["generate_content"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    vote = facilitate_voting(content_draft)
+    timings["facilitate_voting"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    published_content = publish_content(vote, content_draft)
+    timings["publish_content"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    generate_recommendations(published_content)
+    timings["generate_recommendations"] = time.perf_counter() - started
+    
+    timings["total"] = sum(timings.values())
+    return timings
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered) + 0.5 - 1e-9)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def run_batch(proposals_path, concurrency=4, output_path=None):
+    """
+    Run the pipeline headlessly for every proposal in a file, at most
+    `concurrency` proposals at a time, and print per-stage latency percentiles.
+    
+    Returns:
+        Number of proposals that failed
+    """
+    proposals = load_batch_proposals(proposals_path)
+    print(f"{Colors.BOLD}Running {len(proposals)} proposals with concurrency {concurrency}...{Colors.ENDC}")
+    
+    results = []
+    failures = []
+    batch_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(run_pipeline, proposal): proposal for proposal in proposals}
+        for future in as_completed(futures):
+            proposal = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failures.append({"proposal_id": proposal["proposal_id"], "error": str(e)})
+                print(f"{Colors.RED}Proposal #{proposal['proposal_id']} failed: {e}{Colors.ENDC}")
+    wall_seconds = time.perf_counter() - batch_started
+    
+    summary = {
+        "proposals": len(proposals),
+        "completed": len(results),
+        "failed": len(failures),
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_minute": round(len(results) / wall_seconds * 60, 2) if wall_seconds else 0,
+        "stages": {},
+        "failures": failures
+    }
+    
+    print(f"\n{Colors.BOLD}{'stage':<26} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}{Colors.ENDC}")
+    for stage in BATCH_STAGES + ["total"]:
+        values = [result[stage] for result in results]
+        if not values:
+            continue
+        stats = {
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p99": percentile(values, 99),
+            "max": max(values)
+        }
+        summary["stages"][stage] = {key: round(value, 4) for key, value in stats.items()}
+        print(f"{stage:<26} {stats['p50']:>7.2f}s {stats['p90']:>7.2f}s {stats['p99']:>7.2f}s {stats['max']:>7.2f}s")
+    
+    print(f"\n{len(results)}/{len(proposals)} proposals completed in {wall_seconds:.1f}s "
+          f"({summary['throughput_per_minute']} per minute)")
+    
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Report written to {output_path}")
+    
+    return len(failures)
+
 def main():
     """Main demo workflow"""
     print(f"\n{Colors.BOLD}{Colors.HEADER}======== KnowScroll AI Agent Demo ========{Colors.ENDC}\n")
@@ -778,4 +912,21 @@ def main():
     print("\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="KnowScroll end-to-end demo")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Run headlessly over the proposals in FILE (JSON list or JSON lines)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Proposals processed in parallel in batch mode (default: 4)")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Seconds between simulated steps in batch mode (default: 0)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print step and agent messages in batch mode")
+    parser.add_argument("--output", help="Write the batch latency report to this JSON file")
+    args = parser.parse_args()
+    
+    if args.batch:
+        DEMO_CONFIG["simulation_delay"] = args.delay
+        DEMO_CONFIG["quiet"] = not args.verbose
+        sys.exit(1 if run_batch(args.batch, max(1, args.concurrency), args.output) else 0)
+    else:
+        main()
\ No newline at end of file
@@ -6,9 +6,14 @@ if __name__ == "__main__":
     parser.add_argument('--server', action='store_true', help='Run in server mode')
     parser.add_argument('--host', default='0.0.0.0', help='Server host (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=8000, help='Server port (default: 8000)')
+    parser.add_argument('--agents', nargs='+', metavar='AGENT',
+                        help='Run these agents together in one process, sharing connections')
     args = parser.parse_args()
 
-    if args.server:
+    if args.agents:
+        from src.agent_host import AgentHost
+        AgentHost(args.agents).run()
+    elif args.server:
         try:
             from src.server import start_server
             start_server(host=args.host, port=args.port)
@@ -1,20 +1,97 @@
+import asyncio
 import logging
+import importlib
+from contextvars import ContextVar
+from src.metrics import metrics
+from src.tracing import span
 
 logger = logging.getLogger("action_handler")
 
 action_registry = {}    
+readiness_registry = {}
+requirements_registry = {}
 
-def register_action(action_name):
+# Stands for the agent's LLM provider in an action's requires list
+LLM_PROVIDER = "llm"
+
+# Name of the agent action running in this context (e.g. for per-action LLM caching)
+current_action: ContextVar = ContextVar("current_action", default=None)
+
+# Connection name -> module registering the agent actions built on it
+ACTION_MODULES = {
+    "twitter": "src.actions.twitter_actions",
+    "echochambers": "src.actions.echochamber_actions",
+    "solana": "src.actions.solana_actions",
+}
+
+# Task name -> module registering it, for actions not tied to one connection
+TASK_MODULES = dict.fromkeys(
+    (
+        "check-approved-proposals", "generate-content-draft", "notify-approval-agent",
+        "check-pending-content", "initiate-content-vote", "check-vote-results", "publish-approved-content",
+        "analyze-user-behavior", "generate-recommendations", "calculate-engagement-metrics", "distribute-rewards",
+    ),
+    "src.actions.knowscroll_actions"
+)
+
+def load_action_modules(connection_names, task_names=()):
+    """Import the action modules for the given connections and tasks, registering their actions"""
+    for name in connection_names:
+        if name in ACTION_MODULES:
+            importlib.import_module(ACTION_MODULES[name])
+    for name in task_names:
+        if name in TASK_MODULES:
+            importlib.import_module(TASK_MODULES[name])
+
+def register_action(action_name, requires=()):
+    """
+    Register an agent action.
+
+    requires names the connections the action calls (LLM_PROVIDER for the
+    agent's model provider), so the scheduler can skip it while one is down.
+    """
     def decorator(func):
         action_registry[action_name] = func
+        if requires:
+            requirements_registry[action_name] = tuple(requires)
+        return func
+    return decorator
+
+def register_readiness(action_name):
+    """Register a probe(agent) -> bool telling the scheduler whether an action has work to do"""
+    def decorator(func):
+        readiness_registry[action_name] = func
         return func
     return decorator
 
 def execute_action(agent, action_name, **kwargs):
     if action_name in action_registry:
-       return action_registry[action_name](agent, **kwargs)
+        token = current_action.set(action_name)
+        try:
+            with span("action", action=action_name), metrics.timed("action", action_name):
+                return action_registry[action_name](agent, **kwargs)
+        finally:
+            current_action.reset(token)
     else:
         logger.error(f"Action {action_name} not found")
         return None
+
+async def execute_action_async(agent, action_name, *args, **kwargs):
+    """Run an action without blocking the event loop.
+
+    Coroutine actions are awaited directly; regular actions run in a worker thread.
+    """
+    if action_name not in action_registry:
+        logger.error(f"Action {action_name} not found")
+        return None
+    action = action_registry[action_name]
+    token = current_action.set(action_name)
+    try:
+        with span("action", action=action_name), metrics.timed("action", action_name):
+            if asyncio.iscoroutinefunction(action):
+                return await action(agent, *args, **kwargs)
+            return await asyncio.to_thread(action, agent, *args, **kwargs)
+    finally:
+        current_action.reset(token)
     
 
@@ -5,6 +5,15 @@ def check_pending_content(agent_context, **kwargs):
     import os
     import json
     
+    # Drafts handed off in memory by a content agent in the same AgentHost
+    host = getattr(agent_context, "host", None)
+    if host is not None:
+        drafts = host.drain("content-drafts")
+        for notification_data in drafts:
+            agent_context.queue_task("initiate-content-vote", notification_data)
+        if drafts:
+            return f"Found {len(drafts)} pending content drafts"
+
     notifications_dir = "./data/notifications"
     if not os.path.exists(notifications_dir):
         return "No pending content found"
@@ -2,7 +2,6 @@ import json
 import sqlite3
 import os
 from datetime import datetime, timedelta
-from web3 import Web3
 
 # Connect to content votes database
 def get_votes_db():
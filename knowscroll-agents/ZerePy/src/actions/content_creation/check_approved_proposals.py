@@ -1,5 +1,4 @@
 
-from web3 import Web3
 import json
 import os
 import datetime
@@ -33,6 +32,8 @@ def get_db_connection():
 
 # Main function to check for approved proposals
 def check_approved_proposals(agent_context, **kwargs):
+    from web3 import Web3
+
     # Get Sonic RPC URL from agent configuration
     rpc_url = agent_context.get_connection_config("sonic").get("rpc", "https://rpc.soniclabs.com")
     governance_address = "0x8a47f1097F85fa4f8ce536d513744Fb4377FBc72" 
@@ -28,7 +28,7 @@ def get_content_db():
     return conn
 
 # Simple text-to-video simulation for demo purposes
-def generate_video_placeholder(segment_text, segment_index, draft_id):
+def generate_video_placeholder(segment_text, segment_index, draft_id, render_job_id=None):
 
     
     output_dir = f"./content/drafts/{draft_id}"
@@ -38,7 +38,8 @@ def generate_video_placeholder(segment_text, segment_index, draft_id):
         "text": segment_text,
         "segment_index": segment_index,
         "simulated_video_length": len(segment_text) // 10,  # Simulate length based on text
-        "generated_at": datetime.now().isoformat()
+        "generated_at": datetime.now().isoformat(),
+        "render_job_id": render_job_id
     }
     
     # Save placeholder as JSON
@@ -59,7 +60,6 @@ def generate_content_draft(agent_context, proposal_data, **kwargs):
     draft_id = hashlib.md5(f"{proposal_id}_{int(time.time())}".encode()).hexdigest()
     
     # Use LLM to generate content plan
-    llm = agent_context.get_llm()
     content_prompt = f"""
     You are creating educational micro-content for a learning channel. 
     
@@ -87,7 +87,7 @@ def generate_content_draft(agent_context, proposal_data, **kwargs):
     
     # Get content plan from LLM
     try:
-        content_plan_response = llm.generate(content_prompt)
+        content_plan_response = agent_context.prompt_llm(content_prompt)
         # Extract JSON from response
         content_plan = json.loads(content_plan_response)
     except Exception as e:
@@ -109,10 +109,21 @@ def generate_content_draft(agent_context, proposal_data, **kwargs):
     )
     conn.commit()
     
-    # Generate video placeholders for each segment
+    # Queue a background render for each segment and write its placeholder,
+    # so the agent loop carries on while the videos are produced
+    # Imported here: the renderer pulls in OpenCV, which only this step needs
+    from src.utils.render_jobs import get_render_service
+    render_service = get_render_service()
+    render_job_ids = []
     for i, segment in enumerate(content_plan['segments']):
         segment_text = f"{segment['segment_title']}\n\n{segment['script']}"
-        video_path = generate_video_placeholder(segment_text, i, draft_id)
+        job = render_service.submit(
+            segment['segment_title'],
+            segment['script'],
+            visuals_desc=segment.get('visuals')
+        )
+        render_job_ids.append(job.job_id)
+        video_path = generate_video_placeholder(segment_text, i, draft_id, job.job_id)
         
     # Notify the approval agent
     notification_data = {
@@ -120,7 +131,8 @@ def generate_content_draft(agent_context, proposal_data, **kwargs):
         'proposal_id': proposal_id,
         'channel_id': channel_id,
         'title': content_plan['title'],
-        'segments_count': len(content_plan['segments'])
+        'segments_count': len(content_plan['segments']),
+        'render_job_ids': render_job_ids
     }
     
     agent_context.queue_task("notify-approval-agent", notification_data)
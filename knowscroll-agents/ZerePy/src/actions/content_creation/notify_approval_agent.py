@@ -7,6 +7,12 @@ def notify_approval_agent(agent_context, notification_data, **kwargs):
 
     import json
     import os
+
+    # Running in the same AgentHost as the approval agent: hand off in memory
+    host = getattr(agent_context, "host", None)
+    if host is not None:
+        host.publish("content-drafts", notification_data)
+        return f"Notification sent for content draft {notification_data['draft_id']}"
     
     # Create notifications directory if it doesn't exist
     os.makedirs("./data/notifications", exist_ok=True)
@@ -1,8 +1,13 @@
 import time,random
-from src.action_handler import register_action
+from src.action_handler import register_action, register_readiness, LLM_PROVIDER
 from src.prompts import REPLY_ECHOCHAMBER_PROMPT, POST_ECHOCHAMBER_PROMPT
 
-@register_action("post-echochambers")
+@register_readiness("post-echochambers")
+def post_echochambers_ready(agent):
+    last_message = agent.state.get("echochambers_last_message", 0)
+    return time.time() - last_message > getattr(agent, "echochambers_message_interval", 0)
+
+@register_action("post-echochambers", requires=("echochambers", LLM_PROVIDER))
 def post_echochambers(agent, **kwargs):
     current_time = time.time()
 
@@ -39,7 +44,7 @@ def post_echochambers(agent, **kwargs):
             return True
     return False
 
-@register_action("reply-echochambers")
+@register_action("reply-echochambers", requires=("echochambers", LLM_PROVIDER))
 def reply_echochambers(agent, **kwargs):
     agent.logger.info("\n🔍 CHECKING FOR MESSAGES TO REPLY TO")
     
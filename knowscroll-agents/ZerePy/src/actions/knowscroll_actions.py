@@ -0,0 +1,56 @@
+import os
+from src.action_handler import register_action, register_readiness, LLM_PROVIDER
+from src.actions.approval.check_pending_content import check_pending_content
+from src.actions.approval.check_vote_results import check_vote_results
+from src.actions.approval.initiate_content_vote import initiate_content_vote
+from src.actions.approval.publish_approved_content import publish_approved_content
+from src.actions.content_creation.check_approved_proposals import check_approved_proposals
+from src.actions.content_creation.generate_content_draft import generate_content_draft
+from src.actions.content_creation.notify_approval_agent import notify_approval_agent
+from src.actions.recommendation.analyze_user_behavior import analyze_user_behavior
+from src.actions.recommendation.calculate_engagement_metrics import calculate_engagement_metrics
+from src.actions.recommendation.distribute_rewards import distribute_rewards
+from src.actions.recommendation.generate_recommendations import generate_recommendations
+
+# KnowScroll pipeline: content creation -> approval -> recommendation.
+# Actions taking a payload are follow-ups queued by the previous step
+# (agent.queue_task); they never have work when picked by weight alone.
+
+register_action("check-approved-proposals", requires=("sonic",))(check_approved_proposals)
+register_action("generate-content-draft", requires=(LLM_PROVIDER,))(generate_content_draft)
+register_action("notify-approval-agent")(notify_approval_agent)
+
+register_action("check-pending-content")(check_pending_content)
+register_action("initiate-content-vote")(initiate_content_vote)
+register_action("check-vote-results")(check_vote_results)
+register_action("publish-approved-content")(publish_approved_content)
+
+register_action("analyze-user-behavior")(analyze_user_behavior)
+register_action("generate-recommendations")(generate_recommendations)
+register_action("calculate-engagement-metrics")(calculate_engagement_metrics)
+register_action("distribute-rewards", requires=("sonic",))(distribute_rewards)
+
+
+def _queued_only(agent):
+    return False
+
+
+for _action_name in ("generate-content-draft", "notify-approval-agent",
+                     "initiate-content-vote", "publish-approved-content"):
+    register_readiness(_action_name)(_queued_only)
+
+
+@register_readiness("check-pending-content")
+def pending_content_ready(agent):
+    host = getattr(agent, "host", None)
+    if host is not None and host.pending("content-drafts"):
+        return True
+    notifications_dir = "./data/notifications"
+    return os.path.isdir(notifications_dir) and any(
+        name.startswith("draft_") for name in os.listdir(notifications_dir)
+    )
+
+
+@register_readiness("check-vote-results")
+def vote_results_ready(agent):
+    return os.path.exists("./data/content_votes.db")
@@ -2,7 +2,6 @@ import json
 import sqlite3
 import os
 from datetime import datetime, timedelta
-from web3 import Web3
 import numpy as np
 
 # Connect to engagement metrics database
@@ -181,6 +180,7 @@ def distribute_rewards(agent_context, **kwargs):
     rewards_distributed = 0
     
     # Get Sonic network connection for actual reward distribution
+    from web3 import Web3
     sonic_rpc = agent_context.get_connection_config("sonic").get("rpc", "https://rpc.soniclabs.com")
     w3 = Web3(Web3.HTTPProvider(sonic_rpc))
     
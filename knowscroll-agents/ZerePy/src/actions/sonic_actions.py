@@ -10,7 +10,7 @@ logger = logging.getLogger("actions.sonic_actions")
 # or additional processing before/after calling the underlying connection methods.
 # Feel free to modify these handlers to add your own business logic!
 
-@register_action("get-token-by-ticker")
+@register_action("get-token-by-ticker", requires=("sonic",))
 def get_token_by_ticker(agent, **kwargs):
     """Get token address by ticker symbol
     """
@@ -29,7 +29,7 @@ def get_token_by_ticker(agent, **kwargs):
         logger.error(f"Failed to get token by ticker: {str(e)}")
         return None
 
-@register_action("get-sonic-balance")
+@register_action("get-sonic-balance", requires=("sonic",))
 def get_sonic_balance(agent, **kwargs):
     """Get $S or token balance.
     """
@@ -55,7 +55,7 @@ def get_sonic_balance(agent, **kwargs):
         logger.error(f"Failed to get balance: {str(e)}")
         return None
 
-@register_action("send-sonic")
+@register_action("send-sonic", requires=("sonic",))
 def send_sonic(agent, **kwargs):
     """Send $S tokens to an address.
     This is a passthrough to sonic_connection.transfer().
@@ -76,7 +76,7 @@ def send_sonic(agent, **kwargs):
         logger.error(f"Failed to send $S: {str(e)}")
         return None
 
-@register_action("send-sonic-token")
+@register_action("send-sonic-token", requires=("sonic",))
 def send_sonic_token(agent, **kwargs):
     """Send tokens on Sonic chain.
     This is a passthrough to sonic_connection.transfer().
@@ -99,7 +99,7 @@ def send_sonic_token(agent, **kwargs):
         logger.error(f"Failed to send tokens: {str(e)}")
         return None
 
-@register_action("swap-sonic")
+@register_action("swap-sonic", requires=("sonic",))
 def swap_sonic(agent, **kwargs):
     """Swap tokens on Sonic chain.
     This is a passthrough to sonic_connection.swap().
@@ -1,10 +1,23 @@
 import time,threading
-from src.action_handler import register_action
+from src.action_handler import register_action, register_readiness, LLM_PROVIDER
 from src.helpers import print_h_bar
 from src.prompts import POST_TWEET_PROMPT, REPLY_TWEET_PROMPT
 
 
-@register_action("post-tweet")
+def _has_timeline_tweets(agent):
+    return bool(agent.state.get("timeline_tweets"))
+
+
+register_readiness("reply-to-tweet")(_has_timeline_tweets)
+register_readiness("like-tweet")(_has_timeline_tweets)
+
+
+@register_readiness("post-tweet")
+def post_tweet_ready(agent):
+    return time.time() - agent.state.get("last_tweet_time", 0) >= getattr(agent, "tweet_interval", 0)
+
+
+@register_action("post-tweet", requires=("twitter", LLM_PROVIDER))
 def post_tweet(agent, **kwargs):
     current_time = time.time()
 
@@ -36,7 +49,7 @@ def post_tweet(agent, **kwargs):
         return False
 
 
-@register_action("reply-to-tweet")
+@register_action("reply-to-tweet", requires=("twitter", LLM_PROVIDER))
 def reply_to_tweet(agent, **kwargs):
     if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
         tweet = agent.state["timeline_tweets"].pop(0)
@@ -63,7 +76,7 @@ def reply_to_tweet(agent, **kwargs):
         agent.logger.info("\n👀 No tweets found to reply to...")
         return False
 
-@register_action("like-tweet")
+@register_action("like-tweet", requires=("twitter",))
 def like_tweet(agent, **kwargs):
     if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
         tweet = agent.state["timeline_tweets"].pop(0)
@@ -95,7 +108,7 @@ def like_tweet(agent, **kwargs):
         agent.logger.info("\n👀 No tweets found to like...")
     return False
 
-@register_action("respond-to-mentions")
+@register_action("respond-to-mentions", requires=("twitter",))
 def respond_to_mentions(agent,**kwargs): #REQUIRES TWITTER PREMIUM PLAN
 
     filter_str = f"@{agent.username} -is:retweet"
@@ -1,17 +1,21 @@
 import json
-import random
-import time
+import asyncio
 import logging
 import os
+from collections import deque
 from pathlib import Path
 from dotenv import load_dotenv
-from src.connection_manager import ConnectionManager
+from src.connection_manager import ConnectionManager, ConnectionPool
+from src.health import DEFAULT_HEALTH_TTL
+from src.rate_limit import get_rate_limiter
 from src.helpers import print_h_bar
-from src.action_handler import execute_action
-import src.actions.twitter_actions  
-import src.actions.echochamber_actions
-import src.actions.solana_actions
+from src.action_handler import execute_action, execute_action_async, load_action_modules, current_action
+from src.llm_cache import LLMResponseCache, cache_key, SAMPLING_PARAMS
+from src.scheduler import TaskScheduler
+from src.state_store import AgentStateStore, DEFAULT_STATE_PATH
+from src import tracing
 from datetime import datetime
+from typing import Any, Dict, Iterator
 
 REQUIRED_FIELDS = ["name", "bio", "traits", "examples", "loop_delay", "config", "tasks"]
 
@@ -20,7 +24,8 @@ logger = logging.getLogger("agent")
 class ZerePyAgent:
     def __init__(
             self,
-            agent_name: str
+            agent_name: str,
+            connection_pool: ConnectionPool = None
     ):
         try:
             agent_path = Path("agents") / f"{agent_name}.json"
@@ -36,7 +41,18 @@ class ZerePyAgent:
             self.examples = agent_dict["examples"]
             self.example_accounts = agent_dict["example_accounts"]
             self.loop_delay = agent_dict["loop_delay"]
-            self.connection_manager = ConnectionManager(agent_dict["config"])
+            load_action_modules(
+                (config["name"] for config in agent_dict["config"]),
+                (task["name"] for task in agent_dict.get("tasks", []))
+            )
+            self.connection_manager = ConnectionManager(
+                agent_dict["config"],
+                pool=connection_pool,
+                health_ttl=agent_dict.get("health_ttl", DEFAULT_HEALTH_TTL),
+                # Agents naming the same rate_limit_store share rate limits across processes
+                rate_limiter=get_rate_limiter(agent_dict.get("rate_limit_store")),
+                circuit_breaker=agent_dict.get("circuit_breaker")
+            )
             self.use_time_based_weights = agent_dict["use_time_based_weights"]
             self.time_based_multipliers = agent_dict["time_based_multipliers"]
 
@@ -59,13 +75,48 @@ class ZerePyAgent:
             # Cache for system prompt
             self._system_prompt = None
 
+            # Opt-in LLM response cache for the actions listed in its config
+            llm_cache_config = agent_dict.get("llm_cache")
+            self.llm_cache = LLMResponseCache.from_config(llm_cache_config) if llm_cache_config else None
+            self.llm_cache_actions = set(llm_cache_config.get("actions", [])) if llm_cache_config else set()
+
             # Extract loop tasks
             self.tasks = agent_dict.get("tasks", [])
             self.task_weights = [task.get("weight", 0) for task in self.tasks]
+            self.scheduler = TaskScheduler(self.tasks)
+            self._time_weights = (None, self.task_weights)
             self.logger = logging.getLogger("agent")
 
-            # Set up empty agent state
+            # Export tracing spans for this process if the agent asks for it
+            if agent_dict.get("trace_file"):
+                tracing.configure(agent_dict["trace_file"])
+
+            # Loop runtime settings
+            self.max_concurrent_actions = max(1, agent_dict.get("max_concurrent_actions", 1))
+            self.failure_delay = agent_dict.get("failure_delay", 60)
+            self.startup_delay = agent_dict.get("startup_delay", 0)
+            # Connect all connections concurrently before the first iteration
+            self.warm_up_connections = agent_dict.get("warm_up_connections", True)
+            self.connection_timeout = agent_dict.get("connection_timeout", 10)
+            self._event_loop = None
+            self._stop_event = None
+            self._stop_requested = False
+
+            # Restore agent state from the last snapshot, if snapshots are enabled
             self.state = {}
+            self.state_snapshot_interval = agent_dict.get("state_snapshot_interval", 30)
+            self.state_store = None
+            self._last_snapshot = 0.0
+            if self.state_snapshot_interval:
+                self.state_store = AgentStateStore(agent_dict.get("state_path", DEFAULT_STATE_PATH))
+                self.state = self.state_store.load(self.name)
+                if self.state:
+                    logger.info(f"Restored agent state: {', '.join(sorted(self.state))}")
+
+            # Follow-up tasks queued by actions, run ahead of weighted selection
+            self.task_queue = deque()
+            # AgentHost running this agent alongside others, if any
+            self.host = None
 
         except Exception as e:
             logger.error("Could not load ZerePy agent")
@@ -135,85 +186,247 @@ class ZerePyAgent:
         
         return weights
 
-    def prompt_llm(self, prompt: str, system_prompt: str = None) -> str:
-        """Generate text using the configured LLM provider"""
+    def _llm_cache_key(self, prompt: str, system_prompt: str) -> str:
+        connection = self.connection_manager.connections.get(self.model_provider)
+        config = getattr(connection, "config", None) or {}
+        params = {name: config[name] for name in SAMPLING_PARAMS if name in config}
+        return cache_key(self.model_provider, config.get("model"), system_prompt, prompt, params)
+
+    def prompt_llm(self, prompt: str, system_prompt: str = None, cache: bool = None) -> str:
+        """
+        Generate text using the configured LLM provider.
+
+        Args:
+            cache: Use the LLM response cache; by default only for the actions
+                listed in the agent's llm_cache config
+        """
         system_prompt = system_prompt or self._construct_system_prompt()
 
-        return self.connection_manager.perform_action(
+        if cache is None:
+            cache = current_action.get() in self.llm_cache_actions
+        key = None
+        if cache and self.llm_cache:
+            key = self._llm_cache_key(prompt, system_prompt)
+            response = self.llm_cache.get(key)
+            if response is not None:
+                logger.debug("LLM response served from cache")
+                return response
+
+        response = self.connection_manager.perform_action(
             connection_name=self.model_provider,
             action_name="generate-text",
             params=[prompt, system_prompt]
         )
+        if key and isinstance(response, str) and response:
+            self.llm_cache.put(key, response)
+        return response
+
+    def prompt_llm_stream(self, prompt: str, system_prompt: str = None, cache: bool = None) -> Iterator[str]:
+        """
+        Generate text with the configured LLM provider, yielding deltas as
+        they arrive.
+
+        Raises:
+            Exception: If the request fails or the stream breaks part way, so
+                callers can tell a failed generation from an empty one
+        """
+        system_prompt = system_prompt or self._construct_system_prompt()
+
+        if cache is None:
+            cache = current_action.get() in self.llm_cache_actions
+        key = None
+        if cache and self.llm_cache:
+            key = self._llm_cache_key(prompt, system_prompt)
+            response = self.llm_cache.get(key)
+            if response is not None:
+                yield response
+                return
+
+        stream = self.connection_manager.perform_action(
+            connection_name=self.model_provider,
+            action_name="generate-text-stream",
+            params=[prompt, system_prompt]
+        )
+        if stream is None:
+            # perform_action already logged why
+            raise Exception(f"Could not start streaming from {self.model_provider}")
+        chunks = []
+        for delta in stream:
+            chunks.append(delta)
+            yield delta
+        if key and chunks:
+            self.llm_cache.put(key, "".join(chunks))
 
     def perform_action(self, connection: str, action: str, **kwargs) -> None:
         return self.connection_manager.perform_action(connection, action, **kwargs)
+
+    def get_connection_config(self, name: str) -> Dict[str, Any]:
+        """Validated config of one of the agent's connections, or {} if it has none"""
+        connection = self.connection_manager.connections.get(name)
+        return connection.config if connection is not None else {}
     
-    def select_action(self, use_time_based_weights: bool = False) -> dict:
-        task_weights = [weight for weight in self.task_weights.copy()]
-        
+    def queue_task(self, task_name: str, data=None) -> None:
+        """Queue a follow-up task to run on the next loop iteration, with data as its argument"""
+        self.task_queue.append((task_name, data))
+
+    def select_actions(self, count: int = 1, use_time_based_weights: bool = False) -> list:
+        """Pick up to `count` distinct ready tasks, nearest deadline first (see TaskScheduler)"""
+        task_weights = None
         if use_time_based_weights:
+            # Weights only change with the hour, so adjust them once per hour
             current_hour = datetime.now().hour
-            task_weights = self._adjust_weights_for_time(current_hour, task_weights)
-        
-        return random.choices(self.tasks, weights=task_weights, k=1)[0]
-
-    def loop(self):
-        """Main agent loop for autonomous behavior"""
-        if not self.is_llm_set:
-            self._setup_llm_provider()
+            if self._time_weights[0] != current_hour:
+                self._time_weights = (current_hour, self._adjust_weights_for_time(current_hour, self.task_weights))
+            task_weights = self._time_weights[1]
+
+        return self.scheduler.select(self, count, weights=task_weights)
+
+    async def _read_input(self, state_key: str, connection_name: str, action_name: str, params) -> None:
+        self.state[state_key] = await asyncio.to_thread(
+            self.connection_manager.perform_action,
+            connection_name=connection_name,
+            action_name=action_name,
+            params=params
+        )
 
-        logger.info("\n🚀 Starting agent loop...")
-        logger.info("Press Ctrl+C at any time to stop the loop.")
-        print_h_bar()
+    async def _replenish_inputs(self) -> None:
+        """Refresh missing loop inputs, fetching independent sources concurrently"""
+        # TODO: Add more inputs to complexify agent behavior
+        reads = []
+        if not self.state.get("timeline_tweets"):
+            if any("tweet" in task["name"] for task in self.tasks):
+                logger.info("\n👀 READING TIMELINE")
+                reads.append(self._read_input("timeline_tweets", "twitter", "read-timeline", []))
+
+        if self.state.get("room_info") is None:
+            if any("echochambers" in task["name"] for task in self.tasks):
+                logger.info("\n👀 READING ECHOCHAMBERS ROOM INFO")
+                reads.append(self._read_input("room_info", "echochambers", "get-room-info", {}))
+
+        if reads:
+            await asyncio.gather(*reads)
+
+    async def _snapshot_state(self, force: bool = False) -> None:
+        """Persist changed state keys in a worker thread, at most once per snapshot interval"""
+        if not self.state_store:
+            return
+        now = asyncio.get_running_loop().time()
+        if not force and now - self._last_snapshot < self.state_snapshot_interval:
+            return
+        self._last_snapshot = now
+        encoded = self.state_store.encode(self.state)
+        try:
+            await asyncio.to_thread(self.state_store.save, self.name, encoded)
+        except Exception as e:
+            logger.error(f"Failed to snapshot agent state: {e}")
 
-        time.sleep(2)
-        logger.info("Starting loop in 5 seconds...")
-        for i in range(5, 0, -1):
-            logger.info(f"{i}...")
-            time.sleep(1)
+    async def _wait(self, seconds: float) -> bool:
+        """Cancellable sleep. Returns True if the agent was asked to stop."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        """Ask a running loop to stop. Safe to call from any thread."""
+        self._stop_requested = True
+        if self._event_loop and self._stop_event:
+            self._event_loop.call_soon_threadsafe(self._stop_event.set)
+
+    async def run_async(self):
+        """
+        Main agent loop for autonomous behavior, as a coroutine.
+
+        Each iteration refreshes inputs concurrently, then runs up to
+        max_concurrent_actions tasks at once. Blocking actions run in worker
+        threads, so network waits overlap instead of stalling the loop, and
+        all waits end immediately when stop() is called.
+        """
+        self._event_loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        if self._stop_requested:
+            self._stop_event.set()
 
         try:
-            while True:
-                success = False
+            if self.warm_up_connections:
+                await asyncio.to_thread(self.connection_manager.warm_up, self.connection_timeout)
+
+            if not self.is_llm_set:
+                await asyncio.to_thread(self._setup_llm_provider)
+
+            logger.info("\n🚀 Starting agent loop...")
+            logger.info("Press Ctrl+C at any time to stop the loop.")
+            print_h_bar()
+
+            if self.startup_delay and await self._wait(self.startup_delay):
+                return
+
+            while not self._stop_event.is_set():
+                delay = self.loop_delay
                 try:
-                    # REPLENISH INPUTS
-                    # TODO: Add more inputs to complexify agent behavior
-                    if "timeline_tweets" not in self.state or self.state["timeline_tweets"] is None or len(self.state["timeline_tweets"]) == 0:
-                        if any("tweet" in task["name"] for task in self.tasks):
-                            logger.info("\n👀 READING TIMELINE")
-                            self.state["timeline_tweets"] = self.connection_manager.perform_action(
-                                connection_name="twitter",
-                                action_name="read-timeline",
-                                params=[]
-                            )
-
-                    if "room_info" not in self.state or self.state["room_info"] is None:
-                        if any("echochambers" in task["name"] for task in self.tasks):
-                            logger.info("\n👀 READING ECHOCHAMBERS ROOM INFO")
-                            self.state["room_info"] = self.connection_manager.perform_action(
-                                connection_name="echochambers",
-                                action_name="get-room-info",
-                                params={}
-                            )
-
-                    # CHOOSE AN ACTION
-                    # TODO: Add agentic action selection
-                    
-                    action = self.select_action(use_time_based_weights=self.use_time_based_weights)
-                    action_name = action["name"]
-
-                    # PERFORM ACTION
-                    success = execute_action(self, action_name)
-
-                    logger.info(f"\n⏳ Waiting {self.loop_delay} seconds before next loop...")
-                    print_h_bar()
-                    time.sleep(self.loop_delay if success else 60)
+                    with tracing.span("agent.iteration", agent=self.name):
+                        await self._replenish_inputs()
+
+                        # CHOOSE ACTIONS
+                        # TODO: Add agentic action selection
+                        actions = self.select_actions(
+                            self.max_concurrent_actions,
+                            use_time_based_weights=self.use_time_based_weights
+                        )
+
+                        # Queued follow-ups take the free slots first
+                        calls = []
+                        while self.task_queue and len(calls) < self.max_concurrent_actions:
+                            task_name, data = self.task_queue.popleft()
+                            args = () if data is None else (data,)
+                            calls.append(({"name": task_name}, args))
+                        calls.extend((action, ()) for action in actions[:self.max_concurrent_actions - len(calls)])
+                        actions = [action for action, _ in calls]
+                        for action in actions:
+                            self.scheduler.mark_run(action["name"])
+
+                        # PERFORM ACTIONS
+                        results = await asyncio.gather(
+                            *(execute_action_async(self, action["name"], *args) for action, args in calls),
+                            return_exceptions=True
+                        )
+                        success = False
+                        for action, result in zip(actions, results):
+                            if isinstance(result, Exception):
+                                logger.error(f"\n❌ Action {action['name']} failed: {result}")
+                            elif result:
+                                success = True
+
+                        if not actions:
+                            # Nothing ready: wake when the next task's interval elapses
+                            next_ready = self.scheduler.seconds_until_next()
+                            delay = self.loop_delay if next_ready is None else min(self.loop_delay, next_ready)
+                            logger.info("\n💤 No tasks ready")
+                        else:
+                            delay = self.loop_delay if success else self.failure_delay
+                        logger.info(f"\n⏳ Waiting {delay} seconds before next loop...")
+                        print_h_bar()
 
                 except Exception as e:
                     logger.error(f"\n❌ Error in agent loop iteration: {e}")
                     logger.info(f"⏳ Waiting {self.loop_delay} seconds before retrying...")
-                    time.sleep(self.loop_delay)
 
+                await self._snapshot_state()
+                if await self._wait(delay):
+                    break
+
+            logger.info("\n🛑 Agent loop stopped.")
+        finally:
+            await self._snapshot_state(force=True)
+            self._event_loop = None
+            self._stop_event = None
+            self._stop_requested = False
+
+    def loop(self):
+        """Run the agent loop until stopped or interrupted with Ctrl+C"""
+        try:
+            asyncio.run(self.run_async())
         except KeyboardInterrupt:
             logger.info("\n🛑 Agent loop stopped by user.")
-            return
\ No newline at end of file
+            return
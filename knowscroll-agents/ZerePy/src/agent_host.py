@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, List
+from src.agent import ZerePyAgent
+from src.connection_manager import ConnectionPool
+
+logger = logging.getLogger("agent_host")
+
+
+class AgentHost:
+    """
+    Runs several agents in one process.
+
+    Connections with identical config are shared through a ConnectionPool, so
+    e.g. one Ollama client and one Sonic Web3 provider serve every agent. Each
+    agent keeps its own loop, task weights and state. Agents hand work to each
+    other through in-memory topics instead of files.
+    """
+
+    def __init__(self, agent_names: List[str]):
+        self.pool = ConnectionPool()
+        self.agents: Dict[str, ZerePyAgent] = {}
+        self._topics: Dict[str, deque] = defaultdict(deque)
+        self._topics_lock = threading.Lock()
+
+        for agent_name in agent_names:
+            agent = ZerePyAgent(agent_name, connection_pool=self.pool)
+            agent.host = self
+            self.agents[agent.name] = agent
+
+        logger.info(
+            f"Loaded {len(self.agents)} agents sharing {len(self.pool.stats())} connections"
+        )
+
+    def publish(self, topic: str, data: Any) -> None:
+        """Hand a message to whichever agent consumes topic"""
+        with self._topics_lock:
+            self._topics[topic].append(data)
+
+    def pending(self, topic: str) -> int:
+        """Number of messages waiting on topic, without taking them"""
+        with self._topics_lock:
+            return len(self._topics[topic])
+
+    def drain(self, topic: str) -> List[Any]:
+        """Take every pending message on topic"""
+        with self._topics_lock:
+            messages = list(self._topics[topic])
+            self._topics[topic].clear()
+        return messages
+
+    async def run_async(self) -> None:
+        """Run every agent loop concurrently until all of them stop"""
+        await asyncio.gather(*(agent.run_async() for agent in self.agents.values()))
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Agent host stopped by user.")
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Stop all agent loops. Safe to call from any thread."""
+        for agent in self.agents.values():
+            agent.stop()
+
+    def close(self) -> None:
+        """Release every agent's connections back to the pool"""
+        for agent in self.agents.values():
+            agent.connection_manager.close()
@@ -0,0 +1,129 @@
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a connection whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one connection.
+
+    Closed: calls go through; failure_threshold consecutive failures open it.
+    Open: calls fail fast for reset_timeout seconds.
+    Half-open: up to half_open_max_calls trial calls go through; a success
+    closes the circuit again, a failure re-opens it for another reset_timeout.
+
+    Config (per agent, or per connection under "circuit_breaker"):
+
+        "circuit_breaker": {"failure_threshold": 5, "reset_timeout": 60}
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    @classmethod
+    def from_config(cls, name: str, config: Optional[Dict[str, Any]]) -> "CircuitBreaker":
+        config = config or {}
+        return cls(
+            name,
+            failure_threshold=config.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+            reset_timeout=config.get("reset_timeout", DEFAULT_RESET_TIMEOUT),
+            half_open_max_calls=config.get("half_open_max_calls", 1)
+        )
+
+    def _current_state(self) -> str:
+        # Caller holds the lock. An open circuit turns half-open once its timeout passes.
+        if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def is_available(self) -> bool:
+        """Whether a call would be let through, without claiming a half-open trial"""
+        with self._lock:
+            state = self._current_state()
+            return state == CLOSED or (state == HALF_OPEN and self._trial_calls < self.half_open_max_calls)
+
+    def allow(self) -> bool:
+        """Claim permission for one call; False means fail fast"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back a half-open trial whose call ended without an outcome, e.g. an abandoned stream"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through (0 if not open)"""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_calls = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._current_state() == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self._failures} failures; "
+                        f"failing fast for {self.reset_timeout}s"
+                    )
+                self._state = OPEN
+                self._opened_at = self.clock()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            retry_after = self._opened_at + self.reset_timeout - self.clock() if state == OPEN else 0.0
+            return {"state": state, "failures": self._failures, "retry_after": round(max(0.0, retry_after), 1)}
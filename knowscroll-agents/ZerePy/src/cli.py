@@ -12,7 +12,10 @@ from prompt_toolkit.styles import Style
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import FileHistory
 from src.agent import ZerePyAgent
+from src.action_handler import current_action
 from src.helpers import print_h_bar
+from src.metrics import metrics
+from src import tracing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -190,6 +193,30 @@ class ZerePyCLI:
             )
         )
         
+        # Show metrics command
+        self._register_command(
+            Command(
+                name="show-metrics",
+                description="Shows call counts, errors and latency per action and connection.",
+                tips=["Rows are sorted by total time spent",
+                      "Use 'show-metrics reset' to clear the counters"],
+                handler=self.show_metrics,
+                aliases=['metrics']
+            )
+        )
+        
+        # Show traces command
+        self._register_command(
+            Command(
+                name="show-traces",
+                description="Shows a flame-style breakdown of the slowest agent loop iterations.",
+                tips=["Format: show-traces {count} {trace_file}",
+                      "Enable tracing with 'trace_file' in the agent JSON or ZEREPY_TRACE_FILE"],
+                handler=self.show_traces,
+                aliases=['traces']
+            )
+        )
+        
         ################## MISC ################## 
         # Exit command
         self._register_command(
@@ -514,6 +541,52 @@ class ZerePyCLI:
         else:
             logging.info("Please load an agent to see the list of supported actions")
 
+    def show_metrics(self, input_list: List[str]) -> None:
+        """Handle show metrics command"""
+        if len(input_list) > 1 and input_list[1] == "reset":
+            metrics.reset()
+            logger.info("Metrics reset.")
+            return
+
+        rows = metrics.summary()
+        if not rows:
+            logger.info("No metrics recorded yet. Run some actions first.")
+            return
+
+        def fmt(seconds):
+            if seconds is None:
+                return "-"
+            if seconds == float("inf"):
+                return "slowest"
+            return f"{seconds * 1000:.0f}ms"
+
+        logger.info(f"\n{'kind':<11} {'name':<40} {'calls':>6} {'errors':>6} {'total':>9} {'mean':>9} {'p50<=':>9} {'p95<=':>9}")
+        for row in rows:
+            name = "/".join(row["labels"].values())
+            logger.info(
+                f"{row['family']:<11} {name:<40} {row['count']:>6} {row['errors']:>6} "
+                f"{row['total_seconds']:>8.2f}s {fmt(row['mean_seconds']):>9} "
+                f"{fmt(row['p50_seconds']):>9} {fmt(row['p95_seconds']):>9}"
+            )
+        print_h_bar()
+
+    def show_traces(self, input_list: List[str]) -> None:
+        """Handle show traces command"""
+        top = int(input_list[1]) if len(input_list) > 1 and input_list[1].isdigit() else 3
+        path = input_list[2] if len(input_list) > 2 else tracing.trace_path()
+        if not path or not os.path.exists(path):
+            logger.info("No trace file found. Set 'trace_file' in the agent JSON or ZEREPY_TRACE_FILE.")
+            return
+
+        traces = tracing.slowest_traces(path, top)
+        if not traces:
+            logger.info(f"No agent loop iterations recorded in {path}")
+            return
+        for spans in traces:
+            logger.info(f"\ntrace {spans[0]['trace_id']}")
+            logger.info("\n".join(tracing.format_trace(spans)))
+        print_h_bar()
+
     def chat_session(self, input_list: List[str]) -> None:
         """Handle chat command"""
         if self.agent is None:
@@ -526,18 +599,30 @@ class ZerePyCLI:
         logger.info(f"\nStarting chat with {self.agent.name}")
         print_h_bar()
 
-        while True:
-            try:
-                user_input = self.session.prompt("\nYou: ").strip()
-                if user_input.lower() == 'exit':
+        # Chat prompts are cached when "chat" is listed in the agent's llm_cache actions
+        token = current_action.set("chat")
+        try:
+            while True:
+                try:
+                    user_input = self.session.prompt("\nYou: ").strip()
+                    if user_input.lower() == 'exit':
+                        break
+
+                    # Print the reply as it is generated
+                    print(f"\n{self.agent.name}: ", end="", flush=True)
+                    try:
+                        for delta in self.agent.prompt_llm_stream(user_input):
+                            print(delta, end="", flush=True)
+                        print()
+                    except Exception as e:
+                        print()
+                        logger.error(f"\nAn error occurred while generating a reply: {e}")
+                    print_h_bar()
+
+                except KeyboardInterrupt:
                     break
-                
-                response = self.agent.prompt_llm(user_input)
-                logger.info(f"\n{self.agent.name}: {response}")
-                print_h_bar()
-                
-            except KeyboardInterrupt:
-                break
+        finally:
+            current_action.reset(token)
 
     def exit(self, input_list: List[str]) -> None:
         """Exit the CLI gracefully"""
@@ -1,82 +1,168 @@
+import json
+import time
+import types
+import importlib
 import logging
-from typing import Any, List, Optional, Type, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Type, Dict
 from src.connections.base_connection import BaseConnection
-from src.connections.anthropic_connection import AnthropicConnection
-from src.connections.eternalai_connection import EternalAIConnection
-from src.connections.goat_connection import GoatConnection
-from src.connections.groq_connection import GroqConnection
-from src.connections.openai_connection import OpenAIConnection
-from src.connections.twitter_connection import TwitterConnection
-from src.connections.farcaster_connection import FarcasterConnection
-from src.connections.ollama_connection import OllamaConnection
-from src.connections.echochambers_connection import EchochambersConnection
-from src.connections.solana_connection import SolanaConnection
-from src.connections.hyperbolic_connection import HyperbolicConnection
-from src.connections.galadriel_connection import GaladrielConnection
-from src.connections.sonic_connection import SonicConnection
-from src.connections.discord_connection import DiscordConnection
-from src.connections.allora_connection import AlloraConnection
-from src.connections.xai_connection import XAIConnection
-from src.connections.ethereum_connection import EthereumConnection
-from src.connections.together_connection import TogetherAIConnection
-from src.connections.evm_connection import EVMConnection
-from src.connections.perplexity_connection import PerplexityConnection
-from src.connections.monad_connection import MonadConnection
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.health import HealthCache, DEFAULT_HEALTH_TTL
+from src.rate_limit import RateLimiter, get_rate_limiter
+from src.metrics import metrics
+from src.tracing import span
 
 logger = logging.getLogger("connection_manager")
 
+# Connection name -> (module, class). Modules are imported on first use, so an
+# agent only pays for the SDKs of the connections it configures.
+CONNECTION_MODULES = {
+    "twitter": ("src.connections.twitter_connection", "TwitterConnection"),
+    "anthropic": ("src.connections.anthropic_connection", "AnthropicConnection"),
+    "openai": ("src.connections.openai_connection", "OpenAIConnection"),
+    "farcaster": ("src.connections.farcaster_connection", "FarcasterConnection"),
+    "groq": ("src.connections.groq_connection", "GroqConnection"),
+    "eternalai": ("src.connections.eternalai_connection", "EternalAIConnection"),
+    "ollama": ("src.connections.ollama_connection", "OllamaConnection"),
+    "echochambers": ("src.connections.echochambers_connection", "EchochambersConnection"),
+    "goat": ("src.connections.goat_connection", "GoatConnection"),
+    "solana": ("src.connections.solana_connection", "SolanaConnection"),
+    "hyperbolic": ("src.connections.hyperbolic_connection", "HyperbolicConnection"),
+    "galadriel": ("src.connections.galadriel_connection", "GaladrielConnection"),
+    "sonic": ("src.connections.sonic_connection", "SonicConnection"),
+    "discord": ("src.connections.discord_connection", "DiscordConnection"),
+    "allora": ("src.connections.allora_connection", "AlloraConnection"),
+    "xai": ("src.connections.xai_connection", "XAIConnection"),
+    "ethereum": ("src.connections.ethereum_connection", "EthereumConnection"),
+    "together": ("src.connections.together_connection", "TogetherAIConnection"),
+    "evm": ("src.connections.evm_connection", "EVMConnection"),
+    "perplexity": ("src.connections.perplexity_connection", "PerplexityConnection"),
+    "monad": ("src.connections.monad_connection", "MonadConnection"),
+}
+
+
+class ActionError(Exception):
+    """An action request that cannot be run (unknown connection or action, missing parameters)"""
+
+
+class ConnectionPool:
+    """
+    Reference-counted connections shared between agents in one process.
+
+    Connections whose config is identical are created once and handed to every
+    ConnectionManager that asks for them; the last release drops the instance.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Any]] = {}
+
+    @staticmethod
+    def _key(config_dic: Dict[str, Any]) -> str:
+        return json.dumps(config_dic, sort_keys=True, default=str)
+
+    def acquire(self, config_dic: Dict[str, Any], factory: Callable[[Dict[str, Any]], BaseConnection]) -> BaseConnection:
+        """Return the shared connection for this config, creating it with factory on first use"""
+        key = self._key(config_dic)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [factory(config_dic), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, connection: BaseConnection) -> None:
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry[0] is connection:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        del self._entries[key]
+                    return
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Connection name and reference count for every live shared connection"""
+        with self._lock:
+            return [
+                {"name": json.loads(key)["name"], "refs": entry[1]}
+                for key, entry in self._entries.items()
+            ]
+
+
+class _TrackedStream:
+    """
+    Iterator over a streaming action's generator that reports how it ended
+    exactly once: SUCCESS when exhausted, FAILURE when it raised, CLOSED when
+    the consumer closed it early or dropped it, iterated or not.
+    """
+    SUCCESS = "success"
+    FAILURE = "failure"
+    CLOSED = "closed"
+
+    def __init__(self, stream, on_done: Callable[[str], None]):
+        self._stream = stream
+        self._on_done = on_done
+
+    def _finish(self, outcome: str) -> None:
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done(outcome)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._stream)
+        except StopIteration:
+            self._finish(self.SUCCESS)
+            raise
+        except Exception:
+            self._finish(self.FAILURE)
+            raise
+        except BaseException:
+            self._finish(self.CLOSED)
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._finish(self.CLOSED)
+
+    def __del__(self):
+        if self._on_done is not None:
+            self.close()
+
 
 class ConnectionManager:
-    def __init__(self, agent_config):
+    def __init__(self, agent_config, pool: Optional[ConnectionPool] = None,
+                 health_ttl: float = DEFAULT_HEALTH_TTL, rate_limiter: Optional[RateLimiter] = None,
+                 circuit_breaker: Optional[Dict[str, Any]] = None):
         self.connections: Dict[str, BaseConnection] = {}
+        self.pool = pool
+        self.health = HealthCache(health_ttl)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # Agent-wide breaker settings; a connection's own "circuit_breaker" config overrides them
+        self.circuit_breaker_config = circuit_breaker or {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
         for config in agent_config:
             self._register_connection(config)
 
+    def close(self) -> None:
+        """Give shared connections back to the pool"""
+        if self.pool:
+            for connection in self.connections.values():
+                self.pool.release(connection)
+        self.connections = {}
+
     @staticmethod
     def _class_name_to_type(class_name: str) -> Type[BaseConnection]:
-        if class_name == "twitter":
-            return TwitterConnection
-        elif class_name == "anthropic":
-            return AnthropicConnection
-        elif class_name == "openai":
-            return OpenAIConnection
-        elif class_name == "farcaster":
-            return FarcasterConnection
-        elif class_name == "groq":
-            return GroqConnection
-        elif class_name == "eternalai":
-            return EternalAIConnection
-        elif class_name == "ollama":
-            return OllamaConnection
-        elif class_name == "echochambers":
-            return EchochambersConnection
-        elif class_name == "goat":
-            return GoatConnection
-        elif class_name == "solana":
-            return SolanaConnection
-        elif class_name == "hyperbolic":
-            return HyperbolicConnection
-        elif class_name == "galadriel":
-            return GaladrielConnection
-        elif class_name == "sonic":
-            return SonicConnection
-        elif class_name == "discord":
-            return DiscordConnection
-        elif class_name == "allora":
-            return AlloraConnection
-        elif class_name == "xai":
-            return XAIConnection
-        elif class_name == "ethereum":
-            return EthereumConnection
-        elif class_name == "together":
-            return TogetherAIConnection
-        elif class_name == "evm":
-            return EVMConnection
-        elif class_name == "perplexity":
-            return PerplexityConnection
-        elif class_name == "monad":
-            return MonadConnection
-        return None
+        if class_name not in CONNECTION_MODULES:
+            return None
+        module_name, attribute = CONNECTION_MODULES[class_name]
+        return getattr(importlib.import_module(module_name), attribute)
 
     def _register_connection(self, config_dic: Dict[str, Any]) -> None:
         """
@@ -90,11 +176,63 @@ class ConnectionManager:
         try:
             name = config_dic["name"]
             connection_class = self._class_name_to_type(name)
-            connection = connection_class(config_dic)
+            if self.pool:
+                connection = self.pool.acquire(config_dic, connection_class)
+            else:
+                connection = connection_class(config_dic)
             self.connections[name] = connection
+            self.rate_limiter.configure(name, config_dic.get("rate_limits"))
+            # Lets the connection back off the buckets its agent actually uses
+            connection.rate_limiter = self.rate_limiter
+            self.breakers[name] = CircuitBreaker.from_config(
+                name, {**self.circuit_breaker_config, **config_dic.get("circuit_breaker", {})}
+            )
         except Exception as e:
             logging.error(f"Failed to initialize connection {name}: {e}")
 
+    def warm_up(self, timeout: float = 10.0) -> Dict[str, str]:
+        """
+        Initialize every connection concurrently, so startup costs the slowest
+        connection rather than the sum of all of them.
+
+        Args:
+            timeout: Seconds to wait for the connections; stragglers keep
+                initializing in the background and are reported as "timeout"
+
+        Returns:
+            Dict[str, str]: Connection name -> "ok", "timeout" or the error message
+        """
+        if not self.connections:
+            return {}
+        executor = ThreadPoolExecutor(max_workers=len(self.connections), thread_name_prefix="warm-up")
+        futures = {
+            name: executor.submit(connection.initialize)
+            for name, connection in self.connections.items()
+        }
+        wait(futures.values(), timeout=timeout)
+        executor.shutdown(wait=False)
+
+        results = {}
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = "timeout"
+                logging.warning(f"Connection {name} did not initialize within {timeout}s")
+            elif future.exception():
+                results[name] = str(future.exception())
+                logging.error(f"Failed to initialize connection {name}: {future.exception()}")
+            else:
+                results[name] = "ok"
+        return results
+
+    def is_available(self, connection_name: str) -> bool:
+        """Whether the connection's circuit would let a call through"""
+        breaker = self.breakers.get(connection_name)
+        return breaker is None or breaker.is_available()
+
+    def breaker_status(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state, consecutive failures and seconds until retry per connection"""
+        return {name: breaker.status() for name, breaker in self.breakers.items()}
+
     def _check_connection(self, connection_string: str) -> bool:
         try:
             connection = self.connections[connection_string]
@@ -113,6 +251,7 @@ class ConnectionManager:
         try:
             connection = self.connections[connection_name]
             success = connection.configure()
+            self.health.invalidate(connection_name)
 
             if success:
                 logging.info(
@@ -169,62 +308,206 @@ class ConnectionManager:
         except Exception as e:
             logging.error(f"\nAn error occurred: {e}")
 
-    def perform_action(
+    def _perform_action(
         self, connection_name: str, action_name: str, params: List[Any]
-    ) -> Optional[Any]:
-        """Perform an action on a specific connection with given parameters"""
-        try:
-            connection = self.connections[connection_name]
+    ) -> Any:
+        """Validate and run one action, raising ActionError for invalid requests"""
+        if connection_name not in self.connections:
+            raise ActionError(f"Unknown connection '{connection_name}'")
+        connection = self.connections[connection_name]
 
-            if not connection.is_configured():
-                logging.error(
-                    f"\nError: Connection '{connection_name}' is not configured"
-                )
-                return None
+        if action_name not in connection.actions:
+            raise ActionError(f"Unknown action '{action_name}' for connection '{connection_name}'")
 
-            if action_name not in connection.actions:
-                logging.error(
-                    f"\nError: Unknown action '{action_name}' for connection '{connection_name}'"
-                )
-                return None
+        action = connection.actions[action_name]
+
+        # Convert list of params to kwargs dictionary, handling both required and optional params
+        kwargs = {}
+        param_index = 0
 
-            action = connection.actions[action_name]
+        # Add provided parameters up to the number provided
+        for i, param in enumerate(action.parameters):
+            if param_index < len(params):
+                kwargs[param.name] = params[param_index]
+                param_index += 1
 
-            # Convert list of params to kwargs dictionary, handling both required and optional params
-            kwargs = {}
-            param_index = 0
+        # Validate all required parameters are present
+        missing_required = [
+            param.name
+            for param in action.parameters
+            if param.required and param.name not in kwargs
+        ]
 
-            # Add provided parameters up to the number provided
-            for i, param in enumerate(action.parameters):
-                if param_index < len(params):
-                    kwargs[param.name] = params[param_index]
-                    param_index += 1
+        if missing_required:
+            raise ActionError(f"Missing required parameters: {', '.join(missing_required)}")
 
-            # Validate all required parameters are present
-            missing_required = [
-                param.name
-                for param in action.parameters
-                if param.required and param.name not in kwargs
-            ]
+        # Fail fast while the connection is down, skipping the (slow) health probe too
+        breaker = self.breakers[connection_name]
+        if not breaker.is_available():
+            raise CircuitOpenError(
+                f"Circuit for '{connection_name}' is open; retrying in {breaker.retry_after():.0f}s"
+            )
 
-            if missing_required:
-                logging.error(
-                    f"\nError: Missing required parameters: {', '.join(missing_required)}"
-                )
-                return None
+        labels = (connection_name, action_name)
+        with span("connection", connection=connection_name, action=action_name) as record:
+            started = time.perf_counter()
+            try:
+                # Wait for capacity rather than spend a request on a 429
+                self.rate_limiter.acquire(connection_name, action_name)
+                if not breaker.allow():
+                    raise CircuitOpenError(f"Circuit for '{connection_name}' is open")
+                if not self.health.is_healthy(connection_name, connection):
+                    breaker.record_failure()
+                    raise ActionError(f"Connection '{connection_name}' is not configured")
+                try:
+                    result = connection.perform_action(action_name, kwargs)
+                except Exception:
+                    # Re-check the connection before its next use
+                    self.health.invalidate(connection_name)
+                    breaker.record_failure()
+                    raise
+            except BaseException:
+                metrics.observe("connection", labels, time.perf_counter() - started, error=True)
+                raise
+
+            if isinstance(result, types.GeneratorType):
+                # Streaming actions do their work as the caller iterates; the span
+                # covers the request, the outcome is recorded when the stream ends
+                if record is not None:
+                    record["attributes"]["stream"] = True
+                return _TrackedStream(result, lambda outcome: self._record_stream(
+                    outcome, connection_name, labels, breaker, started
+                ))
 
-            return connection.perform_action(action_name, kwargs)
+            breaker.record_success()
+            metrics.observe("connection", labels, time.perf_counter() - started)
+            return result
 
+    def _record_stream(self, outcome: str, connection_name: str, labels, breaker: CircuitBreaker,
+                       started: float) -> None:
+        """Record how a streaming action ended (see _TrackedStream)"""
+        if outcome == _TrackedStream.SUCCESS:
+            breaker.record_success()
+        elif outcome == _TrackedStream.FAILURE:
+            # Re-check the connection before its next use
+            self.health.invalidate(connection_name)
+            breaker.record_failure()
+        else:
+            # Stopped early: says nothing about the connection, but frees a half-open trial
+            breaker.release()
+        metrics.observe(
+            "connection", labels, time.perf_counter() - started, error=outcome == _TrackedStream.FAILURE
+        )
+
+    def perform_action(
+        self, connection_name: str, action_name: str, params: List[Any]
+    ) -> Optional[Any]:
+        """Perform an action on a specific connection with given parameters"""
+        try:
+            return self._perform_action(connection_name, action_name, params)
+        except ActionError as e:
+            logging.error(f"\nError: {e}")
+            return None
+        except CircuitOpenError as e:
+            logging.warning(f"\nSkipping {action_name}: {e}")
+            return None
         except Exception as e:
             logging.error(
                 f"\nAn error occurred while trying action {action_name} for {connection_name} connection: {e}"
             )
             return None
 
+    def perform_actions(
+        self,
+        actions: List[Dict[str, Any]],
+        max_concurrency: int = 8,
+        connection_limits: Optional[Dict[str, int]] = None,
+        default_connection_limit: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform several actions, running independent ones concurrently.
+
+        Args:
+            actions: Items with "connection", "action", optional "params",
+                optional "id" (defaults to the item's index) and optional
+                "depends_on" (ids that must succeed first)
+            max_concurrency: Maximum actions in flight overall
+            connection_limits: Maximum actions in flight per connection name
+            default_connection_limit: Limit for connections not in connection_limits
+
+        Returns:
+            List[Dict[str, Any]]: One result per item, in input order, each with
+            "id", "status" ("success" or "error"), and "result" or "error"
+        """
+        ids = [str(item.get("id", index)) for index, item in enumerate(actions)]
+        index_of = {item_id: index for index, item_id in enumerate(ids)}
+        results: List[Dict[str, Any]] = [None] * len(actions)
+        if len(index_of) != len(ids):
+            raise ActionError("Action ids must be unique")
+
+        def fail(index, error):
+            results[index] = {"id": ids[index], "status": "error", "error": error}
+
+        # Order items so every dependency is submitted before its dependents
+        order, state = [], {}
+
+        def visit(index):
+            if state.get(index) == "done":
+                return True
+            if state.get(index) in ("visiting", "failed"):
+                return False
+            state[index] = "visiting"
+            ok = True
+            for dep in actions[index].get("depends_on") or []:
+                if str(dep) not in index_of:
+                    fail(index, f"Unknown dependency '{dep}'")
+                    ok = False
+                elif not visit(index_of[str(dep)]):
+                    ok = False
+            state[index] = "done" if ok else "failed"
+            if ok:
+                order.append(index)
+            elif results[index] is None:
+                fail(index, "Dependency cycle or invalid dependency")
+            return ok
+
+        for index in range(len(actions)):
+            visit(index)
+
+        limits = connection_limits or {}
+        semaphores = {
+            name: threading.Semaphore(limits.get(name, default_connection_limit))
+            for name in {item.get("connection") for item in actions}
+        }
+        futures = {}
+
+        def run(index):
+            item = actions[index]
+            for dep in item.get("depends_on") or []:
+                dep_index = index_of[str(dep)]
+                futures[dep_index].result()
+                if results[dep_index]["status"] != "success":
+                    return fail(index, f"Dependency '{dep}' failed")
+            try:
+                with semaphores[item.get("connection")]:
+                    result = self._perform_action(item.get("connection"), item.get("action"), item.get("params") or [])
+                results[index] = {"id": ids[index], "status": "success", "result": result}
+            except Exception as e:
+                fail(index, str(e))
+
+        # Dependencies are submitted first, so a waiting item never blocks one it needs
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="batch") as executor:
+            for index in order:
+                futures[index] = executor.submit(run, index)
+
+        for index, result in enumerate(results):
+            result.update(connection=actions[index].get("connection"), action=actions[index].get("action"))
+        return results
+
     def get_model_providers(self) -> List[str]:
         """Get a list of all LLM provider connections"""
         return [
             name
             for name, conn in self.connections.items()
-            if conn.is_configured() and getattr(conn, "is_llm_provider", lambda: False)
+            if self.health.is_healthy(name, conn) and getattr(conn, "is_llm_provider", lambda: False)
         ]
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from dotenv import load_dotenv, set_key
 from anthropic import Anthropic, NotFoundError
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
@@ -53,6 +53,15 @@ class AnthropicConnection(BaseConnection):
                 ],
                 description="Generate text using Anthropic models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from Anthropic models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -159,6 +168,33 @@ class AnthropicConnection(BaseConnection):
         except Exception as e:
             raise AnthropicAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from Anthropic models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.messages.create(
+                model=model or self.config["model"],
+                max_tokens=1000,
+                temperature=0,
+                system=system_prompt,
+                messages=[{"role": "user", "content": [{"type": "text", "text": prompt}]}],
+                stream=True
+            )
+        except Exception as e:
+            raise AnthropicAPIError(f"Text generation failed: {e}")
+        return self._iter_text_deltas(stream)
+
+    @staticmethod
+    def _iter_text_deltas(stream) -> Iterator[str]:
+        try:
+            for event in stream:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
+        except Exception as e:
+            raise AnthropicAPIError(f"Text generation failed: {e}")
+        finally:
+            stream.close()
+
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
@@ -2,6 +2,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Callable
 from dataclasses import dataclass
+from src.tracing import traced
 
 @dataclass
 class ActionParameter:
@@ -29,6 +30,15 @@ class Action:
         return errors
 
 class BaseConnection(ABC):
+    # RateLimiter of the ConnectionManager using this connection, set on registration
+    rate_limiter = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Trace every connection's own perform_action
+        if "perform_action" in cls.__dict__:
+            cls.perform_action = traced("{cls}.perform_action")(cls.__dict__["perform_action"])
+
     def __init__(self, config):
         try:
             # Dictionary to store action name -> handler method mapping
@@ -84,6 +94,15 @@ class BaseConnection(ABC):
         """
         pass
 
+    def initialize(self) -> None:
+        """
+        Open network resources (RPC clients, sessions) ahead of first use.
+
+        Constructors must not make network calls; connections that need a
+        round-trip to be usable do it here, lazily, and override this method.
+        """
+        pass
+
     @abstractmethod
     def register_actions(self) -> None:
         """
@@ -4,8 +4,10 @@ from typing import Dict, Any, List
 from collections import deque
 
 import requests
+from src.helpers.http_client import get_session
 from dotenv import load_dotenv
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.rate_limit import get_rate_limiter
 
 logger = logging.getLogger("connections.echochambers_connection")
 
@@ -116,7 +118,7 @@ class EchochambersConnection(BaseConnection):
         """Get information about the current room by listing all rooms and finding ours"""
         try:
             url = f"{self.api_url}/api/rooms"
-            response = self._make_request("GET", url)
+            response = self._make_request("GET", url, action_name="get-room-info")
             room_info = next((room for room in response.get("rooms", []) if room["id"] == self.room), None)
             if not room_info:
                 raise EchochambersAPIError(f"Room '{self.room}' not found")
@@ -136,7 +138,7 @@ class EchochambersConnection(BaseConnection):
         """Get message history from the room"""
         try:
             url = f"{self.api_url}/api/rooms/{self.room}/history"
-            response = self._make_request("GET", url)
+            response = self._make_request("GET", url, action_name="get-room-history")
             messages = response.get('messages', [])
             return [
                 {
@@ -166,7 +168,7 @@ class EchochambersConnection(BaseConnection):
                     "model": self.sender_model
                 }
             }
-            response = self._make_request("POST", url, json=data)
+            response = self._make_request("POST", url, json=data, action_name="send-message")
             self.metrics['messages_sent'] += 1
             
             # Add to sent messages history
@@ -201,8 +203,13 @@ class EchochambersConnection(BaseConnection):
             self._handle_error("Failed to process room history", e)
             raise
 
-    def _make_request(self, method: str, url: str, **kwargs) -> Any:
-        """Make HTTP request with retries and error handling"""
+    def _make_request(self, method: str, url: str, action_name: str = "default", **kwargs) -> Any:
+        """
+        Make HTTP request with retries and error handling
+
+        Args:
+            action_name: Action the request belongs to, so a 429 holds back its rate limit bucket
+        """
         headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key
@@ -211,11 +218,14 @@ class EchochambersConnection(BaseConnection):
 
         for attempt in range(3):
             try:
-                response = requests.request(method, url, timeout=10, **kwargs)
+                response = get_session().request(method, url, timeout=10, **kwargs)
                 if response.status_code == 429:  # Rate limit
                     retry_after = int(response.headers.get('Retry-After', 60))
                     logger.warning(f"Rate limit hit, waiting {retry_after}s")
-                    time.sleep(retry_after)
+                    # Hold back every caller sharing this API key; the retry reuses
+                    # the token already taken for this request
+                    rate_limiter = self.rate_limiter or get_rate_limiter()
+                    time.sleep(rate_limiter.backoff("echochambers", retry_after, action_name))
                     continue
                 response.raise_for_status()
                 return response.json()
@@ -1,12 +1,13 @@
 import logging
 import os
 import json
-from typing import Dict, Any
-from dotenv import load_dotenv, set_key
+from typing import Dict, Any, Iterator
+from dotenv import set_key
 from openai import OpenAI
+from src.helpers.llm_client import ReusableClient, load_env
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 from web3 import Web3
-import requests
+from src.helpers.http_client import get_session
 
 logger = logging.getLogger("connections.eternalai_connection")
 IPFS = "ipfs://"
@@ -32,7 +33,7 @@ class EternalAIAPIError(EternalAIConnectionError):
 class EternalAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(lambda api_key, api_url: OpenAI(api_key=api_key, base_url=api_url))
 
     @property
     def is_llm_provider(self) -> bool:
@@ -63,6 +64,15 @@ class EternalAIConnection(BaseConnection):
                 ],
                 description="Generate text using EternalAI models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from EternalAI models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -78,14 +88,12 @@ class EternalAIConnection(BaseConnection):
         }
 
     def _get_client(self) -> OpenAI:
-        """Get or create EternalAI client"""
-        if not self._client:
-            api_key = os.getenv("EternalAI_API_KEY")
-            api_url = os.getenv("EternalAI_API_URL")
-            if not api_key or not api_url:
-                raise EternalAIConfigurationError("EternalAI credentials not found in environment")
-            self._client = OpenAI(api_key=api_key, base_url=api_url)
-        return self._client
+        """Get the shared EternalAI client, rebuilt if the credentials changed"""
+        api_key = os.getenv("EternalAI_API_KEY")
+        api_url = os.getenv("EternalAI_API_URL")
+        if not api_key or not api_url:
+            raise EternalAIConfigurationError("EternalAI credentials not found in environment")
+        return self._client.get(api_key, api_url)
 
     def configure(self) -> bool:
         """Sets up EternalAI API authentication"""
@@ -128,13 +136,13 @@ class EternalAIConnection(BaseConnection):
     def is_configured(self, verbose=False) -> bool:
         """Check if EternalAI API credentials are configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('EternalAI_API_KEY')
             api_url = os.getenv('EternalAI_API_URL')
             if not api_key or not api_url:
                 return False
 
-            client = OpenAI(api_key=api_key, base_url=api_url)
+            client = self._get_client()
             client.models.list()
             return True
 
@@ -147,12 +155,12 @@ class EternalAIConnection(BaseConnection):
     def get_on_chain_system_prompt_content(on_chain_data: str) -> str:
         if IPFS in on_chain_data:
             light_house = on_chain_data.replace(IPFS, LIGHTHOUSE_IPFS)
-            response = requests.get(light_house)
+            response = get_session().get(light_house)
             if response.status_code == 200:
                 return response.text
             else:
                 gcs = on_chain_data.replace(IPFS, GCS_ETERNAL_AI_BASE_URL)
-                response = requests.get(gcs)
+                response = get_session().get(gcs)
                 if response.status_code == 200:
                     return response.text
                 else:
@@ -163,48 +171,52 @@ class EternalAIConnection(BaseConnection):
             else:
                 raise Exception(f"invalid on-chain system prompt")
 
+    def _create_completion(self, prompt: str, system_prompt: str, model: str, chain_id: str, stream: bool):
+        """Resolve the model, chain and (on-chain) system prompt, then call the completions API"""
+        client = self._get_client()
+        model = model or self.config["model"]
+        logger.info(f"model {model}")
+
+        chain_id = chain_id or self.config["chain_id"]
+        if not chain_id or chain_id == "":
+            chain_id = "45762"
+        logger.info(f"chain_id {chain_id}")
+
+        agent_id = self.config["agent_id"] or None
+        contract_address = self.config["contract_address"] or None
+        rpc = self.config["rpc_url"] or None
+
+        if agent_id and contract_address and rpc:
+            logger.info(f"agent_id: {agent_id}, contract_address: {contract_address}")
+            # call on-chain system prompt
+            web3 = Web3(Web3.HTTPProvider(rpc))
+            logger.info(f"web3 connected to {rpc} {web3.is_connected()}")
+            contract = web3.eth.contract(address=contract_address, abi=AGENT_CONTRACT_ABI)
+            result = contract.functions.getAgentSystemPrompt(agent_id).call()
+            logger.info(f"on-chain system_prompt: {result}")
+            if len(result) > 0:
+                try:
+                    system_prompt = self.get_on_chain_system_prompt_content(result[0].decode("utf-8"))
+                    logging.info(f"new system_prompt: {system_prompt}")
+                except Exception as e:
+                    logger.error(f"get on-chain system_prompt fail {e}")
+
+        logger.info(f"call completions api stream {stream}")
+        return client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            extra_body={"chain_id": chain_id},
+            stream=stream,
+        )
+
     def generate_text(self, prompt: str, system_prompt: str, model: str = None, chain_id: str = None, **kwargs) -> str:
         """Generate text using EternalAI models"""
         try:
-            client = self._get_client()
-            model = model or self.config["model"]
-            logger.info(f"model {model}")
-
-            chain_id = chain_id or self.config["chain_id"]
-            if not chain_id or chain_id == "":
-                chain_id = "45762"
-            logger.info(f"chain_id {chain_id}")
-
-            agent_id = self.config["agent_id"] or None
-            contract_address = self.config["contract_address"] or None
-            rpc = self.config["rpc_url"] or None
-
-            if agent_id and contract_address and rpc:
-                logger.info(f"agent_id: {agent_id}, contract_address: {contract_address}")
-                # call on-chain system prompt
-                web3 = Web3(Web3.HTTPProvider(rpc))
-                logger.info(f"web3 connected to {rpc} {web3.is_connected()}")
-                contract = web3.eth.contract(address=contract_address, abi=AGENT_CONTRACT_ABI)
-                result = contract.functions.getAgentSystemPrompt(agent_id).call()
-                logger.info(f"on-chain system_prompt: {result}")
-                if len(result) > 0:
-                    try:
-                        system_prompt = self.get_on_chain_system_prompt_content(result[0].decode("utf-8"))
-                        logging.info(f"new system_prompt: {system_prompt}")
-                    except Exception as e:
-                        logger.error(f"get on-chain system_prompt fail {e}")
-
             stream = self.config["stream"]
-            logger.info(f"call completions api stream {stream}")
-            completion = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                extra_body={"chain_id": chain_id},
-                stream=stream,
-            )
+            completion = self._create_completion(prompt, system_prompt, model, chain_id, stream)
             if not stream:
                 if completion.choices is None:
                     raise EternalAIAPIError(f"Text generation failed: completion.choices is None")
@@ -217,27 +229,44 @@ class EternalAIConnection(BaseConnection):
                     f"end call completions api with content:\n\n {completion.choices[0].message.content} \n\n\n\n")
                 return completion.choices[0].message.content
             else:
-                content = ""
-                # logger.info(f"completion {str(completion)}")
-                for chunk in completion:
-                    if chunk.choices is not None:
-                        delta = chunk.choices[0].delta
-                        if delta is not None and delta.content is not None:
-                            content += delta.content
-                            # logger.info(f"content -> {delta.content}")
-                    else:
-                        try:
-                            if chunk.onchain_data is not None and chunk.onchain_data.infer_id is not None and chunk.onchain_data.infer_id != "":
-                                logger.info(f"response onchain data: {json.dumps(chunk.onchain_data, indent=4)}")
-                        except:
-                            logger.info(f"response onchain data object: {chunk.onchain_data}", )
-                        break
+                # Join once at the end; growing a string per chunk is quadratic on long outputs
+                content = "".join(self._iter_stream_deltas(completion))
                 logger.info(f"end call completions api with content:\n\n {content} \n\n\n\n")
                 return content
 
         except Exception as e:
             raise EternalAIAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, chain_id: str = None,
+                             **kwargs) -> Iterator[str]:
+        """Stream text deltas from EternalAI models as they are generated"""
+        try:
+            completion = self._create_completion(prompt, system_prompt, model, chain_id, stream=True)
+        except Exception as e:
+            raise EternalAIAPIError(f"Text generation failed: {e}")
+        return self._iter_stream_deltas(completion)
+
+    @staticmethod
+    def _iter_stream_deltas(completion) -> Iterator[str]:
+        """Yield content deltas until the chunk carrying the on-chain inference data"""
+        try:
+            for chunk in completion:
+                if chunk.choices is not None:
+                    delta = chunk.choices[0].delta
+                    if delta is not None and delta.content:
+                        yield delta.content
+                else:
+                    try:
+                        if chunk.onchain_data is not None and chunk.onchain_data.infer_id is not None and chunk.onchain_data.infer_id != "":
+                            logger.info(f"response onchain data: {json.dumps(chunk.onchain_data, indent=4)}")
+                    except:
+                        logger.info(f"response onchain data object: {chunk.onchain_data}", )
+                    break
+        except Exception as e:
+            raise EternalAIAPIError(f"Text generation failed: {e}")
+        finally:
+            completion.close()
+
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
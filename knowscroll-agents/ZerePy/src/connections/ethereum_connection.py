@@ -1,7 +1,8 @@
 import logging
+import threading
 import os
 import time
-import requests
+from src.helpers.http_client import get_session
 from typing import Dict, Any, Optional, Union
 from dotenv import load_dotenv, set_key
 from web3 import Web3
@@ -19,7 +20,9 @@ class EthereumConnectionError(Exception):
 class EthereumConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Ethereum connection...")
-        self._web3 = None
+        self._web3_client = None
+        self._web3_ready = False
+        self._web3_lock = threading.Lock()
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
         
         # Get network configuration
@@ -31,8 +34,8 @@ class EthereumConnection(BaseConnection):
         self.scanner_url = EVM_NETWORKS[self.network]["scanner_url"]
         self.chain_id = EVM_NETWORKS[self.network]["chain_id"]
         
+        # Connecting to the RPC endpoint is deferred to first use (see initialize)
         super().__init__(config)
-        self._initialize_web3()
         
         # Kyberswap aggregator API for best swap routes
         self.aggregator_api = f"https://aggregator-api.kyberswap.com/{self.network}/api/v1"
@@ -43,16 +46,16 @@ class EthereumConnection(BaseConnection):
 
     def _initialize_web3(self) -> None:
         """Initialize Web3 connection with retry logic"""
-        if not self._web3:
+        if not self._web3_client:
             for attempt in range(3):
                 try:
-                    self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-                    self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+                    self._web3_client = Web3(Web3.HTTPProvider(self.rpc_url))
+                    self._web3_client.middleware_onion.inject(geth_poa_middleware, layer=0)
                     
-                    if not self._web3.is_connected():
+                    if not self._web3_client.is_connected():
                         raise EthereumConnectionError("Failed to connect to Ethereum network")
                     
-                    chain_id = self._web3.eth.chain_id
+                    chain_id = self._web3_client.eth.chain_id
                     if chain_id != self.chain_id:
                         raise EthereumConnectionError(f"Connected to wrong chain. Expected {self.chain_id}, got {chain_id}")
                         
@@ -65,6 +68,25 @@ class EthereumConnection(BaseConnection):
                     logger.warning(f"Web3 initialization attempt {attempt + 1} failed: {str(e)}")
                     time.sleep(1)
 
+    def initialize(self) -> None:
+        """Connect to the RPC endpoint. Called on first use, or ahead of time by warm-up."""
+        with self._web3_lock:
+            if self._web3_ready:
+                return
+            try:
+                self._initialize_web3()
+            except Exception:
+                self._web3_client = None
+                raise
+            self._web3_ready = True
+
+    @property
+    def _web3(self):
+        """Web3 client, connected on first use"""
+        if not self._web3_ready:
+            self.initialize()
+        return self._web3_client
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -202,7 +224,7 @@ class EthereumConnection(BaseConnection):
     def _get_token_address(self, ticker: str) -> Optional[str]:
         """Helper function to get token address from DEXScreener"""
         try:
-            response = requests.get(
+            response = get_session().get(
                 f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
             )
             response.raise_for_status()
@@ -308,7 +330,7 @@ class EthereumConnection(BaseConnection):
             # Try to get ETH value using Kyberswap price API
             try:
                 kyber_url = f"{self.aggregator_api}/tokens/rates"
-                response = requests.get(kyber_url, params={
+                response = get_session().get(kyber_url, params={
                     "tokenIn": token_address, 
                     "tokenOut": self.NATIVE_TOKEN, 
                     "amount": str(raw_balance) 
@@ -441,7 +463,7 @@ class EthereumConnection(BaseConnection):
                 "gasInclude": "true"
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = get_session().get(url, headers=headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -479,7 +501,7 @@ class EthereumConnection(BaseConnection):
                 "source": "zerepy"
             }
             
-            response = requests.post(url, headers=headers, json=payload)
+            response = get_session().post(url, headers=headers, json=payload)
             response.raise_for_status()
             
             data = response.json()
@@ -1,7 +1,8 @@
 import logging
+import threading
 import os
 import time
-import requests
+from src.helpers.http_client import get_session
 from typing import Dict, Any, Optional, Union
 from dotenv import load_dotenv, set_key
 from web3 import Web3
@@ -24,7 +25,9 @@ class EVMConnection(BaseConnection):
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
 
             # Determine network from config (defaulting to 'ethereum')
-        self._web3 = None
+        self._web3_client = None
+        self._web3_ready = False
+        self._web3_lock = threading.Lock()
         self.network = config.get("network", "ethereum")
         if self.network not in EVM_NETWORKS:
             raise ValueError(
@@ -37,8 +40,8 @@ class EVMConnection(BaseConnection):
         self.scanner_url = network_config["scanner_url"]
         self.chain_id = network_config["chain_id"]
         
+        # Connecting to the RPC endpoint is deferred to first use (see initialize)
         super().__init__(config)
-        self._initialize_web3()
         
         # Kyberswap aggregator API for best swap routes
         self.aggregator_api = f"https://aggregator-api.kyberswap.com/{self.network}/api/v1"
@@ -49,16 +52,16 @@ class EVMConnection(BaseConnection):
 
     def _initialize_web3(self) -> None:
         """Initialize Web3 connection with retry logic"""
-        if not self._web3:
+        if not self._web3_client:
             for attempt in range(3):
                 try:
-                    self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-                    self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+                    self._web3_client = Web3(Web3.HTTPProvider(self.rpc_url))
+                    self._web3_client.middleware_onion.inject(geth_poa_middleware, layer=0)
                     
-                    if not self._web3.is_connected():
+                    if not self._web3_client.is_connected():
                         raise EthereumConnectionError("Failed to connect to Ethereum network")
                     
-                    chain_id = self._web3.eth.chain_id
+                    chain_id = self._web3_client.eth.chain_id
                     if chain_id != self.chain_id:
                         raise EthereumConnectionError(f"Connected to wrong chain. Expected {self.chain_id}, got {chain_id}")
                         
@@ -71,6 +74,25 @@ class EVMConnection(BaseConnection):
                     logger.warning(f"Web3 initialization attempt {attempt + 1} failed: {str(e)}")
                     time.sleep(1)
 
+    def initialize(self) -> None:
+        """Connect to the RPC endpoint. Called on first use, or ahead of time by warm-up."""
+        with self._web3_lock:
+            if self._web3_ready:
+                return
+            try:
+                self._initialize_web3()
+            except Exception:
+                self._web3_client = None
+                raise
+            self._web3_ready = True
+
+    @property
+    def _web3(self):
+        """Web3 client, connected on first use"""
+        if not self._web3_ready:
+            self.initialize()
+        return self._web3_client
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -205,7 +227,7 @@ class EVMConnection(BaseConnection):
     def _get_token_address(self, ticker: str) -> Optional[str]:
         """Helper function to get token address from DEXScreener"""
         try:
-            response = requests.get(f"https://api.dexscreener.com/latest/dex/search?q={ticker}")
+            response = get_session().get(f"https://api.dexscreener.com/latest/dex/search?q={ticker}")
             response.raise_for_status()
             data = response.json()
             if not data.get('pairs'):
@@ -367,7 +389,7 @@ class EVMConnection(BaseConnection):
                 "to": sender,
                 "gasInclude": "true"
             }
-            response = requests.get(url, headers=headers, params=params)
+            response = get_session().get(url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
             if data.get("code") != 0:
@@ -393,7 +415,7 @@ class EVMConnection(BaseConnection):
                 "deadline": int(time.time() + 1200),
                 "source": "zerepy"
             }
-            response = requests.post(url, headers=headers, json=payload)
+            response = get_session().post(url, headers=headers, json=payload)
             response.raise_for_status()
             data = response.json()
             if data.get("code") != 0:
@@ -1,10 +1,11 @@
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 
-import requests
-from dotenv import load_dotenv, set_key
+from src.helpers.http_client import get_session
+from dotenv import set_key
 from openai import OpenAI
+from src.helpers.llm_client import ReusableClient, load_env, iter_chat_deltas
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 
 logger = logging.getLogger("connections.galadriel_connection")
@@ -26,7 +27,7 @@ API_BASE_URL = "https://api.galadriel.com/v1/verified"
 class GaladrielConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(self._build_client)
 
     @property
     def is_llm_provider(self) -> bool:
@@ -58,20 +59,30 @@ class GaladrielConnection(BaseConnection):
                 ],
                 description="Generate text using Galadriel models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from Galadriel models as it is generated"
+            ),
         }
 
     def _get_client(self) -> OpenAI:
-        """Get or create Galadriel client"""
-        if not self._client:
-            api_key = os.getenv("GALADRIEL_API_KEY")
-            if not api_key:
-                raise GaladrielConfigurationError("Galadriel API key not found in environment")
-
-            headers = {}
-            if fine_tune_api_key := os.getenv("GALADRIEL_FINE_TUNE_API_KEY"):
-                headers["Fine-Tune-Authorization"] = f"Bearer {fine_tune_api_key}"
-            self._client = OpenAI(api_key=api_key, base_url=API_BASE_URL, default_headers=headers)
-        return self._client
+        """Get the shared Galadriel client, rebuilt if either API key changed"""
+        api_key = os.getenv("GALADRIEL_API_KEY")
+        if not api_key:
+            raise GaladrielConfigurationError("Galadriel API key not found in environment")
+        return self._client.get(api_key, os.getenv("GALADRIEL_FINE_TUNE_API_KEY"))
+
+    @staticmethod
+    def _build_client(api_key: str, fine_tune_api_key: str = None) -> OpenAI:
+        headers = {}
+        if fine_tune_api_key:
+            headers["Fine-Tune-Authorization"] = f"Bearer {fine_tune_api_key}"
+        return OpenAI(api_key=api_key, base_url=API_BASE_URL, default_headers=headers)
 
     def configure(self) -> bool:
         """Sets up Galadriel API authentication"""
@@ -115,7 +126,7 @@ class GaladrielConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if Galadriel API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('GALADRIEL_API_KEY')
             if not api_key:
                 return False
@@ -127,7 +138,7 @@ class GaladrielConnection(BaseConnection):
             return False
 
     def _is_api_key_valid(self, api_key):
-        response = requests.get(
+        response = get_session().get(
             f"{API_BASE_URL}/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}"
@@ -158,6 +169,22 @@ class GaladrielConnection(BaseConnection):
         except Exception as e:
             raise GaladrielAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from Galadriel models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=model or self.config["model"],
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                stream=True,
+            )
+        except Exception as e:
+            raise GaladrielAPIError(f"Text generation failed: {e}")
+        return iter_chat_deltas(stream, GaladrielAPIError)
+
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute an action with validation"""
         if action_name not in self.actions:
@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Dict, Any
-from dotenv import load_dotenv, set_key
+from typing import Dict, Any, Iterator
+from dotenv import set_key
 from openai import OpenAI
+from src.helpers.llm_client import ReusableClient, load_env, iter_chat_deltas
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 
 logger = logging.getLogger("connections.hyperbolic_connection")
@@ -22,7 +23,9 @@ class HyperbolicAPIError(HyperbolicConnectionError):
 class HyperbolicConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(
+            lambda api_key: OpenAI(api_key=api_key, base_url="https://api.hyperbolic.xyz/v1")
+        )
 
     @property
     def is_llm_provider(self) -> bool:
@@ -55,6 +58,16 @@ class HyperbolicConnection(BaseConnection):
                 ],
                 description="Generate text using Hyperbolic models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation"),
+                    ActionParameter("temperature", False, float, "A decimal number that determines the degree of randomness in the response.")
+                ],
+                description="Stream text from Hyperbolic models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -70,16 +83,11 @@ class HyperbolicConnection(BaseConnection):
         }
 
     def _get_client(self) -> OpenAI:
-        """Get or create Hyperbolic client"""
-        if not self._client:
-            api_key = os.getenv("HYPERBOLIC_API_KEY")
-            if not api_key:
-                raise HyperbolicConfigurationError("Hyperbolic API key not found in environment")
-            self._client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.hyperbolic.xyz/v1"
-            )
-        return self._client
+        """Get the shared Hyperbolic client, rebuilt if the API key changed"""
+        api_key = os.getenv("HYPERBOLIC_API_KEY")
+        if not api_key:
+            raise HyperbolicConfigurationError("Hyperbolic API key not found in environment")
+        return self._client.get(api_key)
 
     def configure(self) -> bool:
         """Sets up Hyperbolic API authentication"""
@@ -124,15 +132,12 @@ class HyperbolicConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if Hyperbolic API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('HYPERBOLIC_API_KEY')
             if not api_key:
                 return False
 
-            client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.hyperbolic.xyz/v1"
-            )
+            client = self._get_client()
             client.models.list()
             return True
             
@@ -163,6 +168,22 @@ class HyperbolicConnection(BaseConnection):
         except Exception as e:
             raise HyperbolicAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from Hyperbolic models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=model or self.config["model"],
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                stream=True,
+            )
+        except Exception as e:
+            raise HyperbolicAPIError(f"Text generation failed: {e}")
+        return iter_chat_deltas(stream, HyperbolicAPIError)
+
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
@@ -199,11 +220,8 @@ class HyperbolicConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        # Explicitly reload environment variables
-        load_dotenv()
-        
-        if not self.is_configured(verbose=True):
-            raise HyperbolicConfigurationError("Hyperbolic is not properly configured")
+        # Pick up keys added to .env; health is checked (and cached) by the connection manager
+        load_env()
 
         action = self.actions[action_name]
         errors = action.validate_params(kwargs)
@@ -1,7 +1,8 @@
 import logging
+import threading
 import os
 import time
-import requests
+from src.helpers.http_client import get_session
 from typing import Dict, Any, Optional, Union
 from dotenv import load_dotenv, set_key
 from web3 import Web3
@@ -25,7 +26,9 @@ class MonadConnectionError(Exception):
 class MonadConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Monad connection...")
-        self._web3 = None
+        self._web3_client = None
+        self._web3_ready = False
+        self._web3_lock = threading.Lock()
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
         
         # Get network configuration
@@ -36,8 +39,8 @@ class MonadConnection(BaseConnection):
         self.scanner_url = MONAD_SCANNER_URL
         self.chain_id = MONAD_CHAIN_ID
         
+        # Connecting to the RPC endpoint is deferred to first use (see initialize)
         super().__init__(config)
-        self._initialize_web3()
 
     def _get_explorer_link(self, tx_hash: str) -> str:
         """Generate block explorer link for transaction"""
@@ -45,16 +48,16 @@ class MonadConnection(BaseConnection):
 
     def _initialize_web3(self) -> None:
         """Initialize Web3 connection with retry logic"""
-        if not self._web3:
+        if not self._web3_client:
             for attempt in range(3):
                 try:
-                    self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-                    self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+                    self._web3_client = Web3(Web3.HTTPProvider(self.rpc_url))
+                    self._web3_client.middleware_onion.inject(geth_poa_middleware, layer=0)
                     
-                    if not self._web3.is_connected():
+                    if not self._web3_client.is_connected():
                         raise MonadConnectionError("Failed to connect to Monad network")
                     
-                    chain_id = self._web3.eth.chain_id
+                    chain_id = self._web3_client.eth.chain_id
                     if chain_id != self.chain_id:
                         raise MonadConnectionError(f"Connected to wrong chain. Expected {self.chain_id}, got {chain_id}")
                         
@@ -67,6 +70,25 @@ class MonadConnection(BaseConnection):
                     logger.warning(f"Web3 initialization attempt {attempt + 1} failed: {str(e)}")
                     time.sleep(1)
 
+    def initialize(self) -> None:
+        """Connect to the RPC endpoint. Called on first use, or ahead of time by warm-up."""
+        with self._web3_lock:
+            if self._web3_ready:
+                return
+            try:
+                self._initialize_web3()
+            except Exception:
+                self._web3_client = None
+                raise
+            self._web3_ready = True
+
+    @property
+    def _web3(self):
+        """Web3 client, connected on first use"""
+        if not self._web3_ready:
+            self.initialize()
+        return self._web3_client
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -346,7 +368,7 @@ class MonadConnection(BaseConnection):
             logger.debug(params)
             logger.debug("\nURL ")
             logger.debug(url)
-            response = requests.get(
+            response = get_session().get(
                 url,
                 headers=headers,
                 params=params
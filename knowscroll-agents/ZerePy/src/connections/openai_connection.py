@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Dict, Any
-from dotenv import load_dotenv, set_key
+from typing import Dict, Any, Iterator
+from dotenv import set_key
 from openai import OpenAI
+from src.helpers.llm_client import ReusableClient, load_env, iter_chat_deltas
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 
 logger = logging.getLogger("connections.openai_connection")
@@ -22,7 +23,7 @@ class OpenAIAPIError(OpenAIConnectionError):
 class OpenAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(lambda api_key: OpenAI(api_key=api_key))
 
     @property
     def is_llm_provider(self) -> bool:
@@ -54,6 +55,15 @@ class OpenAIConnection(BaseConnection):
                 ],
                 description="Generate text using OpenAI models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from OpenAI models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -69,13 +79,11 @@ class OpenAIConnection(BaseConnection):
         }
 
     def _get_client(self) -> OpenAI:
-        """Get or create OpenAI client"""
-        if not self._client:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise OpenAIConfigurationError("OpenAI API key not found in environment")
-            self._client = OpenAI(api_key=api_key)
-        return self._client
+        """Get the shared OpenAI client, rebuilt if the API key changed"""
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise OpenAIConfigurationError("OpenAI API key not found in environment")
+        return self._client.get(api_key)
 
     def configure(self) -> bool:
         """Sets up OpenAI API authentication"""
@@ -116,12 +124,12 @@ class OpenAIConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if OpenAI API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('OPENAI_API_KEY')
             if not api_key:
                 return False
 
-            client = OpenAI(api_key=api_key)
+            client = self._get_client()
             client.models.list()
             return True
             
@@ -152,6 +160,22 @@ class OpenAIConnection(BaseConnection):
         except Exception as e:
             raise OpenAIAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from OpenAI models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=model or self.config["model"],
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                stream=True,
+            )
+        except Exception as e:
+            raise OpenAIAPIError(f"Text generation failed: {e}")
+        return iter_chat_deltas(stream, OpenAIAPIError)
+
     def check_model(self, model, **kwargs):
         try:
             client = self._get_client()
@@ -1,8 +1,9 @@
 import logging
 import os
 from typing import Dict, Any
-from dotenv import load_dotenv, set_key
+from dotenv import set_key
 from openai import OpenAI
+from src.helpers.llm_client import ReusableClient, load_env
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 
 logger = logging.getLogger("connections.perplexity_connection")
@@ -26,7 +27,7 @@ class PerplexityConfigurationError(PerplexityConnectionError):
 class PerplexityConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(lambda api_key: OpenAI(api_key=api_key, base_url=self.base_url))
         self.base_url = "https://api.perplexity.ai"
 
     @property
@@ -47,16 +48,11 @@ class PerplexityConnection(BaseConnection):
         return config
 
     def _get_client(self) -> OpenAI:
-        """Get or create Perplexity client"""
-        if not self._client:
-            api_key = os.getenv("PERPLEXITY_API_KEY")
-            if not api_key:
-                raise PerplexityConfigurationError("Perplexity API key not found in environment")
-            self._client = OpenAI(
-                api_key=api_key,
-                base_url=self.base_url
-            )
-        return self._client
+        """Get the shared Perplexity client, rebuilt if the API key changed"""
+        api_key = os.getenv("PERPLEXITY_API_KEY")
+        if not api_key:
+            raise PerplexityConfigurationError("Perplexity API key not found in environment")
+        return self._client.get(api_key)
 
     def register_actions(self) -> None:
         """Register available Perplexity actions"""
@@ -108,7 +104,7 @@ class PerplexityConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if Perplexity API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('PERPLEXITY_API_KEY')
             if not api_key:
                 return False
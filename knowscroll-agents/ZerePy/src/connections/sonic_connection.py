@@ -1,6 +1,7 @@
 import logging
+import threading
 import os
-import requests
+from src.helpers.http_client import get_session
 import time
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv, set_key
@@ -21,7 +22,9 @@ class SonicConnection(BaseConnection):
     
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Sonic connection...")
-        self._web3 = None
+        self._web3_client = None
+        self._web3_ready = False
+        self._web3_lock = threading.Lock()
         
         # Get network configuration
         network = config.get("network", "mainnet")
@@ -32,8 +35,8 @@ class SonicConnection(BaseConnection):
         self.explorer = network_config["scanner_url"]
         self.rpc_url = network_config["rpc_url"]
         
+        # Connecting to the RPC endpoint is deferred to first use (see initialize)
         super().__init__(config)
-        self._initialize_web3()
         self.ERC20_ABI = ERC20_ABI
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
         self.aggregator_api = "https://aggregator-api.kyberswap.com/sonic/api/v1"
@@ -44,18 +47,37 @@ class SonicConnection(BaseConnection):
 
     def _initialize_web3(self):
         """Initialize Web3 connection"""
-        if not self._web3:
-            self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
-            if not self._web3.is_connected():
+        if not self._web3_client:
+            self._web3_client = Web3(Web3.HTTPProvider(self.rpc_url))
+            self._web3_client.middleware_onion.inject(geth_poa_middleware, layer=0)
+            if not self._web3_client.is_connected():
                 raise SonicConnectionError("Failed to connect to Sonic network")
             
             try:
-                chain_id = self._web3.eth.chain_id
+                chain_id = self._web3_client.eth.chain_id
                 logger.info(f"Connected to network with chain ID: {chain_id}")
             except Exception as e:
                 logger.warning(f"Could not get chain ID: {e}")
 
+    def initialize(self) -> None:
+        """Connect to the RPC endpoint. Called on first use, or ahead of time by warm-up."""
+        with self._web3_lock:
+            if self._web3_ready:
+                return
+            try:
+                self._initialize_web3()
+            except Exception:
+                self._web3_client = None
+                raise
+            self._web3_ready = True
+
+    @property
+    def _web3(self):
+        """Web3 client, connected on first use"""
+        if not self._web3_ready:
+            self.initialize()
+        return self._web3_client
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -78,7 +100,7 @@ class SonicConnection(BaseConnection):
             if ticker.lower() in ["s", "S"]:
                 return "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
                 
-            response = requests.get(
+            response = get_session().get(
                 f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
             )
             response.raise_for_status()
@@ -289,7 +311,7 @@ class SonicConnection(BaseConnection):
                 "gasInclude": "true"
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = get_session().get(url, headers=headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -320,7 +342,7 @@ class SonicConnection(BaseConnection):
                 "source": "ZerePyBot"
             }
             
-            response = requests.post(url, headers=headers, json=payload)
+            response = get_session().post(url, headers=headers, json=payload)
             response.raise_for_status()
             
             data = response.json()
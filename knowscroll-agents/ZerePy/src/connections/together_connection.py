@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Dict, Any
-from dotenv import load_dotenv, set_key
+from typing import Dict, Any, Iterator
+from dotenv import set_key
 from together import Together
+from src.helpers.llm_client import ReusableClient, load_env, iter_chat_deltas
 from together.types.models import ModelObject, ModelType
 
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
@@ -24,7 +25,7 @@ class TogetherAIAPIError(TogetherAIConnectionError):
 class TogetherAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(lambda api_key: Together(api_key=api_key))
 
     @property
     def is_llm_provider(self) -> bool:
@@ -55,6 +56,15 @@ class TogetherAIConnection(BaseConnection):
                 ],
                 description="Generate text using Together AI models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", True, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from Together AI models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -70,13 +80,11 @@ class TogetherAIConnection(BaseConnection):
         }
 
     def _get_client(self) -> Together:
-        """Get or create Together AI client"""
-        if not self._client:
-            api_key = os.getenv("TOGETHER_API_KEY")
-            if not api_key:
-                raise TogetherAIConfigurationError("Together API key not found in environment")
-            self._client = Together(api_key=api_key)
-        return self._client
+        """Get the shared Together AI client, rebuilt if the API key changed"""
+        api_key = os.getenv("TOGETHER_API_KEY")
+        if not api_key:
+            raise TogetherAIConfigurationError("Together API key not found in environment")
+        return self._client.get(api_key)
 
     def configure(self) -> bool:
         """Sets up Together AI API authentication"""
@@ -116,12 +124,12 @@ class TogetherAIConnection(BaseConnection):
     def is_configured(self, verbose=False) -> bool:
         """Check if Together AI API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('TOGETHER_API_KEY')
             if not api_key:
                 return False
 
-            client = Together(api_key=api_key)
+            client = self._get_client()
             client.models.list()
             return True
             
@@ -151,6 +159,22 @@ class TogetherAIConnection(BaseConnection):
         except Exception as e:
             raise TogetherAIAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from Together AI models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=model or self.config["model"],
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                stream=True,
+            )
+        except Exception as e:
+            raise TogetherAIAPIError(f"Text generation failed: {e}")
+        return iter_chat_deltas(stream, TogetherAIAPIError)
+
     def check_model(self, model: str, **kwargs) -> bool:
         try:
             client = self._get_client()
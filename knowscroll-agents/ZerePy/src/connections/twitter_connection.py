@@ -5,7 +5,8 @@ from requests_oauthlib import OAuth1Session
 from dotenv import set_key, load_dotenv
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 from src.helpers import print_h_bar
-import json,requests
+import json
+from src.helpers.http_client import get_session, configure_session
 
 logger = logging.getLogger("connections.twitter_connection")
 
@@ -153,7 +154,7 @@ class TwitterConnection(BaseConnection):
             full_url = f"https://api.twitter.com/2/{endpoint.lstrip('/')}"
 
             if use_bearer:
-                response = requests.request(
+                response = get_session().request(
                     method=method.lower(),
                     url=full_url,
                     auth=self._bearer_oauth,
@@ -188,13 +189,13 @@ class TwitterConnection(BaseConnection):
             logger.debug("Creating new OAuth session")
             try:
                 credentials = self._get_credentials()
-                self._oauth_session = OAuth1Session(
+                self._oauth_session = configure_session(OAuth1Session(
                     credentials['TWITTER_CONSUMER_KEY'],
                     client_secret=credentials['TWITTER_CONSUMER_SECRET'],
                     resource_owner_key=credentials['TWITTER_ACCESS_TOKEN'],
                     resource_owner_secret=credentials[
                         'TWITTER_ACCESS_TOKEN_SECRET'],
-                )
+                ))
                 logger.debug("OAuth session created successfully")
             except Exception as e:
                 logger.error(f"Failed to create OAuth session: {str(e)}")
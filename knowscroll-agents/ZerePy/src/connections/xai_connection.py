@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from openai import OpenAI
-from dotenv import set_key, load_dotenv
+from src.helpers.llm_client import ReusableClient, load_env, iter_chat_deltas
+from dotenv import set_key
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 
 logger = logging.getLogger("connections.XAI_connection")
@@ -22,7 +23,9 @@ class XAIAPIError(XAIConnectionError):
 class XAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._client = None
+        self._client = ReusableClient(
+            lambda api_key: OpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
+        )
 
     @property
     def is_llm_provider(self) -> bool:
@@ -53,6 +56,15 @@ class XAIConnection(BaseConnection):
                 ],
                 description="Generate text using XAI models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", False, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream text from XAI models as it is generated"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -68,16 +80,11 @@ class XAIConnection(BaseConnection):
         }
 
     def _get_client(self) -> OpenAI:
-        """Get or create XAI client using OpenAI's client with custom base URL"""
-        if not self._client:
-            api_key = os.getenv("XAI_API_KEY")
-            if not api_key:
-                raise XAIConfigurationError("XAI API key not found in environment")
-            self._client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.x.ai/v1",
-            )
-        return self._client
+        """Get the shared XAI client (OpenAI's client with a custom base URL), rebuilt if the API key changed"""
+        api_key = os.getenv("XAI_API_KEY")
+        if not api_key:
+            raise XAIConfigurationError("XAI API key not found in environment")
+        return self._client.get(api_key)
 
     def configure(self) -> bool:
         """Sets up XAI API authentication"""
@@ -117,7 +124,7 @@ class XAIConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if XAI API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('XAI_API_KEY')
             if not api_key:
                 return False
@@ -152,6 +159,22 @@ class XAIConnection(BaseConnection):
         except Exception as e:
             raise XAIAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str = None, model: str = None, **kwargs) -> Iterator[str]:
+        """Stream text deltas from XAI models as they are generated"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=model or self.config["model"],
+                messages=[
+                    {"role": "system", "content": system_prompt or ""},
+                    {"role": "user", "content": prompt},
+                ],
+                stream=True,
+            )
+        except Exception as e:
+            raise XAIAPIError(f"Text generation failed: {e}")
+        return iter_chat_deltas(stream, XAIAPIError)
+
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
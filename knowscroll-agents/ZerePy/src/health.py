@@ -0,0 +1,83 @@
+import time
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+from src.connections.base_connection import BaseConnection
+
+logger = logging.getLogger("health")
+
+DEFAULT_HEALTH_TTL = 300
+DEFAULT_NEGATIVE_TTL = 10
+
+
+class HealthCache:
+    """
+    Cached is_configured() results per connection.
+
+    Many is_configured() implementations make a network call (or even an LLM
+    call), so checking before every action doubles the round-trips. A healthy
+    result is trusted for ttl seconds; after that it is still returned while a
+    background thread re-checks. An unhealthy result is only trusted for
+    negative_ttl seconds and then re-checked synchronously, so a connection
+    that recovers is used again right away. invalidate() drops a result, e.g.
+    after a real call failed, so the next use checks again synchronously.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_HEALTH_TTL, negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        self.ttl = ttl
+        self.negative_ttl = min(negative_ttl, ttl)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[bool, float]] = {}
+        self._refreshing = set()
+
+    def _check(self, name: str, connection: BaseConnection, verbose: bool = False) -> bool:
+        try:
+            healthy = bool(connection.is_configured(verbose=verbose))
+        except Exception as e:
+            logger.debug(f"Health check for {name} raised: {e}")
+            healthy = False
+        with self._lock:
+            self._entries[name] = (healthy, time.monotonic())
+            self._refreshing.discard(name)
+        return healthy
+
+    def _refresh_in_background(self, name: str, connection: BaseConnection) -> None:
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+        threading.Thread(
+            target=self._check, args=(name, connection), name=f"health-{name}", daemon=True
+        ).start()
+
+    def is_healthy(self, name: str, connection: BaseConnection, verbose: bool = False) -> bool:
+        """Cached is_configured(); only the first check (or one after invalidate) blocks"""
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            return self._check(name, connection, verbose)
+
+        healthy, checked_at = entry
+        age = time.monotonic() - checked_at
+        if not healthy:
+            return self._check(name, connection, verbose) if age >= self.negative_ttl else False
+        if age >= self.ttl:
+            self._refresh_in_background(name, connection)
+        return healthy
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget the cached status of one connection, or of all of them"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def status(self) -> Dict[str, Dict[str, float]]:
+        """Cached status per connection with the age of each result in seconds"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {"healthy": healthy, "age": round(now - checked_at, 1)}
+                for name, (healthy, checked_at) in self._entries.items()
+            }
@@ -0,0 +1,77 @@
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds for callers that do not pass their own timeout
+DEFAULT_TIMEOUT = (5, 60)
+
+# Keep-alive pools: one per host, each holding up to POOL_MAXSIZE sockets
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 20
+
+# Retry connection errors and transient gateway errors on idempotent methods.
+# 429s are left to the caller and the rate limiter.
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+    raise_on_status=False,
+)
+
+
+class PooledSession(requests.Session):
+    """requests.Session with a default timeout"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+_adapter: Optional[HTTPAdapter] = None
+_session: Optional[PooledSession] = None
+_lock = threading.Lock()
+
+
+def _shared_adapter() -> HTTPAdapter:
+    global _adapter
+    if _adapter is None:
+        _adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY
+        )
+    return _adapter
+
+
+def configure_session(session: requests.Session) -> requests.Session:
+    """Mount the shared keep-alive pools and retry policy on another session (e.g. OAuth1Session)"""
+    with _lock:
+        adapter = _shared_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> PooledSession:
+    """
+    Return the process-wide HTTP session.
+
+    Every REST connection sends through it, so TCP and TLS connections are
+    reused across calls, connections and agents instead of being set up per
+    request.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = PooledSession()
+            adapter = _shared_adapter()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
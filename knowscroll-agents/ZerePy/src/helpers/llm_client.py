@@ -0,0 +1,76 @@
+import os
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Type
+from dotenv import load_dotenv, find_dotenv
+
+_env_lock = threading.Lock()
+_env_loaded: Tuple[Optional[str], Optional[float]] = (None, None)
+
+
+def load_env() -> None:
+    """
+    load_dotenv(), but only when the .env file is new or has changed since the
+    last load, so health checks and actions can call it on every use.
+    """
+    global _env_loaded
+    path = find_dotenv(usecwd=True)
+    try:
+        mtime = os.path.getmtime(path) if path else None
+    except OSError:
+        mtime = None
+    with _env_lock:
+        if (path, mtime) == _env_loaded:
+            return
+        load_dotenv(path or None)
+        _env_loaded = (path, mtime)
+
+
+class ReusableClient:
+    """
+    One SDK client per connection, created on first use and reused by every
+    call after that, so its HTTP connection pool stays warm. The client is
+    rebuilt only when the credentials it was built with change.
+
+        self._client = ReusableClient(lambda api_key: OpenAI(api_key=api_key))
+        client = self._client.get(os.getenv("OPENAI_API_KEY"))
+    """
+
+    def __init__(self, factory: Callable[..., Any]):
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._client = None
+        self._credentials: Optional[Tuple[Any, ...]] = None
+
+    def get(self, *credentials: Any) -> Any:
+        with self._lock:
+            # The old client is not closed: calls already holding it may still be in flight
+            if self._client is None or credentials != self._credentials:
+                self._client = self.factory(*credentials)
+                self._credentials = credentials
+            return self._client
+
+    def reset(self) -> None:
+        """Drop the client, e.g. after the connection was reconfigured"""
+        with self._lock:
+            self._client = None
+            self._credentials = None
+
+
+def iter_chat_deltas(stream: Iterable[Any], error_class: Type[Exception]) -> Iterator[str]:
+    """
+    Yield the text deltas of an OpenAI-style streamed chat completion, raising
+    error_class if the stream breaks. The stream is closed when the consumer
+    stops early, so its connection goes back to the pool.
+    """
+    try:
+        for chunk in stream:
+            if chunk.choices:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+    except Exception as e:
+        raise error_class(f"Text generation failed: {e}")
+    finally:
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
@@ -0,0 +1,207 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("llm_cache")
+
+DEFAULT_LLM_CACHE_PATH = "./data/llm_cache.db"
+DEFAULT_MEMORY_SIZE = 256
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL = 24 * 3600
+
+# Connection config keys that change what a model generates
+SAMPLING_PARAMS = ("temperature", "top_p", "top_k", "max_tokens", "seed", "stop")
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(provider: str, model: Optional[str], system_prompt: str, prompt: str,
+              params: Optional[Dict[str, Any]] = None) -> str:
+    """Key for one generation: provider, model, prompt hashes and sampling params"""
+    material = json.dumps(
+        [provider, model, _sha256(system_prompt or ""), _sha256(prompt), params or {}],
+        sort_keys=True, default=str
+    )
+    return _sha256(material)
+
+
+class MemoryLRU:
+    """Bounded in-process tier; entries carry their expiry time"""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, response: str, expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (response, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResponseStore:
+    """
+    Persistent tier shared by restarts and by agents pointing at the same file.
+    Expired rows are never returned; once the table holds more than
+    max_entries rows, expired and least recently used rows are deleted.
+    """
+
+    def __init__(self, path: str = DEFAULT_LLM_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS llm_responses_accessed ON llm_responses (accessed_at)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (response, expires_at) for a live entry"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, expires_at FROM llm_responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return tuple(row) if row else None
+
+    def put(self, key: str, response: str, expires_at: float) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, expires_at, now)
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            if count > self.max_entries:
+                conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN "
+                    "(SELECT key FROM llm_responses ORDER BY accessed_at LIMIT "
+                    "max(0, (SELECT COUNT(*) FROM llm_responses) - ?))",
+                    (self.max_entries,)
+                )
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of LLM responses: a bounded in-memory LRU in front of an
+    optional SQLite store. Enabled per agent with an "llm_cache" config:
+
+        "llm_cache": {
+            "actions": ["reply-to-tweet", "chat"],
+            "ttl": 86400,
+            "memory_size": 256,
+            "max_entries": 10000,
+            "path": "./data/llm_cache.db"
+        }
+
+    Only prompts made by the listed actions are cached (see
+    ZerePyAgent.prompt_llm). Set "path" to null to keep the cache in memory.
+    """
+
+    def __init__(self, memory_size: int = DEFAULT_MEMORY_SIZE, path: Optional[str] = DEFAULT_LLM_CACHE_PATH,
+                 ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.memory = MemoryLRU(memory_size)
+        self.store = SqliteResponseStore(path, max_entries) if path else None
+        self.hits = {"memory": 0, "sqlite": 0}
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMResponseCache":
+        return cls(
+            memory_size=config.get("memory_size", DEFAULT_MEMORY_SIZE),
+            path=config.get("path", DEFAULT_LLM_CACHE_PATH),
+            ttl=config.get("ttl", DEFAULT_TTL),
+            max_entries=config.get("max_entries", DEFAULT_MAX_ENTRIES)
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        response = self.memory.get(key)
+        if response is not None:
+            self.hits["memory"] += 1
+            return response
+        if self.store:
+            try:
+                entry = self.store.get(key)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                entry = None
+            if entry:
+                self.hits["sqlite"] += 1
+                self.memory.put(key, *entry)
+                return entry[0]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, response: str) -> None:
+        expires_at = time.time() + self.ttl
+        self.memory.put(key, response, expires_at)
+        if self.store:
+            try:
+                self.store.put(key, response, expires_at)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.store:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": dict(self.hits), "misses": self.misses, "memory_entries": len(self.memory)}
@@ -0,0 +1,133 @@
+import math
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; the last bucket catches everything slower
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+# Metric families: name -> (label names, help text)
+FAMILIES = {
+    "action": (("action",), "Agent action dispatch latency"),
+    "connection": (("connection", "action"), "Connection action call latency"),
+}
+
+
+class Histogram:
+    """Fixed-memory latency histogram with call and error counts"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        if error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket that contains it"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """Process-wide histograms keyed by metric family and label values"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Tuple[str, ...]], Histogram] = {}
+
+    def observe(self, family: str, labels: Tuple[str, ...], seconds: float, error: bool = False) -> None:
+        with self._lock:
+            histogram = self._histograms.get((family, labels))
+            if histogram is None:
+                histogram = self._histograms[(family, labels)] = Histogram()
+            histogram.observe(seconds, error)
+
+    @contextmanager
+    def timed(self, family: str, *labels: str):
+        """Time the block; an exception escaping it counts as an error"""
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(family, labels, time.perf_counter() - started, error)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One row per family and label set, slowest total time first"""
+        with self._lock:
+            items = list(self._histograms.items())
+        rows = []
+        for (family, labels), histogram in items:
+            rows.append({
+                "family": family,
+                "labels": dict(zip(FAMILIES[family][0], labels)),
+                "count": histogram.count,
+                "errors": histogram.errors,
+                "total_seconds": histogram.total,
+                "mean_seconds": histogram.total / histogram.count if histogram.count else 0.0,
+                "p50_seconds": histogram.quantile(0.5),
+                "p95_seconds": histogram.quantile(0.95),
+            })
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def render_prometheus(self) -> str:
+        """Render every histogram in the Prometheus text exposition format"""
+        with self._lock:
+            items = sorted(self._histograms.items())
+            snapshot = [(key, list(h.counts), h.count, h.errors, h.total, h.buckets) for key, h in items]
+
+        lines = []
+        for family, (label_names, help_text) in FAMILIES.items():
+            metric = f"zerepy_{family}_duration_seconds"
+            errors_metric = f"zerepy_{family}_errors_total"
+            rows = [row for row in snapshot if row[0][0] == family]
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for (_, labels), counts, count, _, total, buckets in rows:
+                label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(label_names, labels))
+                cumulative = 0
+                for bound, bucket_count in zip(buckets, counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f'{metric}_bucket{{{label_text},le="{le}"}} {cumulative}')
+                lines.append(f"{metric}_sum{{{label_text}}} {total}")
+                lines.append(f"{metric}_count{{{label_text}}} {count}")
+            lines.append(f"# HELP {errors_metric} Calls that raised, by {' and '.join(label_names)}")
+            lines.append(f"# TYPE {errors_metric} counter")
+            for (_, labels), _, _, errors, _, _ in rows:
+                label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(label_names, labels))
+                lines.append(f"{errors_metric}{{{label_text}}} {errors}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
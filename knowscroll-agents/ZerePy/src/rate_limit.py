@@ -0,0 +1,218 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("rate_limit")
+
+# Longest a caller waits for capacity before giving up
+DEFAULT_MAX_WAIT = 300
+
+
+class RateLimitExceeded(Exception):
+    """Raised when capacity does not free up within the caller's max wait"""
+
+
+class MemoryBucketStore:
+    """Token bucket state for this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def take(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds until they will be
+        """
+        with self._lock:
+            now = time.time()
+            available, updated = self._buckets.get(key, (capacity, now))
+            available = min(capacity, available + (now - updated) * rate)
+            if available >= tokens:
+                self._buckets[key] = (available - tokens, now)
+                return 0.0
+            self._buckets[key] = (available, now)
+            return (tokens - available) / rate
+
+    def drain(self, key: str, seconds: float, rate: float) -> None:
+        """Empty the bucket so no capacity is available for the next `seconds`"""
+        with self._lock:
+            self._buckets[key] = (-seconds * rate, time.time())
+
+
+class SqliteBucketStore:
+    """
+    Token bucket state shared by every process using the same SQLite file,
+    e.g. several agents posting with one API key.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode, so BEGIN IMMEDIATE below controls the transaction
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def _update(self, key: str, compute) -> Any:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens, result = compute(row, time.time())
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, time.time())
+            )
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def take(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        def compute(row, now):
+            available, updated = row if row else (capacity, now)
+            available = min(capacity, available + (now - updated) * rate)
+            if available >= tokens:
+                return available - tokens, 0.0
+            return available, (tokens - available) / rate
+        return self._update(key, compute)
+
+    def drain(self, key: str, seconds: float, rate: float) -> None:
+        self._update(key, lambda row, now: (-seconds * rate, None))
+
+
+class RateLimiter:
+    """
+    Token buckets per connection and action.
+
+    Limits come from a connection's "rate_limits" config, keyed by action name
+    with "default" applying to the connection's other actions:
+
+        "rate_limits": {
+            "default": {"rate": 1, "per": 1, "burst": 5},
+            "post-tweet": {"rate": 50, "per": 86400}
+        }
+
+    rate requests are allowed per `per` seconds, with bursts up to `burst`
+    (default: rate). Callers wait for capacity before sending. Agents sharing
+    a limiter share its buckets; when they configure the same bucket
+    differently, the stricter limit applies to all of them.
+    """
+
+    def __init__(self, store=None, max_wait: float = DEFAULT_MAX_WAIT):
+        self.store = store or MemoryBucketStore()
+        self.max_wait = max_wait
+        self._limits: Dict[str, Dict[str, Tuple[float, float]]] = {}
+
+    def configure(self, connection_name: str, rate_limits: Optional[Dict[str, Dict[str, float]]]) -> None:
+        """Set the limits for a connection from its config"""
+        if not rate_limits:
+            return
+        limits = self._limits.setdefault(connection_name, {})
+        for action_name, spec in rate_limits.items():
+            rate = float(spec["rate"]) / float(spec.get("per", 1))
+            limit = (rate, float(spec.get("burst", spec["rate"])))
+            current = limits.get(action_name)
+            if current is not None and current != limit:
+                limit = (min(current[0], limit[0]), min(current[1], limit[1]))
+                logger.warning(
+                    f"Conflicting rate limits for {connection_name}:{action_name}; using the stricter one"
+                )
+            limits[action_name] = limit
+
+    def _bucket(self, connection_name: str, action_name: str) -> Optional[Tuple[str, float, float]]:
+        limits = self._limits.get(connection_name)
+        if not limits:
+            return None
+        # "default" names the shared bucket, so it resolves like any action without its own limit
+        if action_name != "default" and action_name in limits:
+            return (f"{connection_name}:{action_name}", *limits[action_name])
+        if "default" in limits:
+            return (f"{connection_name}:*", *limits["default"])
+        return None
+
+    def acquire(self, connection_name: str, action_name: str = "default", max_wait: Optional[float] = None) -> float:
+        """
+        Block until the action may be sent.
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If capacity would not be available within max_wait
+        """
+        bucket = self._bucket(connection_name, action_name)
+        if bucket is None:
+            return 0.0
+        key, rate, capacity = bucket
+        max_wait = self.max_wait if max_wait is None else max_wait
+        waited = 0.0
+        while True:
+            wait = self.store.take(key, rate, capacity)
+            if wait <= 0:
+                if waited:
+                    logger.debug(f"Waited {waited:.1f}s for {key}")
+                return waited
+            if waited + wait > max_wait:
+                raise RateLimitExceeded(f"Rate limit for {key} needs {wait:.0f}s more")
+            time.sleep(wait)
+            waited += wait
+
+    def backoff(self, connection_name: str, seconds: float, action_name: str = "default") -> float:
+        """
+        Hold back every caller sharing the action's bucket for `seconds`, e.g.
+        after a 429 with Retry-After. The rate limited caller then retries
+        without another acquire(): its rejected request's token stands in for
+        the retry, and the next token refills one interval after it. Connections
+        without configured limits get a permissive bucket for this, so they are
+        unthrottled once it passes.
+
+        Returns:
+            float: Seconds the caller should wait before retrying
+        """
+        bucket = self._bucket(connection_name, action_name)
+        if bucket is None:
+            self._limits.setdefault(connection_name, {})["default"] = (1000.0, 1000.0)
+            bucket = self._bucket(connection_name, action_name)
+        key, rate, _ = bucket
+        self.store.drain(key, seconds, rate)
+        return seconds
+
+
+_rate_limiters: Dict[Optional[str], RateLimiter] = {}
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(shared_path: Optional[str] = None) -> RateLimiter:
+    """
+    Return the rate limiter for a bucket store, creating it on first use.
+
+    Args:
+        shared_path: SQLite file to share bucket state across processes;
+            None for the in-process limiter
+    """
+    with _rate_limiter_lock:
+        if shared_path not in _rate_limiters:
+            store = SqliteBucketStore(shared_path) if shared_path else MemoryBucketStore()
+            _rate_limiters[shared_path] = RateLimiter(store)
+        return _rate_limiters[shared_path]
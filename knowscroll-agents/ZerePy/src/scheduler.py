@@ -0,0 +1,123 @@
+import math
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.action_handler import readiness_registry, requirements_registry, LLM_PROVIDER
+
+logger = logging.getLogger("scheduler")
+
+
+@dataclass
+class ScheduledTask:
+    """
+    Scheduling state for one agent task.
+
+    Task config keys (all optional besides name):
+        weight: Tiebreaker between tasks with the same deadline; 0 disables the task
+        min_interval: Seconds that must pass between two runs of the task
+        max_staleness: Seconds after which the task is due; sets its deadline
+        requires: Connections the task needs, overriding the action's registered ones
+    """
+    name: str
+    weight: float = 0
+    min_interval: float = 0
+    max_staleness: Optional[float] = None
+    requires: Optional[Tuple[str, ...]] = None
+    last_run: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, task: Dict[str, Any]) -> "ScheduledTask":
+        return cls(
+            name=task["name"],
+            weight=task.get("weight", 0),
+            min_interval=task.get("min_interval", 0),
+            max_staleness=task.get("max_staleness"),
+            requires=tuple(task["requires"]) if "requires" in task else None
+        )
+
+    def next_eligible(self) -> float:
+        if self.last_run is None:
+            return 0.0
+        return self.last_run + self.min_interval
+
+    def next_due(self, started_at: float) -> float:
+        """When the task becomes overdue; tasks without max_staleness are never due"""
+        if self.max_staleness is None:
+            return math.inf
+        return (self.last_run if self.last_run is not None else started_at) + self.max_staleness
+
+
+class TaskScheduler:
+    """
+    Picks the next tasks for an agent loop.
+
+    A task is ready when its min_interval has passed, none of the connections
+    it requires has an open circuit, and its readiness probe (registered with
+    register_readiness) reports work to do. Ready tasks run in order of
+    nearest deadline (next_due), with weights only breaking ties; tasks
+    without max_staleness share the last place, highest weight first.
+    """
+
+    def __init__(self, tasks: List[Dict[str, Any]], clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.started_at = clock()
+        self.tasks = [ScheduledTask.from_config(task) for task in tasks]
+
+    @staticmethod
+    def _connections_available(agent, task: ScheduledTask) -> bool:
+        requires = task.requires if task.requires is not None else requirements_registry.get(task.name, ())
+        for name in requires:
+            if name == LLM_PROVIDER:
+                name = getattr(agent, "model_provider", None)
+                if name is None:
+                    continue
+            if not agent.connection_manager.is_available(name):
+                logger.debug(f"Skipping {task.name}: circuit for {name} is open")
+                return False
+        return True
+
+    def _is_ready(self, agent, task: ScheduledTask, now: float) -> bool:
+        if now < task.next_eligible():
+            return False
+        if not self._connections_available(agent, task):
+            return False
+        probe = readiness_registry.get(task.name)
+        if probe is None:
+            return True
+        try:
+            return bool(probe(agent))
+        except Exception as e:
+            logger.warning(f"Readiness probe for {task.name} failed: {e}")
+            return False
+
+    def select(self, agent, count: int = 1, weights: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """
+        Choose up to count distinct ready tasks.
+
+        Args:
+            weights: Per-task weights overriding the configured ones (e.g. time adjusted)
+        """
+        now = self.clock()
+        weights = weights or [task.weight for task in self.tasks]
+        ready = [
+            (task, weight) for task, weight in zip(self.tasks, weights)
+            if weight > 0 and self._is_ready(agent, task, now)
+        ]
+
+        # sorted() is stable, so equal deadlines and weights keep config order
+        ready.sort(key=lambda item: (item[0].next_due(self.started_at), -item[1]))
+        selected = [task for task, _ in ready[:count]]
+        return [{"name": task.name, "weight": task.weight} for task in selected]
+
+    def mark_run(self, task_name: str) -> None:
+        now = self.clock()
+        for task in self.tasks:
+            if task.name == task_name:
+                task.last_run = now
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the earliest task blocked by min_interval becomes eligible"""
+        now = self.clock()
+        waits = [task.next_eligible() - now for task in self.tasks if task.weight > 0 and task.next_eligible() > now]
+        return max(0.0, min(waits)) if waits else None
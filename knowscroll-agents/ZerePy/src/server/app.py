@@ -1,13 +1,17 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+import json
 import logging
 import asyncio
 import signal
 import threading
 from pathlib import Path
 from src.cli import ZerePyCLI
+from src.utils.render_jobs import get_render_service
+from src.metrics import metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("server/app")
@@ -18,38 +22,63 @@ class ActionRequest(BaseModel):
     action: str
     params: Optional[List[str]] = []
 
+class BatchActionItem(BaseModel):
+    """One action in a batch; depends_on lists ids that must succeed first"""
+    id: Optional[str] = None
+    connection: str
+    action: str
+    params: Optional[List[str]] = []
+    depends_on: Optional[List[str]] = []
+
+class BatchActionRequest(BaseModel):
+    """Request model for running several agent actions at once"""
+    actions: List[BatchActionItem]
+    max_concurrency: Optional[int] = 8
+    connection_limits: Optional[Dict[str, int]] = None
+
+class GenerateRequest(BaseModel):
+    """Request model for streaming text from the agent's LLM provider"""
+    prompt: str
+    system_prompt: Optional[str] = None
+
 class ConfigureRequest(BaseModel):
     """Request model for configuring connections"""
     connection: str
     params: Optional[Dict[str, Any]] = {}
 
+class RenderJobRequest(BaseModel):
+    """Request model for queueing a video render"""
+    title: str
+    script: str
+    visuals_desc: Optional[str] = None
+    priority: Optional[int] = 0
+    quality: Optional[str] = None
+    motion: Optional[str] = None
+    renditions: Optional[List[int]] = None
+    segment_duration: Optional[float] = None
+
+class AgentLoopStopping(Exception):
+    """Raised when starting the agent loop while the previous one is still stopping"""
+
 class ServerState:
     """Simple state management for the server"""
     def __init__(self):
         self.cli = ZerePyCLI()
+        self.render_service = get_render_service()
         self.agent_running = False
+        # Set while a stopped loop's thread is still finishing its actions
+        self.agent_stopping = False
         self.agent_task = None
-        self._stop_event = threading.Event()
 
     def _run_agent_loop(self):
-        """Run agent loop in a separate thread"""
+        """Run the agent's async loop on its own event loop in a separate thread"""
         try:
-            log_once = False
-            while not self._stop_event.is_set():
-                if self.cli.agent:
-                    try:
-                        if not log_once:
-                            logger.info("Loop logic not implemented")
-                            log_once = True
-
-                    except Exception as e:
-                        logger.error(f"Error in agent action: {e}")
-                        if self._stop_event.wait(timeout=30):
-                            break
+            asyncio.run(self.cli.agent.run_async())
         except Exception as e:
             logger.error(f"Error in agent loop thread: {e}")
         finally:
             self.agent_running = False
+            self.agent_stopping = False
             logger.info("Agent loop stopped")
 
     async def start_agent_loop(self):
@@ -57,21 +86,34 @@ class ServerState:
         if not self.cli.agent:
             raise ValueError("No agent loaded")
         
+        if self.agent_stopping:
+            raise AgentLoopStopping("Previous agent loop is still stopping")
         if self.agent_running:
             raise ValueError("Agent already running")
 
         self.agent_running = True
-        self._stop_event.clear()
         self.agent_task = threading.Thread(target=self._run_agent_loop)
         self.agent_task.start()
 
-    async def stop_agent_loop(self):
-        """Stop the agent loop"""
+    async def stop_agent_loop(self) -> bool:
+        """
+        Stop the agent loop, waiting up to 5s for its thread to exit.
+
+        Returns:
+            bool: False if the thread is still running (e.g. finishing an action);
+            agent_running stays set until it exits
+        """
         if self.agent_running:
-            self._stop_event.set()
+            # Set before joining: the thread clears it on exit, so it can't be left set
+            self.agent_stopping = True
+            self.cli.agent.stop()
             if self.agent_task:
-                self.agent_task.join(timeout=5)
+                await asyncio.to_thread(self.agent_task.join, 5)
+                if self.agent_task.is_alive():
+                    return False
             self.agent_running = False
+            self.agent_stopping = False
+        return True
 
 class ZerePyServer:
     def __init__(self):
@@ -89,6 +131,13 @@ class ZerePyServer:
                 "agent_running": self.state.agent_running
             }
 
+        @self.app.get("/metrics", response_class=PlainTextResponse)
+        async def get_metrics():
+            """Action and connection latency in Prometheus text format"""
+            return PlainTextResponse(
+                metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+            )
+
         @self.app.get("/agents")
         async def list_agents():
             """List available agents"""
@@ -123,10 +172,13 @@ class ZerePyServer:
             
             try:
                 connections = {}
-                for name, conn in self.state.cli.agent.connection_manager.connections.items():
+                manager = self.state.cli.agent.connection_manager
+                breakers = manager.breaker_status()
+                for name, conn in manager.connections.items():
                     connections[name] = {
-                        "configured": conn.is_configured(),
-                        "is_llm_provider": conn.is_llm_provider
+                        "configured": manager.health.is_healthy(name, conn),
+                        "is_llm_provider": conn.is_llm_provider,
+                        "circuit": breakers.get(name)
                     }
                 return {"connections": connections}
             except Exception as e:
@@ -149,15 +201,61 @@ class ZerePyServer:
             except Exception as e:
                 raise HTTPException(status_code=400, detail=str(e))
 
+        @self.app.post("/agent/actions")
+        async def agent_actions(batch_request: BatchActionRequest):
+            """Execute several agent actions, independent ones concurrently"""
+            if not self.state.cli.agent:
+                raise HTTPException(status_code=400, detail="No agent loaded")
+
+            actions = [item.model_dump(exclude_none=True) for item in batch_request.actions]
+            try:
+                results = await asyncio.to_thread(
+                    self.state.cli.agent.connection_manager.perform_actions,
+                    actions,
+                    max_concurrency=batch_request.max_concurrency or 8,
+                    connection_limits=batch_request.connection_limits
+                )
+                return {"status": "success", "results": results}
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        @self.app.post("/agent/generate/stream")
+        async def generate_stream(generate_request: GenerateRequest):
+            """Stream LLM output as server-sent events: a "data" event per delta, then a "done" event"""
+            agent = self.state.cli.agent
+            if not agent:
+                raise HTTPException(status_code=400, detail="No agent loaded")
+            if not agent.is_llm_set:
+                try:
+                    await asyncio.to_thread(agent._setup_llm_provider)
+                except Exception as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+
+            def events():
+                # Runs in Starlette's threadpool, as the provider stream is blocking
+                try:
+                    for delta in agent.prompt_llm_stream(generate_request.prompt, generate_request.system_prompt):
+                        yield f"data: {json.dumps({'delta': delta})}\n\n"
+                except Exception as e:
+                    yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+                yield "event: done\ndata: {}\n\n"
+
+            return StreamingResponse(
+                events(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
         @self.app.post("/agent/start")
         async def start_agent():
             """Start the agent loop"""
             if not self.state.cli.agent:
                 raise HTTPException(status_code=400, detail="No agent loaded")
-            
             try:
                 await self.state.start_agent_loop()
                 return {"status": "success", "message": "Agent loop started"}
+            except AgentLoopStopping as e:
+                raise HTTPException(status_code=409, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=400, detail=str(e))
 
@@ -165,7 +263,11 @@ class ZerePyServer:
         async def stop_agent():
             """Stop the agent loop"""
             try:
-                await self.state.stop_agent_loop()
+                if not await self.state.stop_agent_loop():
+                    return JSONResponse(
+                        status_code=202,
+                        content={"status": "stopping", "message": "Agent loop is finishing its current actions"}
+                    )
                 return {"status": "success", "message": "Agent loop stopped"}
             except Exception as e:
                 raise HTTPException(status_code=400, detail=str(e))
@@ -210,6 +312,54 @@ class ZerePyServer:
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.post("/render/jobs")
+        async def submit_render_job(render_request: RenderJobRequest):
+            """Queue a video render job"""
+            options = {
+                key: value for key, value in
+                {
+                    "quality": render_request.quality,
+                    "motion": render_request.motion,
+                    "renditions": render_request.renditions,
+                    "segment_duration": render_request.segment_duration
+                }.items()
+                if value is not None
+            }
+            try:
+                job = self.state.render_service.submit(
+                    render_request.title,
+                    render_request.script,
+                    visuals_desc=render_request.visuals_desc,
+                    priority=render_request.priority or 0,
+                    **options
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {"status": "success", "job": job.to_dict()}
+
+        @self.app.get("/render/jobs")
+        async def list_render_jobs(status: Optional[str] = None):
+            """List render jobs, optionally filtered by status"""
+            jobs = self.state.render_service.list_jobs(status=status)
+            return {"jobs": [job.to_dict() for job in jobs]}
+
+        @self.app.get("/render/jobs/{job_id}")
+        async def get_render_job(job_id: str):
+            """Get status and progress of a render job"""
+            job = self.state.render_service.get(job_id)
+            if not job:
+                raise HTTPException(status_code=404, detail=f"Render job {job_id} not found")
+            return {"job": job.to_dict()}
+
+        @self.app.post("/render/jobs/{job_id}/cancel")
+        async def cancel_render_job(job_id: str):
+            """Cancel a queued or running render job"""
+            if not self.state.render_service.get(job_id):
+                raise HTTPException(status_code=404, detail=f"Render job {job_id} not found")
+            if not self.state.render_service.cancel(job_id):
+                raise HTTPException(status_code=400, detail=f"Render job {job_id} already finished")
+            return {"status": "success", "message": f"Render job {job_id} cancelled"}
+
 def create_app():
     server = ZerePyServer()
     return server.app
\ No newline at end of file
@@ -1,5 +1,10 @@
+import json
 import requests
-from typing import Optional, List, Dict, Any
+from src.helpers.http_client import get_session
+from typing import Optional, List, Dict, Any, Iterator
+
+# Actions run LLM and chain calls server-side; only bound the connect phase
+ACTION_TIMEOUT = (5, None)
 
 class ZerePyClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -9,7 +14,7 @@ class ZerePyClient:
         """Make HTTP request with error handling"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         try:
-            response = requests.request(method, url, **kwargs)
+            response = get_session().request(method, url, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -39,7 +44,49 @@ class ZerePyClient:
             "action": action,
             "params": params or []
         }
-        return self._make_request("POST", "/agent/action", json=data)
+        return self._make_request("POST", "/agent/action", json=data, timeout=ACTION_TIMEOUT)
+
+    def perform_actions(self, actions: List[Dict[str, Any]], max_concurrency: int = 8,
+                        connection_limits: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute several agent actions in one request.
+
+        Args:
+            actions: Items with "connection", "action" and optional "params",
+                "id" and "depends_on" (ids that must succeed first)
+
+        Returns:
+            Per-action results in input order, each with "status" and "result" or "error"
+        """
+        data = {"actions": actions, "max_concurrency": max_concurrency}
+        if connection_limits:
+            data["connection_limits"] = connection_limits
+        return self._make_request("POST", "/agent/actions", json=data, timeout=ACTION_TIMEOUT)["results"]
+
+    def prompt_llm_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream text from the agent's LLM provider, yielding deltas as they arrive"""
+        url = f"{self.base_url}/agent/generate/stream"
+        data = {"prompt": prompt}
+        if system_prompt:
+            data["system_prompt"] = system_prompt
+        try:
+            with get_session().post(url, json=data, stream=True, timeout=(5, 300)) as response:
+                response.raise_for_status()
+                event = "message"
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("event:"):
+                        event = line[len("event:"):].strip()
+                    elif line.startswith("data:"):
+                        payload = json.loads(line[len("data:"):])
+                        if event == "error":
+                            raise Exception(f"Generation failed: {payload.get('error')}")
+                        if event == "done":
+                            return
+                        yield payload["delta"]
+                    elif not line:
+                        event = "message"
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Request failed: {str(e)}")
 
     def start_agent(self) -> Dict[str, Any]:
         """Start the agent loop"""
@@ -47,4 +94,35 @@ class ZerePyClient:
 
     def stop_agent(self) -> Dict[str, Any]:
         """Stop the agent loop"""
-        return self._make_request("POST", "/agent/stop")
\ No newline at end of file
+        return self._make_request("POST", "/agent/stop")
+
+    def submit_render_job(self, title: str, script: str, visuals_desc: Optional[str] = None,
+                          priority: int = 0, quality: Optional[str] = None,
+                          motion: Optional[str] = None,
+                          renditions: Optional[List[int]] = None,
+                          segment_duration: Optional[float] = None) -> Dict[str, Any]:
+        """Queue a video render job"""
+        data = {
+            "title": title,
+            "script": script,
+            "visuals_desc": visuals_desc,
+            "priority": priority,
+            "quality": quality,
+            "motion": motion,
+            "renditions": renditions,
+            "segment_duration": segment_duration
+        }
+        return self._make_request("POST", "/render/jobs", json=data).get("job", {})
+
+    def list_render_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List render jobs, optionally filtered by status"""
+        params = {"status": status} if status else None
+        return self._make_request("GET", "/render/jobs", params=params).get("jobs", [])
+
+    def get_render_job(self, job_id: str) -> Dict[str, Any]:
+        """Get status and progress of a render job"""
+        return self._make_request("GET", f"/render/jobs/{job_id}").get("job", {})
+
+    def cancel_render_job(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued or running render job"""
+        return self._make_request("POST", f"/render/jobs/{job_id}/cancel")
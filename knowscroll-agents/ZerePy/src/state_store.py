@@ -0,0 +1,122 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict
+
+logger = logging.getLogger("state_store")
+
+DEFAULT_STATE_PATH = "./data/agent_state.db"
+
+
+def _encode(value: Any) -> str:
+    """Compact JSON that keeps sets (e.g. echochambers_replied_messages) as sets"""
+    def default(obj):
+        if isinstance(obj, (set, frozenset)):
+            return {"__set__": sorted(obj, key=str)}
+        raise TypeError(f"Cannot snapshot value of type {type(obj).__name__}")
+    return json.dumps(value, separators=(",", ":"), default=default)
+
+
+def _decode(raw: str) -> Any:
+    def object_hook(obj):
+        if len(obj) == 1 and "__set__" in obj:
+            return set(obj["__set__"])
+        return obj
+    return json.loads(raw, object_hook=object_hook)
+
+
+class AgentStateStore:
+    """
+    SQLite snapshots of ZerePyAgent.state, one row per agent and state key.
+
+    save() is write-behind: it only writes keys whose encoded value changed
+    since the last snapshot, all in one transaction, so a crash leaves either
+    the previous snapshot or the new one.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._written: Dict[str, Dict[str, str]] = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS agent_state (
+                    agent TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (agent, key)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(self, agent_name: str) -> Dict[str, Any]:
+        """Restore the last snapshot for agent_name (empty if there is none)"""
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM agent_state WHERE agent = ?", (agent_name,)
+            ).fetchall()
+        state, written = {}, {}
+        for key, raw in rows:
+            try:
+                state[key] = _decode(raw)
+                written[key] = raw
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable state key {key} for {agent_name}: {e}")
+        self._written[agent_name] = written
+        return state
+
+    def encode(self, state: Dict[str, Any]) -> Dict[str, str]:
+        """Encode a state dict; cheap enough to run on the agent's loop thread"""
+        encoded = {}
+        for key, value in list(state.items()):
+            try:
+                encoded[key] = _encode(value)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not snapshotting state key {key}: {e}")
+        return encoded
+
+    def save(self, agent_name: str, encoded: Dict[str, str]) -> int:
+        """
+        Write the keys of an encoded snapshot that changed since the last save.
+
+        Returns:
+            int: Number of keys written or deleted
+        """
+        with self._lock:
+            written = self._written.setdefault(agent_name, {})
+            changed = {key: raw for key, raw in encoded.items() if written.get(key) != raw}
+            removed = [key for key in written if key not in encoded]
+            if not changed and not removed:
+                return 0
+
+            now = time.time()
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO agent_state (agent, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                    [(agent_name, key, raw, now) for key, raw in changed.items()]
+                )
+                conn.executemany(
+                    "DELETE FROM agent_state WHERE agent = ? AND key = ?",
+                    [(agent_name, key) for key in removed]
+                )
+            written.update(changed)
+            for key in removed:
+                del written[key]
+            return len(changed) + len(removed)
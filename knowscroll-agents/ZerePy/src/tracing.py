@@ -0,0 +1,233 @@
+"""
+Lightweight span tracing for the agent loop.
+
+Spans nest through a context variable, so a trace follows one loop iteration
+from the agent into actions, ConnectionManager.perform_action, each
+connection's perform_action and the HTTP requests they make (requests and
+web3's HTTP provider). asyncio.to_thread copies the context, so spans started
+in worker threads keep their parent.
+
+Tracing is off until configure() is given a path (or ZEREPY_TRACE_FILE is
+set); finished spans are then appended to that file as JSON lines.
+
+Usage:
+    python -m src.tracing view traces.jsonl --top 3
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import argparse
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TRACE_FILE = os.getenv("ZEREPY_TRACE_FILE")
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("zerepy_span", default=None)
+
+
+class JsonlExporter:
+    """Appends finished spans to a JSONL file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span: Dict[str, Any]) -> None:
+        line = json.dumps(span, separators=(",", ":"), default=str)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+
+_exporter: Optional[JsonlExporter] = None
+
+
+def configure(path: Optional[str]) -> None:
+    """Export spans to path, or turn tracing off when path is None"""
+    global _exporter
+    _exporter = JsonlExporter(path) if path else None
+    if _exporter:
+        _instrument_requests()
+
+
+def is_enabled() -> bool:
+    return _exporter is not None
+
+
+def trace_path() -> Optional[str]:
+    """File spans are exported to, falling back to ZEREPY_TRACE_FILE"""
+    return _exporter.path if _exporter else DEFAULT_TRACE_FILE
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Record the enclosed block as a span, child of the current one"""
+    if _exporter is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    record = {
+        "trace_id": parent["trace_id"] if parent else uuid.uuid4().hex,
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent["span_id"] if parent else None,
+        "name": name,
+        "attributes": attributes,
+        "start": time.time(),
+        "status": "ok",
+    }
+    token = _current_span.set(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record["duration"] = time.perf_counter() - started
+        _current_span.reset(token)
+        exporter = _exporter
+        if exporter:
+            try:
+                exporter.export(record)
+            except OSError:
+                pass
+
+
+def traced(name: str):
+    """Decorator form of span() for methods; the first positional argument after self is recorded as the action"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if _exporter is None:
+                return func(self, *args, **kwargs)
+            attributes = {"action": args[0]} if args and isinstance(args[0], str) else {}
+            with span(name.format(cls=type(self).__name__), **attributes):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_requests_instrumented = False
+
+
+def _instrument_requests() -> None:
+    """Wrap requests.Session.request so every HTTP call becomes a span"""
+    global _requests_instrumented
+    if _requests_instrumented:
+        return
+    try:
+        import requests
+    except ImportError:
+        return
+
+    original = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        if _exporter is None or _current_span.get() is None:
+            return original(self, method, url, *args, **kwargs)
+        with span("http", method=method, url=str(url).split("?")[0]) as record:
+            response = original(self, method, url, *args, **kwargs)
+            record["attributes"]["status_code"] = response.status_code
+            return response
+
+    requests.Session.request = request
+    _requests_instrumented = True
+
+
+if DEFAULT_TRACE_FILE:
+    configure(DEFAULT_TRACE_FILE)
+
+
+###################
+# Viewer
+###################
+def load_traces(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Group the spans of a JSONL trace file by trace id"""
+    traces = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                traces[record["trace_id"]].append(record)
+    return traces
+
+
+def format_trace(spans: List[Dict[str, Any]], width: int = 40) -> List[str]:
+    """Flame-style breakdown of one trace: indented tree with bars scaled to the root span"""
+    children = defaultdict(list)
+    span_ids = {record["span_id"] for record in spans}
+    roots = []
+    for record in sorted(spans, key=lambda r: r["start"]):
+        if record["parent_id"] in span_ids:
+            children[record["parent_id"]].append(record)
+        else:
+            roots.append(record)
+
+    total = max((root["duration"] for root in roots), default=0) or 1e-9
+    trace_start = min((root["start"] for root in roots), default=0)
+    lines = []
+
+    def walk(record, depth):
+        offset = int((record["start"] - trace_start) / total * width)
+        length = max(1, int(record["duration"] / total * width))
+        bar = " " * min(offset, width - 1) + "█" * min(length, width - min(offset, width - 1))
+        attributes = record.get("attributes") or {}
+        detail = attributes.get("action") or attributes.get("url") or ""
+        label = f"{'  ' * depth}{record['name']}" + (f" [{detail}]" if detail else "")
+        status = " ✗" if record.get("status") == "error" else ""
+        lines.append(f"{bar:<{width}} {record['duration'] * 1000:>9.1f}ms  {label}{status}")
+        for child in children[record["span_id"]]:
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    return lines
+
+
+def slowest_traces(path: str, top: int = 5, name: Optional[str] = "agent.iteration") -> List[List[Dict[str, Any]]]:
+    """The top slowest traces, ranked by their root span duration"""
+    ranked = []
+    for spans in load_traces(path).values():
+        roots = [record for record in spans if record["parent_id"] is None]
+        if name:
+            roots = [record for record in roots if record["name"] == name]
+        if roots:
+            ranked.append((max(root["duration"] for root in roots), spans))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [spans for _, spans in ranked[:top]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect ZerePy trace files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    view = subparsers.add_parser("view", help="Print the slowest traces as a flame-style tree")
+    view.add_argument("path", nargs="?", default=DEFAULT_TRACE_FILE or "./data/traces.jsonl")
+    view.add_argument("--top", type=int, default=5)
+    view.add_argument("--name", default="agent.iteration",
+                      help="Root span name to rank by; empty for all roots")
+    args = parser.parse_args(argv)
+
+    traces = slowest_traces(args.path, args.top, args.name or None)
+    if not traces:
+        print(f"No traces found in {args.path}")
+        return 1
+    for spans in traces:
+        print(f"trace {spans[0]['trace_id']}")
+        print("\n".join(format_trace(spans)))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Cold-start import benchmark.
+
+Runs each scenario in a fresh interpreter with `-X importtime` and reports the
+total import time and the heaviest top-level packages, so unused SDK imports on
+the CLI and server start paths show up.
+
+Usage:
+    python -m src.utils.import_benchmark
+    python -m src.utils.import_benchmark --agents approvalagent --runs 5 --output imports.json
+"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCENARIOS = {
+    "agent": "import src.agent",
+    "cli": "import src.cli",
+    "server": "import src.server.app",
+}
+
+# Imports the connection classes an agent configures, without constructing them
+AGENT_CONNECTIONS_CODE = (
+    "import json; from src.connection_manager import ConnectionManager; "
+    "[ConnectionManager._class_name_to_type(c['name']) "
+    "for c in json.load(open({path!r}))['config']]"
+)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse `-X importtime` output into (module, depth, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            })
+        except ValueError:
+            continue
+    return rows
+
+
+def measure(code: str, runs: int) -> Dict[str, Any]:
+    """Run code in fresh interpreters and keep the fastest run"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+            return {"error": error}
+        rows = parse_importtime(result.stderr)
+        total_us = sum(row["self_us"] for row in rows)
+        if best is None or total_us < best["total_us"]:
+            best = {"total_us": total_us, "modules": len(rows), "rows": rows}
+    return best
+
+
+def heaviest(rows: List[Dict[str, Any]], top: int) -> List[Dict[str, Any]]:
+    """Top-level packages (web3, solana, src, ...) ranked by the import time spent in them"""
+    packages = {}
+    for row in rows:
+        package = row["module"].split(".")[0]
+        packages[package] = packages.get(package, 0) + row["self_us"]
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [{"package": package, "self_us": self_us} for package, self_us in ranked]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ZerePy cold-start imports")
+    parser.add_argument("--agents", nargs="*", default=[],
+                        help="Also import the connections configured by these agents")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per scenario; the fastest is kept")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest packages to list per scenario")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    scenarios = dict(SCENARIOS)
+    for agent_name in args.agents:
+        path = str(Path("agents") / f"{agent_name}.json")
+        scenarios[f"connections:{agent_name}"] = AGENT_CONNECTIONS_CODE.format(path=path)
+
+    report = {}
+    for name, code in scenarios.items():
+        result = measure(code, args.runs)
+        if "error" in result:
+            print(f"{name:<28} failed: {result['error']}")
+            report[name] = result
+            continue
+        print(f"{name:<28} {result['total_us'] / 1000:>8.1f}ms  {result['modules']:>5} modules")
+        for row in heaviest(result["rows"], args.top):
+            print(f"    {row['self_us'] / 1000:>8.1f}ms  {row['package']}")
+        report[name] = {
+            "total_us": result["total_us"],
+            "modules": result["modules"],
+            "heaviest": heaviest(result["rows"], args.top),
+        }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Per-call overhead benchmark for OpenAI-compatible connections.
+
+Serves a minimal OpenAI-style API on localhost and times chat completions two
+ways: the old pattern (load_dotenv() and a new OpenAI client per call) and the
+current one (load_env() and the connection's ReusableClient). The local
+server answers instantly, so the difference is client setup, .env parsing
+and TCP connection setup. Runs offline.
+
+Usage:
+    python -m src.utils.llm_client_benchmark
+    python -m src.utils.llm_client_benchmark --calls 500 --output llm_clients.json
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from dotenv import load_dotenv
+from src.helpers.llm_client import ReusableClient, load_env
+
+COMPLETION = json.dumps({
+    "id": "bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "bench",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Without this, keep-alive responses stall on delayed ACKs and skew the comparison
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        _Handler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+def _complete(client):
+    return client.chat.completions.create(
+        model="bench", messages=[{"role": "user", "content": "ping"}]
+    ).choices[0].message.content
+
+
+def run_pattern(name, call, calls):
+    """Time `calls` calls of call(); returns per-call latency stats and new TCP connections"""
+    _Handler.connections = 0
+    call()  # warm-up, not counted
+    connections_before = _Handler.connections
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "pattern": name,
+        "calls": calls,
+        "mean_ms": statistics.mean(timings) * 1000,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "p95_ms": timings[int(len(timings) * 0.95) - 1] * 1000,
+        "tcp_connections": _Handler.connections - connections_before,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark per-call LLM client overhead")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per pattern")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        from openai import OpenAI
+    except ImportError:
+        print("The openai package is required for this benchmark")
+        return 1
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    def per_call_client():
+        load_dotenv()
+        return _complete(OpenAI(api_key="bench", base_url=base_url))
+
+    reusable = ReusableClient(lambda api_key: OpenAI(api_key=api_key, base_url=base_url))
+
+    def reused_client():
+        load_env()
+        return _complete(reusable.get("bench"))
+
+    results = [
+        run_pattern("client per call", per_call_client, args.calls),
+        run_pattern("reused client", reused_client, args.calls),
+    ]
+    server.shutdown()
+
+    print(f"{'pattern':<18} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'tcp conns':>10}")
+    for result in results:
+        print(
+            f"{result['pattern']:<18} {result['mean_ms']:>9.3f} {result['p50_ms']:>9.3f} "
+            f"{result['p95_ms']:>9.3f} {result['tcp_connections']:>10}"
+        )
+    before, after = results
+    print(f"Per-call overhead saved: {before['mean_ms'] - after['mean_ms']:.3f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
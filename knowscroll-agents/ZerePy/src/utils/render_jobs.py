@@ -0,0 +1,276 @@
+import os
+import uuid
+import queue
+import logging
+import time
+import itertools
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from src.utils.text_to_video import SimpleTextToVideo, QUALITY_FPS, MOTION_LEVELS, TRANSITIONS
+
+logger = logging.getLogger("utils.render_jobs")
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Finished jobs are dropped from the job table after this many seconds, or
+# oldest first once there are more than this many
+DEFAULT_FINISHED_TTL = 3600
+DEFAULT_MAX_FINISHED_JOBS = 500
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render when its job has been cancelled"""
+
+
+def validate_render_options(options: Dict[str, Any]) -> None:
+    """
+    Check render options against the renderer's presets, so a bad request
+    fails when it is submitted rather than inside a worker.
+
+    Raises:
+        ValueError: If an option is unknown or out of range
+    """
+    quality = options.get("quality")
+    if quality is not None and quality not in QUALITY_FPS:
+        raise ValueError(f"Unknown quality '{quality}', expected one of {list(QUALITY_FPS)}")
+    motion = options.get("motion")
+    if motion is not None and motion not in MOTION_LEVELS:
+        raise ValueError(f"Unknown motion '{motion}', expected one of {list(MOTION_LEVELS)}")
+    transition = options.get("transition")
+    if transition is not None and transition not in TRANSITIONS:
+        raise ValueError(f"Unknown transition '{transition}', expected one of {list(TRANSITIONS)}")
+    renditions = options.get("renditions")
+    if renditions is not None and (not renditions or any(height <= 0 for height in renditions)):
+        raise ValueError(f"Renditions must be positive heights, got {renditions}")
+    for name in ("segment_duration", "transition_duration"):
+        value = options.get(name)
+        if value is not None and value <= 0:
+            raise ValueError(f"{name} must be positive, got {value}")
+
+
+@dataclass
+class RenderJob:
+    """A single video render request and its progress"""
+    job_id: str
+    title: str
+    script: str
+    visuals_desc: Optional[str] = None
+    priority: int = 0
+    options: Dict[str, Any] = field(default_factory=dict)
+    status: str = QUEUED
+    frames_done: int = 0
+    frames_total: int = 0
+    video_path: Optional[str] = None
+    metadata_path: Optional[str] = None
+    # Master playlist, playable while the job runs when segment_duration is set
+    stream_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+    def __post_init__(self):
+        self._cancel_event = threading.Event()
+        self._finished_clock: Optional[float] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == COMPLETED:
+            return 1.0
+        return self.frames_done / self.frames_total if self.frames_total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["progress"] = round(self.progress, 4)
+        return data
+
+
+class RenderJobService:
+    """
+    Background render queue for SimpleTextToVideo.
+
+    Jobs are kept in an in-memory job table and picked up by a pool of worker
+    threads, highest priority first (FIFO within a priority). Each worker owns
+    its own renderer; the font and layout caches are shared process-wide.
+    Finished jobs stay listed for finished_ttl seconds, at most
+    max_finished_jobs of them.
+    """
+
+    def __init__(self, output_dir: str = "./output/videos", workers: Optional[int] = None,
+                 finished_ttl: float = DEFAULT_FINISHED_TTL, max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS):
+        self.output_dir = output_dir
+        self.workers = workers or max(1, (os.cpu_count() or 2) // 2)
+        self.finished_ttl = finished_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: Dict[str, RenderJob] = {}
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker pool if it is not already running"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker_loop, name=f"render-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"Render service started with {self.workers} workers")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers. Running jobs are cancelled, queued jobs stay queued."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+            running = [job for job in self.jobs.values() if job.status == RUNNING]
+        for job in running:
+            job._cancel_event.set()
+        # Stop markers sort ahead of every job, so each worker takes exactly one
+        for _ in threads:
+            self._queue.put((float("-inf"), next(self._sequence), None))
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def submit(self, title: str, script: str, visuals_desc: Optional[str] = None,
+               priority: int = 0, **options) -> RenderJob:
+        """
+        Queue a render of generate_content_video(title, script, visuals_desc, **options).
+
+        Args:
+            priority: Higher values are rendered first
+            options: Extra keyword arguments for generate_content_video (e.g. quality, motion).
+                output_id defaults to the job id, so jobs never share output files
+
+        Returns:
+            The queued RenderJob
+
+        Raises:
+            ValueError: If an option is invalid (see validate_render_options)
+        """
+        validate_render_options(options)
+        job_id = f"render_{uuid.uuid4().hex[:12]}"
+        options.setdefault("output_id", job_id)
+        job = RenderJob(
+            job_id=job_id,
+            title=title,
+            script=script,
+            visuals_desc=visuals_desc,
+            priority=priority,
+            options=options
+        )
+        if options.get("segment_duration"):
+            job.stream_path = SimpleTextToVideo.stream_playlist_path(self.output_dir, title, options["output_id"])
+        with self._lock:
+            self.jobs[job.job_id] = job
+        self._queue.put((-priority, next(self._sequence), job.job_id))
+        self.start()
+        return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        return self.jobs.get(job_id)
+
+    def list_jobs(self, status: Optional[str] = None) -> List[RenderJob]:
+        with self._lock:
+            self._prune()
+            jobs = list(self.jobs.values())
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        return jobs
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            bool: True if the job was cancelled, False if it is unknown or already finished
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return False
+            job._cancel_event.set()
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+        return True
+
+    def _finish(self, job: RenderJob, status: str, error: Optional[str] = None) -> None:
+        # Caller holds the lock
+        job.status = status
+        job.error = error
+        job.finished_at = datetime.now().isoformat()
+        job._finished_clock = time.monotonic()
+        self._prune()
+
+    def _prune(self) -> None:
+        """Drop finished jobs past finished_ttl, and the oldest beyond max_finished_jobs"""
+        now = time.monotonic()
+        finished = sorted(
+            (job for job in self.jobs.values() if job._finished_clock is not None),
+            key=lambda job: job._finished_clock
+        )
+        excess = len(finished) - self.max_finished_jobs
+        for index, job in enumerate(finished):
+            if index < excess or now - job._finished_clock >= self.finished_ttl:
+                del self.jobs[job.job_id]
+
+    def _worker_loop(self) -> None:
+        renderer = SimpleTextToVideo(output_dir=self.output_dir)
+        while True:
+            _, _, job_id = self._queue.get()
+            if job_id is None:
+                break
+
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.status != QUEUED:
+                    continue
+                job.status = RUNNING
+                job.started_at = datetime.now().isoformat()
+
+            def on_progress(frames_done, frames_total, job=job):
+                if job._cancel_event.is_set():
+                    raise RenderCancelled(job.job_id)
+                job.frames_done = frames_done
+                job.frames_total = frames_total
+
+            try:
+                job.video_path, job.metadata_path = renderer.generate_content_video(
+                    job.title, job.script, job.visuals_desc,
+                    progress_callback=on_progress, **job.options
+                )
+                with self._lock:
+                    self._finish(job, COMPLETED)
+                logger.info(f"Render job {job.job_id} completed: {job.video_path}")
+            except RenderCancelled:
+                with self._lock:
+                    self._finish(job, CANCELLED)
+                logger.info(f"Render job {job.job_id} cancelled")
+            except Exception as e:
+                with self._lock:
+                    self._finish(job, FAILED, str(e))
+                logger.error(f"Render job {job.job_id} failed: {e}")
+
+
+_render_service: Optional[RenderJobService] = None
+_render_service_lock = threading.Lock()
+
+
+def get_render_service() -> RenderJobService:
+    """Return the process-wide render service, creating it on first use"""
+    global _render_service
+    with _render_service_lock:
+        if _render_service is None:
+            _render_service = RenderJobService()
+        return _render_service
@@ -1,13 +1,313 @@
 import os
 import json
+import math
+import queue
+import shutil
 import subprocess
-import tempfile
+import threading
+import time
 from PIL import Image, ImageDraw, ImageFont
 import cv2
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
 import uuid
 
+# Frame rate presets. Slides are static apart from a small overlay, so the
+# lower presets lose very little while cutting render and encode work.
+QUALITY_FPS = {"low": 10, "medium": 15, "high": 30}
+
+# Overlay animation levels. "reduced" and "static" quantize the animation so
+# runs of identical frames can be reused instead of redrawn.
+MOTION_LEVELS = ("full", "reduced", "static")
+
+# Slide text layout. Content that does not fit between CONTENT_TOP and the
+# bottom margin continues on the next slide. The bottom 200px are covered by
+# the dark band from _add_simple_visual_elements, and rows are centred on
+# their y position, so the margin leaves room for half a row above it.
+TITLE_FONT_SIZE = 48
+BODY_FONT_SIZE = 36
+CONTENT_TOP = 200
+CONTENT_BOTTOM_MARGIN = 180
+
+# Transitions between slides, blended from the pre-rendered slides
+TRANSITIONS = ("crossfade", "slide", "none")
+
+# Thumbnail sprite sheet layout: evenly spaced frames, tiled in a grid
+SPRITE_TILE_WIDTH = 160
+SPRITE_TILE_COUNT = 10
+SPRITE_COLUMNS = 5
+
+# Candidate font locations, probed once per process
+SYSTEM_FONT_PATHS = [
+    # macOS fonts
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SF-Pro-Display-Regular.otf", 
+    "/System/Library/Fonts/SFNSText.ttf",
+    
+    # Linux fonts
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    
+    # Windows fonts
+    "C:\\Windows\\Fonts\\arial.ttf"
+]
+
+
+@lru_cache(maxsize=1)
+def find_system_font():
+    """Find a usable system font. The filesystem is only probed once per process."""
+    for path in SYSTEM_FONT_PATHS:
+        if os.path.exists(path):
+            return path
+            
+    # Fallback - will use default PIL font
+    return None
+
+
+@lru_cache(maxsize=32)
+def get_font(font_path, size):
+    """Process-wide font registry, keyed by font path and size."""
+    try:
+        if font_path:
+            return ImageFont.truetype(font_path, size)
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=512)
+def layout_text(text, font_path, font_size, max_width):
+    """
+    Word-wrap text into lines that fit max_width.
+    
+    Each distinct word is measured once and lines are built in a single
+    linear pass, so the cost is proportional to the number of words rather
+    than the square of the line length. Results are cached per
+    (text, font, width) since batch renders repeat the same layouts.
+    
+    Returns:
+        Tuple of lines; explicit newlines in text always end a line
+    """
+    font = get_font(font_path, font_size)
+    space_width = font.getlength(" ")
+    word_widths = {}
+    
+    lines = []
+    line_words = []
+    line_width = 0
+    
+    for word in text.replace('\n', ' \n ').split(' '):
+        if word == '\n':
+            lines.append(' '.join(line_words))
+            line_words = []
+            line_width = 0
+            continue
+        if not word:
+            continue
+            
+        width = word_widths.get(word)
+        if width is None:
+            width = word_widths[word] = font.getlength(word)
+        
+        if not line_words:
+            line_words = [word]
+            line_width = width
+        elif line_width + space_width + width <= max_width:
+            line_words.append(word)
+            line_width += space_width + width
+        else:
+            lines.append(' '.join(line_words))
+            line_words = [word]
+            line_width = width
+    
+    if line_words:
+        lines.append(' '.join(line_words))
+        
+    return tuple(lines)
+
+
+class _SegmentedWriter:
+    """
+    VideoWriter stand-in that writes fixed-length MPEG-TS chunks and an HLS
+    media playlist, republishing the playlist as each chunk is closed so
+    players can start before the render finishes.
+    """
+    
+    def __init__(self, playlist_path, fps, size, segment_frames):
+        self.playlist_path = playlist_path
+        self.directory = os.path.dirname(playlist_path)
+        self.fps = fps
+        self.size = size
+        self.segment_frames = segment_frames
+        self.segments = []
+        self.writer = None
+        self.frames_in_segment = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_playlist()
+        
+    def write(self, frame):
+        if self.writer is None:
+            # Each chunk gets its own encoder, so every chunk starts on a keyframe.
+            # FFmpeg warns that TS has no 'mp4v' tag but still muxes MPEG-4 video.
+            name = f"segment_{len(self.segments):05d}.ts"
+            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+            self.writer = cv2.VideoWriter(os.path.join(self.directory, name), fourcc, self.fps, self.size)
+            self.segment_name = name
+        self.writer.write(frame)
+        self.frames_in_segment += 1
+        if self.frames_in_segment == self.segment_frames:
+            self._close_segment()
+            
+    def release(self):
+        if self.writer is not None:
+            self._close_segment()
+        self._write_playlist(ended=True)
+        
+    def _close_segment(self):
+        self.writer.release()
+        self.segments.append((self.segment_name, self.frames_in_segment / self.fps))
+        self.writer = None
+        self.frames_in_segment = 0
+        self._write_playlist()
+        
+    def _write_playlist(self, ended=False):
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+            f"#EXT-X-TARGETDURATION:{math.ceil(self.segment_frames / self.fps)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        for name, seconds in self.segments:
+            lines.append(f"#EXTINF:{seconds:.3f},")
+            lines.append(name)
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+        
+        # Replace atomically so pollers never read a half-written playlist
+        temp_path = self.playlist_path + ".tmp"
+        with open(temp_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.playlist_path)
+
+
+class _RenditionEncoder(threading.Thread):
+    """
+    Downscale and encode frames for one rendition on its own thread.
+    
+    OpenCV releases the GIL while resizing and encoding, so several
+    renditions encode in parallel with frame generation.
+    """
+    
+    def __init__(self, path, fps, size, segment_frames=None):
+        super().__init__(daemon=True)
+        self.path = path
+        self.size = size
+        self.frames = queue.Queue(maxsize=16)
+        self.error = None
+        # Time spent downscaling and encoding, excluding waits for frames
+        self.busy_seconds = 0.0
+        self.segmented = bool(segment_frames)
+        if self.segmented:
+            self.writer = _SegmentedWriter(path, fps, size, segment_frames)
+        else:
+            fourcc = cv2.VideoWriter_fourcc(*'mp4v')  # or 'avc1' for H.264
+            self.writer = cv2.VideoWriter(path, fourcc, fps, size)
+        
+    def run(self):
+        scaled = None
+        while True:
+            item = self.frames.get()
+            if item is None:
+                break
+            if self.error:
+                continue
+            frame, is_duplicate = item
+            started = time.perf_counter()
+            try:
+                # Duplicate frames reuse the previous downscale
+                if scaled is None or not is_duplicate:
+                    if (frame.shape[1], frame.shape[0]) == self.size:
+                        scaled = frame
+                    else:
+                        scaled = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+                self.writer.write(scaled)
+            except Exception as e:
+                self.error = e
+            self.busy_seconds += time.perf_counter() - started
+        started = time.perf_counter()
+        self.writer.release()
+        self.busy_seconds += time.perf_counter() - started
+        
+    def close(self):
+        """Flush remaining frames and finalize the file."""
+        self.frames.put(None)
+        self.join()
+        if self.error:
+            raise self.error
+            
+    def remove_output(self):
+        """Delete whatever this encoder has written."""
+        if self.segmented:
+            shutil.rmtree(os.path.dirname(self.path), ignore_errors=True)
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _ThumbnailCollector:
+    """
+    Capture a poster frame and sprite tiles from frames as they are rendered,
+    so clients get thumbnails without decoding the video.
+    """
+    
+    def __init__(self, total_frames, fps, frame_size):
+        self.total_frames = total_frames
+        self.fps = fps
+        self.count = min(SPRITE_TILE_COUNT, total_frames)
+        self.interval = total_frames / self.count
+        self.sprite_indices = {int(n * self.interval): n for n in range(self.count)}
+        # Poster one second in, once the overlay has started moving
+        self.poster_index = min(fps, total_frames - 1)
+        width, height = frame_size
+        self.tile_size = (SPRITE_TILE_WIDTH, max(2, int(round(SPRITE_TILE_WIDTH * height / width))))
+        self.poster = None
+        self.tiles = [None] * self.count
+        
+    def add(self, index, frame):
+        if index == self.poster_index:
+            self.poster = frame
+        tile = self.sprite_indices.get(index)
+        if tile is not None:
+            self.tiles[tile] = cv2.resize(frame, self.tile_size, interpolation=cv2.INTER_AREA)
+    
+    def save(self, poster_path, sprite_path, quality=85):
+        """Write the poster and the sprite sheet, returning their metadata."""
+        params = [cv2.IMWRITE_WEBP_QUALITY if poster_path.endswith(".webp") else cv2.IMWRITE_JPEG_QUALITY, quality]
+        cv2.imwrite(poster_path, self.poster, params)
+        
+        tile_width, tile_height = self.tile_size
+        columns = min(SPRITE_COLUMNS, self.count)
+        rows = -(-self.count // columns)
+        sheet = np.zeros((rows * tile_height, columns * tile_width, 3), dtype=np.uint8)
+        for n, tile in enumerate(self.tiles):
+            row, column = divmod(n, columns)
+            sheet[row*tile_height:(row+1)*tile_height, column*tile_width:(column+1)*tile_width] = tile
+        cv2.imwrite(sprite_path, sheet, params)
+        
+        return {
+            "poster_path": poster_path,
+            "thumbnail_sprite": {
+                "path": sprite_path,
+                "tile_width": tile_width,
+                "tile_height": tile_height,
+                "columns": columns,
+                "rows": rows,
+                "count": self.count,
+                "interval": round(self.interval / self.fps, 3)
+            }
+        }
+
+
 class SimpleTextToVideo:
     """
     A lightweight text-to-video solution for M1 Macs with limited compute.
@@ -17,94 +317,85 @@ class SimpleTextToVideo:
     3. Combining them into a video with a simple background
     """
     
-    def __init__(self, output_dir="./output/videos"):
+    def __init__(self, output_dir="./output/videos", quality="high", motion="full",
+                 renditions=(720,), thumbnail_format="jpg", transition="crossfade",
+                 transition_duration=0.5):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
+        # Default render settings, see QUALITY_FPS and MOTION_LEVELS
+        self.quality = quality
+        self.motion = motion
+        # Output heights; every rendition is encoded from the same frames
+        self.renditions = tuple(renditions)
+        # Poster and sprite image format ("jpg" or "webp"), None to skip them
+        self.thumbnail_format = thumbnail_format
+        # How multi-slide scripts change slides, see TRANSITIONS
+        self.transition = transition
+        self.transition_duration = transition_duration
+        self.last_render_stats = {}
+        self._timings = {}
+        
         # Attempt to locate a usable font
         self.font_path = self._find_system_font()
     
     def _find_system_font(self):
         """Find a usable system font."""
-        possible_font_paths = [
-            # macOS fonts
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/SF-Pro-Display-Regular.otf", 
-            "/System/Library/Fonts/SFNSText.ttf",
-            
-            # Linux fonts
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            
-            # Windows fonts
-            "C:\\Windows\\Fonts\\arial.ttf"
-        ]
+        return find_system_font()
+    
+    def _paginate_text(self, text, width=720, height=720):
+        """
+        Split text into a title and pages of wrapped lines that fit the canvas.
+        
+        Returns:
+            (title, pages) where pages is a list of line lists
+        """
+        lines = text.split('\n')
+        title = lines[0] if lines else "Educational Content"
+        content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
+        max_width = width - 100  # Margin on both sides
+        
+        started = time.perf_counter()
+        content_lines = layout_text(content, self.font_path, BODY_FONT_SIZE, max_width)
+        self._timings["layout"] = self._timings.get("layout", 0.0) + time.perf_counter() - started
         
-        for path in possible_font_paths:
-            if os.path.exists(path):
-                return path
-                
-        # Fallback - will use default PIL font
-        return None
+        line_height = int(BODY_FONT_SIZE * 1.5)
+        lines_per_page = max(1, (height - CONTENT_TOP - CONTENT_BOTTOM_MARGIN) // line_height)
+        
+        pages = []
+        page = []
+        for line in content_lines:
+            # Blank lines are spacing, never worth a page of their own
+            if not page and not line:
+                continue
+            page.append(line)
+            if len(page) == lines_per_page:
+                pages.append(page)
+                page = []
+        if any(page):
+            pages.append(page)
+            
+        return title, pages or [[]]
     
-    def _create_text_slide(self, text, width=720, height=720, 
+    def _create_text_slide(self, title, lines, width=720, height=720, 
                           bg_color=(25, 25, 40), text_color=(240, 240, 240)):
         """Create a single text slide as an image."""
         # Create blank image
         img = Image.new('RGB', (width, height), color=bg_color)
         draw = ImageDraw.Draw(img)
         
-        # Load font
-        try:
-            font_size = 36
-            title_font_size = 48
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, font_size)
-                title_font = ImageFont.truetype(self.font_path, title_font_size)
-            else:
-                font = ImageFont.load_default()
-                title_font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
-            title_font = ImageFont.load_default()
-            
-        # Split text into title and content
-        lines = text.split('\n')
-        title = lines[0] if lines else "Educational Content"
-        content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
+        # Load fonts from the shared registry
+        font = get_font(self.font_path, BODY_FONT_SIZE)
+        title_font = get_font(self.font_path, TITLE_FONT_SIZE)
         
         # Draw title
         draw.text((width//2, 100), title, font=title_font, fill=text_color, anchor="mm")
         
-        # Draw content (simple word wrap)
-        y_position = 200
-        max_width = width - 100  # Margin on both sides
-        
-        words = content.replace('\n', ' \n ').split(' ')
-        line = ""
-        
-        for word in words:
-            if word == '\n':
-                # Draw the current line and move to next line
-                draw.text((width//2, y_position), line, font=font, fill=text_color, anchor="mm")
-                y_position += int(font_size * 1.5)
-                line = ""
-                continue
-                
-            test_line = f"{line} {word}".strip()
-            # Check if adding this word would make the line too long
-            text_width = draw.textlength(test_line, font=font)
-            
-            if text_width <= max_width:
-                line = test_line
-            else:
-                # Draw the current line and start a new one with this word
-                draw.text((width//2, y_position), line, font=font, fill=text_color, anchor="mm")
-                y_position += int(font_size * 1.5)
-                line = word
-        
-        # Draw any remaining text
-        if line:
+        # Draw content
+        y_position = CONTENT_TOP
+        for line in lines:
             draw.text((width//2, y_position), line, font=font, fill=text_color, anchor="mm")
+            y_position += int(BODY_FONT_SIZE * 1.5)
             
         return img
     
@@ -135,82 +426,310 @@ class SimpleTextToVideo:
                     
         return enhanced
     
-    def create_video_from_text(self, text, duration=10, filename=None):
+    def _overlay_state(self, i, fps, total_frames, width, motion):
+        """
+        Compute the animated overlay for frame i.
+        
+        Lower motion levels quantize the progress bar and the pulse so that
+        consecutive frames come out identical and can be elided.
+        """
+        t = i / fps
+        progress = i / total_frames
+        
+        if motion == "full":
+            pulse = 0.5 + 0.5 * np.sin(t * 3.0)
+        elif motion == "reduced":
+            # A handful of pulse steps and a progress bar that moves in 2% steps
+            pulse = round((0.5 + 0.5 * np.sin(t * 3.0)) * 4) / 4
+            progress = int(progress * 50) / 50
+        else:
+            # Static: no pulse, progress bar only advances once per second
+            pulse = 0.0
+            progress = int(t) * fps / total_frames
+        
+        indicator_width = int(progress * width * 0.8)
+        radius = int(20 + 10 * pulse)
+        return indicator_width, radius, int(100 * pulse)
+    
+    def _slide_boundaries(self, pages, total_frames):
+        """First frame of every slide after the first, in proportion to their word counts"""
+        words = [max(1, sum(len(line.split()) for line in page)) for page in pages]
+        return [round(total_frames * sum(words[:k]) / sum(words)) for k in range(1, len(pages))]
+    
+    def _slide_schedule(self, pages, total_frames, transition_frames):
+        """
+        Assign frames to slides in proportion to their word counts.
+        
+        Yields:
+            For each frame, (slide_index, next_slide_index, blend) where blend is
+            the transition progress towards the next slide, or 0 outside transitions.
+        """
+        boundaries = self._slide_boundaries(pages, total_frames)
+        
+        slide = 0
+        for i in range(total_frames):
+            while slide < len(boundaries) and i >= boundaries[slide]:
+                slide += 1
+            if slide < len(boundaries) and transition_frames:
+                start = boundaries[slide] - transition_frames
+                if i >= start:
+                    # Ends just short of fully blended; the next slide's own frames follow
+                    yield slide, slide + 1, (i - start + 1) / (transition_frames + 1)
+                    continue
+            yield slide, slide, 0.0
+    
+    def _blend_slides(self, current, upcoming, blend, transition):
+        """Blend two pre-rendered RGB slides with vectorized NumPy operations."""
+        if transition == "crossfade":
+            return cv2.addWeighted(current, 1.0 - blend, upcoming, blend, 0.0)
+        
+        # Slide: the next slide pushes the current one out to the left
+        offset = int(round(current.shape[1] * blend))
+        frame = np.empty_like(current)
+        frame[:, :current.shape[1] - offset] = current[:, offset:]
+        frame[:, current.shape[1] - offset:] = upcoming[:, :offset]
+        return frame
+    
+    def _render_frames(self, slides, total_frames, fps, motion, schedule, transition):
+        """
+        Generate BGR video frames for a sequence of slides.
+        
+        Slides are rendered once up front; transitions are blended from them
+        and only the overlay is drawn per frame.
+        
+        Yields:
+            (frame, is_duplicate) tuples. Duplicate frames are the same array
+            object as the previous frame and were not redrawn.
+        """
+        slide_arrays = [np.asarray(slide) for slide in slides]
+        width = slides[0].width
+        previous_state = None
+        previous_frame = None
+        
+        for i, (current, upcoming, blend) in enumerate(schedule):
+            overlay = self._overlay_state(i, fps, total_frames, width, motion)
+            state = (current, upcoming, blend, overlay)
+            if state == previous_state:
+                yield previous_frame, True
+                continue
+            
+            started = time.perf_counter()
+            indicator_width, radius, alpha = overlay
+            if blend:
+                frame = Image.fromarray(self._blend_slides(
+                    slide_arrays[current], slide_arrays[upcoming], blend, transition
+                ))
+            else:
+                frame = slides[current].copy()
+            draw = ImageDraw.Draw(frame)
+            
+            # Add a progress indicator
+            draw.rectangle([(frame.width*0.1, frame.height-20), 
+                           (frame.width*0.1 + indicator_width, frame.height-10)],
+                           fill=(200, 200, 255))
+            
+            # Add a subtle animation (pulsing circle)
+            if motion != "static":
+                draw.ellipse([(50-radius, 50-radius), (50+radius, 50+radius)], 
+                            fill=(200, 200, 255, alpha))
+            
+            previous_state = state
+            previous_frame = cv2.cvtColor(np.asarray(frame), cv2.COLOR_RGB2BGR)
+            self._timings["draw"] = self._timings.get("draw", 0.0) + time.perf_counter() - started
+            yield previous_frame, False
+    
+    def create_video_from_text(self, text, duration=10, filename=None,
+                               quality=None, motion=None, progress_callback=None,
+                               renditions=None, segment_duration=None,
+                               transition=None, transition_duration=None):
         """
         Create a video from text.
         
+        Text that does not fit on one slide is paginated across several,
+        each shown for a share of the duration proportional to its words.
+        
         Args:
             text: The text to convert to video
             duration: Duration in seconds
             filename: Optional filename, will be generated otherwise
+            quality: Frame rate preset ("low", "medium" or "high"), defaults to the generator's
+            motion: Overlay animation level ("full", "reduced" or "static"), defaults to the generator's
+            progress_callback: Optional callable(frames_done, total_frames), called after every
+                frame. Raising from it aborts the render and removes the partial file.
+            renditions: Output heights (e.g. (720, 480, 360)), defaults to the generator's.
+                The tallest keeps the filename, the others get a "_<height>p" suffix.
+                All paths are listed in last_render_stats["renditions"].
+            segment_duration: Optional chunk length in seconds. When set, each rendition is
+                written as MPEG-TS chunks plus an HLS playlist under "<name>_hls/<height>p/"
+                instead of an mp4, and "<name>.m3u8" is a master playlist over the
+                renditions. Playlists are updated as chunks complete.
+            transition: Slide change effect ("crossfade", "slide" or "none"), defaults to the generator's
+            transition_duration: Transition length in seconds, defaults to the generator's
+            
+        Unless thumbnail_format is None, a "<name>_poster" frame and a "<name>_sprite"
+        sheet are written next to the video from the rendered frames and
+        listed in last_render_stats["thumbnails"].
             
         Returns:
-            Path to the generated video file
+            Path to the tallest rendition, or to the master playlist when segmented
         """
         if filename is None:
             filename = f"video_{uuid.uuid4().hex[:8]}.mp4"
+        
+        quality = quality or self.quality
+        motion = motion or self.motion
+        if quality not in QUALITY_FPS:
+            raise ValueError(f"Unknown quality '{quality}', expected one of {list(QUALITY_FPS)}")
+        if motion not in MOTION_LEVELS:
+            raise ValueError(f"Unknown motion '{motion}', expected one of {list(MOTION_LEVELS)}")
+        transition = transition or self.transition
+        if transition not in TRANSITIONS:
+            raise ValueError(f"Unknown transition '{transition}', expected one of {list(TRANSITIONS)}")
+        if transition_duration is None:
+            transition_duration = self.transition_duration
             
-        # Create a temporary directory for frames
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create base slide
-            slide = self._create_text_slide(text)
-            enhanced_slide = self._add_simple_visual_elements(slide)
-            
-            # Calculate frames
-            fps = 30
-            total_frames = duration * fps
-            
-            # Generate frames with simple transitions and animations
-            for i in range(total_frames):
-                frame = enhanced_slide.copy()
-                draw = ImageDraw.Draw(frame)
-                
-                # Add a progress indicator
-                progress = i / total_frames
-                indicator_width = int(progress * frame.width * 0.8)
-                draw.rectangle([(frame.width*0.1, frame.height-20), 
-                               (frame.width*0.1 + indicator_width, frame.height-10)],
-                               fill=(200, 200, 255))
-                
-                # Add a subtle animation (pulsing circle)
-                pulse = 0.5 + 0.5 * np.sin(i * 0.1)
-                radius = int(20 + 10 * pulse)
-                draw.ellipse([(50-radius, 50-radius), (50+radius, 50+radius)], 
-                            fill=(200, 200, 255, int(100 * pulse)))
-                
-                # Save the frame
-                frame_path = os.path.join(temp_dir, f"frame_{i:04d}.jpg")
-                frame.save(frame_path)
-            
-            # Combine frames into video using OpenCV
-            output_path = os.path.join(self.output_dir, filename)
-            self._frames_to_video(temp_dir, output_path, fps)
-            
-            return output_path
-    
-    def _frames_to_video(self, frames_dir, output_path, fps):
-        """Combine image frames into a video."""
-        # Get the first frame to determine dimensions
-        frame_files = sorted([f for f in os.listdir(frames_dir) if f.startswith("frame_")])
-        if not frame_files:
-            raise ValueError("No frames found to create video")
-            
-        first_frame = cv2.imread(os.path.join(frames_dir, frame_files[0]))
-        height, width, _ = first_frame.shape
+        render_started = time.perf_counter()
+        self._timings = {}
         
-        # Create video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')  # or 'avc1' for H.264
-        video = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+        # Create base slides, one per page of text
+        title, pages = self._paginate_text(text)
+        slides = [self._add_simple_visual_elements(self._create_text_slide(title, page)) for page in pages]
+        self._timings["draw"] = time.perf_counter() - render_started - self._timings.get("layout", 0.0)
+        fps = QUALITY_FPS[quality]
+        total_frames = max(int(duration * fps), 1)
         
-        # Add all frames to the video
-        for frame_file in frame_files:
-            video.write(cv2.imread(os.path.join(frames_dir, frame_file)))
-            
-        video.release()
+        # Never let a transition eat more than half of the shortest slide
+        transition_frames = 0
+        if transition != "none" and len(slides) > 1:
+            edges = [0] + self._slide_boundaries(pages, total_frames) + [total_frames]
+            shortest = min(end - start for start, end in zip(edges, edges[1:]))
+            transition_frames = min(int(transition_duration * fps), shortest // 2)
+        schedule = self._slide_schedule(pages, total_frames, transition_frames)
+        
+        base_width, base_height = slides[0].size
+        heights = sorted(set(renditions or self.renditions), reverse=True)
+        if not heights or heights[0] > base_height or heights[-1] <= 0:
+            raise ValueError(f"Renditions must be between 1 and {base_height} pixels high, got {heights}")
+        
+        # Frames are generated once and fanned out to one encoder per
+        # rendition; repeated frames are written again without being redrawn
+        stem, ext = os.path.splitext(filename)
+        segment_frames = max(1, int(round(segment_duration * fps))) if segment_duration else None
+        output_path = None
+        encoders = []
+        for height in heights:
+            # Keep the aspect ratio, with even dimensions for the codec
+            width = max(2, int(round(base_width * height / base_height / 2)) * 2)
+            if segment_frames:
+                path = os.path.join(self.output_dir, f"{stem}_hls", f"{height}p", "index.m3u8")
+            else:
+                name = filename if height == heights[0] else f"{stem}_{height}p{ext}"
+                path = os.path.join(self.output_dir, name)
+            encoders.append(_RenditionEncoder(path, fps, (width, height), segment_frames))
+        if segment_frames:
+            # Publish the master playlist up front so players can open it right away
+            output_path = os.path.join(self.output_dir, f"{stem}.m3u8")
+            self._write_master_playlist(output_path, encoders, fps)
+        for encoder in encoders:
+            encoder.start()
         
-        return output_path
+        thumbnails = _ThumbnailCollector(total_frames, fps, slides[0].size) if self.thumbnail_format else None
+        rendered = 0
+        elided = 0
+        try:
+            for frame, is_duplicate in self._render_frames(slides, total_frames, fps, motion,
+                                                           schedule, transition):
+                for encoder in encoders:
+                    encoder.frames.put((frame, is_duplicate))
+                if thumbnails:
+                    started = time.perf_counter()
+                    thumbnails.add(rendered + elided, frame)
+                    self._timings["thumbnails"] = self._timings.get("thumbnails", 0.0) + time.perf_counter() - started
+                if is_duplicate:
+                    elided += 1
+                else:
+                    rendered += 1
+                if progress_callback:
+                    progress_callback(rendered + elided, total_frames)
+            for encoder in encoders:
+                encoder.close()
+        except BaseException:
+            for encoder in encoders:
+                if encoder.is_alive():
+                    encoder.error = encoder.error or RuntimeError("Render aborted")
+                    encoder.frames.put(None)
+                    encoder.join()
+                encoder.remove_output()
+            if output_path:
+                shutil.rmtree(os.path.join(self.output_dir, f"{stem}_hls"), ignore_errors=True)
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+            raise
+        
+        thumbnail_info = None
+        if thumbnails:
+            started = time.perf_counter()
+            thumbnail_info = thumbnails.save(
+                os.path.join(self.output_dir, f"{stem}_poster.{self.thumbnail_format}"),
+                os.path.join(self.output_dir, f"{stem}_sprite.{self.thumbnail_format}")
+            )
+            self._timings["thumbnails"] = self._timings.get("thumbnails", 0.0) + time.perf_counter() - started
+        
+        self.last_render_stats = {
+            "fps": fps,
+            "quality": quality,
+            "motion": motion,
+            "frames_rendered": rendered,
+            "frames_elided": elided,
+            "slides": len(slides),
+            "transition": transition if transition_frames else "none",
+            "renditions": [
+                {"width": encoder.size[0], "height": encoder.size[1], "path": encoder.path}
+                for encoder in encoders
+            ],
+            "segment_duration": segment_frames / fps if segment_frames else None,
+            "thumbnails": thumbnail_info,
+            # Encoders run in parallel with drawing, so these can add up to more than total
+            "timings": {
+                "layout_seconds": round(self._timings.get("layout", 0.0), 6),
+                "draw_seconds": round(self._timings.get("draw", 0.0), 6),
+                "encode_seconds": round(sum(encoder.busy_seconds for encoder in encoders), 6),
+                "thumbnail_seconds": round(self._timings.get("thumbnails", 0.0), 6),
+                "total_seconds": round(time.perf_counter() - render_started, 6)
+            }
+        }
+        return output_path or encoders[0].path
     
-    def generate_content_video(self, title, script, visuals_desc=None):
+    def _write_master_playlist(self, path, encoders, fps):
+        """Write an HLS master playlist listing every rendition's media playlist."""
+        lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+        for encoder in encoders:
+            width, height = encoder.size
+            # Rough MPEG-4 part 2 bitrate for mostly static slides
+            bandwidth = int(width * height * fps * 0.15)
+            lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}")
+            lines.append(os.path.relpath(encoder.path, os.path.dirname(path)))
+        with open(path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+    
+    @staticmethod
+    def content_video_filename(title, output_id=None):
+        """Filename used by generate_content_video for a segment title (and optional unique id)."""
+        stem = title.replace(' ', '_').lower()
+        if output_id:
+            stem = f"{stem}_{output_id}"
+        return f"{stem}.mp4"
+    
+    @classmethod
+    def stream_playlist_path(cls, output_dir, title, output_id=None):
+        """Master playlist path generate_content_video writes in segmented mode."""
+        stem = os.path.splitext(cls.content_video_filename(title, output_id))[0]
+        return os.path.join(output_dir, f"{stem}.m3u8")
+    
+    def generate_content_video(self, title, script, visuals_desc=None,
+                               quality=None, motion=None, progress_callback=None,
+                               renditions=None, segment_duration=None,
+                               transition=None, transition_duration=None, output_id=None):
         """
         Generate a video for educational content with the given script.
         
@@ -218,6 +737,15 @@ class SimpleTextToVideo:
             title: Title of the content segment
             script: Narration script
             visuals_desc: Description of visuals (will be used for metadata)
+            quality: Optional frame rate preset override
+            motion: Optional overlay animation level override
+            progress_callback: Optional callable(frames_done, total_frames)
+            renditions: Optional output heights override, e.g. (720, 480, 360)
+            segment_duration: Optional chunk length in seconds for HLS-style segmented output
+            transition: Optional slide transition override
+            transition_duration: Optional transition length override, in seconds
+            output_id: Optional unique id added to the output filenames, so renders
+                of the same title (e.g. concurrent render jobs) do not overwrite each other
             
         Returns:
             Path to the generated video and metadata
@@ -233,8 +761,14 @@ class SimpleTextToVideo:
         duration = min(max(word_count / 150 * 60, 10), 60)  # Between 10 and 60 seconds
         
         # Generate the video
-        video_filename = f"{title.replace(' ', '_').lower()}.mp4"
-        video_path = self.create_video_from_text(formatted_text, duration, video_filename)
+        video_filename = self.content_video_filename(title, output_id)
+        video_path = self.create_video_from_text(formatted_text, duration, video_filename,
+                                                 quality=quality, motion=motion,
+                                                 progress_callback=progress_callback,
+                                                 renditions=renditions,
+                                                 segment_duration=segment_duration,
+                                                 transition=transition,
+                                                 transition_duration=transition_duration)
         
         # Create metadata
         metadata = {
@@ -242,9 +776,20 @@ class SimpleTextToVideo:
             "script": script,
             "visuals_description": visuals_desc or "Simple animated text slides",
             "duration": duration,
+            "fps": self.last_render_stats["fps"],
+            "motion": self.last_render_stats["motion"],
+            "slides": self.last_render_stats["slides"],
+            "transition": self.last_render_stats["transition"],
             "generated_at": datetime.now().isoformat(),
-            "video_path": video_path
+            "video_path": video_path,
+            "renditions": self.last_render_stats["renditions"]
         }
+        if segment_duration:
+            metadata["segment_duration"] = self.last_render_stats["segment_duration"]
+        
+        # Register thumbnails next to the video so feeds can paint before the mp4 loads
+        if self.last_render_stats["thumbnails"]:
+            metadata.update(self.last_render_stats["thumbnails"])
         
         # Save metadata alongside video
         metadata_path = os.path.splitext(video_path)[0] + ".json"
@@ -0,0 +1,224 @@
+"""
+Rendering benchmark for SimpleTextToVideo.
+
+Renders representative scripts at several durations and rendition sets
+through generate_content_video, each case in a fresh process, and reports
+frames per second, layout/draw/encode time, peak RSS, temp-disk bytes and
+output size. Runs offline.
+
+Usage:
+    python -m src.utils.text_to_video_benchmark --output report.json
+    python -m src.utils.text_to_video_benchmark --compare baseline.json --max-regression 0.2
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import threading
+import subprocess
+import multiprocessing
+from datetime import datetime
+
+# generate_content_video targets 150 words per minute, so these give 10s, 30s and 60s videos
+SCRIPT_WORD_COUNTS = {"short": 25, "medium": 75, "long": 150}
+
+RENDITION_SETS = {"720p": [720], "ladder": [720, 480, 360]}
+
+SAMPLE_SENTENCES = [
+    "A blockchain is a distributed digital ledger that records transactions across many computers.",
+    "Each block contains a timestamp and transaction data linked to the previous block by a hash.",
+    "Consensus mechanisms let participants agree on the ledger without a central authority.",
+    "Smart contracts are programs that run on the network and enforce agreements automatically.",
+]
+
+
+def build_script(word_count):
+    """Build a script of exactly word_count words from the sample sentences"""
+    words = []
+    while len(words) < word_count:
+        for sentence in SAMPLE_SENTENCES:
+            words.extend(sentence.split())
+    return " ".join(words[:word_count])
+
+
+def _directory_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _run_case(case, results):
+    """Render one case in a child process and report its measurements"""
+    # Imported here so each case pays its own import and cache warm-up
+    from src.utils.text_to_video import SimpleTextToVideo
+
+    work_dir = tempfile.mkdtemp(prefix="ttv_bench_")
+    output_dir = os.path.join(work_dir, "output")
+    temp_dir = os.path.join(work_dir, "tmp")
+    os.makedirs(temp_dir)
+    tempfile.tempdir = temp_dir
+    os.environ["TMPDIR"] = temp_dir
+
+    # Sample the temp directory in the background to catch its peak size
+    peak_temp_bytes = 0
+    sampling = threading.Event()
+
+    def sample_temp():
+        nonlocal peak_temp_bytes
+        while not sampling.wait(0.05):
+            peak_temp_bytes = max(peak_temp_bytes, _directory_size(temp_dir))
+
+    sampler = threading.Thread(target=sample_temp, daemon=True)
+    sampler.start()
+
+    try:
+        generator = SimpleTextToVideo(output_dir=output_dir, quality=case["quality"], motion=case["motion"])
+        script = build_script(case["words"])
+        started = time.perf_counter()
+        video_path, metadata_path = generator.generate_content_video(
+            f"Benchmark {case['name']}", script, renditions=case["renditions"]
+        )
+        wall_seconds = time.perf_counter() - started
+    finally:
+        sampling.set()
+        sampler.join()
+    peak_temp_bytes = max(peak_temp_bytes, _directory_size(temp_dir))
+
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    stats = generator.last_render_stats
+    frames = stats["frames_rendered"] + stats["frames_elided"]
+    output_bytes = _directory_size(output_dir) - os.path.getsize(metadata_path)
+
+    results.put({
+        **case,
+        "duration": metadata["duration"],
+        "fps": stats["fps"],
+        "frames": frames,
+        "frames_rendered": stats["frames_rendered"],
+        "frames_elided": stats["frames_elided"],
+        "wall_seconds": round(wall_seconds, 4),
+        "frames_per_second": round(frames / wall_seconds, 2),
+        **stats["timings"],
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "temp_disk_peak_bytes": peak_temp_bytes,
+        "output_bytes": output_bytes,
+    })
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_case(case):
+    """Run a case in a fresh process so RSS and caches are measured per case"""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_run_case, args=(case, results))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError(f"Benchmark case {case['name']} failed with exit code {process.exitcode}")
+    return results.get()
+
+
+def build_cases(lengths, rendition_sets, quality, motion):
+    return [
+        {
+            "name": f"{length}-{renditions}",
+            "words": SCRIPT_WORD_COUNTS[length],
+            "renditions": RENDITION_SETS[renditions],
+            "quality": quality,
+            "motion": motion,
+        }
+        for length in lengths
+        for renditions in rendition_sets
+    ]
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(baseline, report, max_regression):
+    """
+    Print per-case frames-per-second changes against a baseline report.
+
+    Returns:
+        List of case names whose throughput dropped by more than max_regression
+    """
+    baseline_cases = {case["name"]: case for case in baseline["cases"]}
+    regressions = []
+    for case in report["cases"]:
+        previous = baseline_cases.get(case["name"])
+        if not previous:
+            continue
+        change = case["frames_per_second"] / previous["frames_per_second"] - 1
+        print(f"{case['name']:<16} {previous['frames_per_second']:>9.1f} -> {case['frames_per_second']:>9.1f} fps ({change:+.1%})")
+        if change < -max_regression:
+            regressions.append(case["name"])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SimpleTextToVideo rendering")
+    parser.add_argument("--lengths", nargs="+", choices=list(SCRIPT_WORD_COUNTS), default=list(SCRIPT_WORD_COUNTS))
+    parser.add_argument("--renditions", nargs="+", choices=list(RENDITION_SETS), default=list(RENDITION_SETS))
+    parser.add_argument("--quality", default="high")
+    parser.add_argument("--motion", default="full")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Fail when frames per second drops by more than this fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "cases": [],
+    }
+
+    print(f"{'case':<16} {'frames':>7} {'fps':>9} {'layout':>8} {'draw':>8} {'encode':>8} {'rss MB':>8} {'tmp KB':>8} {'out KB':>8}")
+    for case in build_cases(args.lengths, args.renditions, args.quality, args.motion):
+        result = run_case(case)
+        report["cases"].append(result)
+        print(
+            f"{result['name']:<16} {result['frames']:>7} {result['frames_per_second']:>9.1f} "
+            f"{result['layout_seconds']:>8.3f} {result['draw_seconds']:>8.3f} {result['encode_seconds']:>8.3f} "
+            f"{result['peak_rss_bytes'] / 2**20:>8.1f} {result['temp_disk_peak_bytes'] / 1024:>8.0f} "
+            f"{result['output_bytes'] / 1024:>8.0f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.max_regression)
+        if regressions:
+            print(f"Throughput regressed beyond {args.max_regression:.0%} in: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
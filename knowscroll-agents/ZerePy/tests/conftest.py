@@ -0,0 +1,55 @@
+import pytest
+from src.circuit_breaker import CircuitBreaker
+from src.connection_manager import ConnectionManager
+from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.rate_limit import RateLimiter
+
+
+class FakeConnection(BaseConnection):
+    """Connection whose actions are plain callables; handlers take the action's params as kwargs"""
+
+    def __init__(self, handlers, healthy=True, config=None):
+        self.handlers = handlers
+        self.healthy = healthy
+        self.health_checks = 0
+        super().__init__(config or {})
+
+    @property
+    def is_llm_provider(self):
+        return True
+
+    def validate_config(self, config):
+        return config
+
+    def configure(self, **kwargs):
+        return True
+
+    def is_configured(self, verbose=False):
+        self.health_checks += 1
+        return self.healthy
+
+    def register_actions(self):
+        for name, handler in self.handlers.items():
+            params = [
+                ActionParameter(param, True, str, param)
+                for param in handler.__code__.co_varnames[:handler.__code__.co_argcount]
+            ]
+            self.actions[name] = Action(name, params, name)
+
+    def perform_action(self, action_name, kwargs):
+        return self.handlers[action_name](**kwargs)
+
+
+@pytest.fixture
+def make_manager():
+    """
+    Build a ConnectionManager over FakeConnections: make_manager(name=handlers, ...).
+    configs maps connection names to the config their connection reports.
+    """
+    def make(circuit_breaker=None, configs=None, **connections):
+        manager = ConnectionManager([], rate_limiter=RateLimiter())
+        for name, handlers in connections.items():
+            manager.connections[name] = FakeConnection(handlers, config=(configs or {}).get(name))
+            manager.breakers[name] = CircuitBreaker.from_config(name, circuit_breaker)
+        return manager
+    return make
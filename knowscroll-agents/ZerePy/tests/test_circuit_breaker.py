@@ -0,0 +1,78 @@
+from src.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(**kwargs):
+    clock = FakeClock()
+    return CircuitBreaker("api", clock=clock, **kwargs), clock
+
+
+def test_opens_after_consecutive_failures():
+    breaker, _ = make_breaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 30
+
+
+def test_success_resets_failure_count():
+    breaker, _ = make_breaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_limited_trials_then_closes():
+    breaker, clock = make_breaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.is_available()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_for_another_timeout():
+    breaker, clock = make_breaker(failure_threshold=5, reset_timeout=10)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    clock.now = 15
+    assert breaker.retry_after() == 5
+    assert breaker.status() == {"state": OPEN, "failures": 6, "retry_after": 5.0}
+
+
+def test_from_config_uses_defaults_for_missing_keys():
+    breaker = CircuitBreaker.from_config("api", {"failure_threshold": 2})
+    assert (breaker.failure_threshold, breaker.reset_timeout, breaker.half_open_max_calls) == (2, 60, 1)
+
+
+def test_connection_manager_fails_fast_once_open(make_manager):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        raise RuntimeError("down")
+
+    manager = make_manager(circuit_breaker={"failure_threshold": 2}, api={"flaky": flaky})
+    for _ in range(3):
+        assert manager.perform_action("api", "flaky", []) is None
+    assert len(calls) == 2
+    assert not manager.is_available("api")
@@ -0,0 +1,109 @@
+from src.agent import ZerePyAgent
+import gc
+import pytest
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+
+def stream_of(*deltas, error=None):
+    def generate_text_stream(prompt):
+        for delta in deltas:
+            yield delta
+        if error:
+            raise error
+    return generate_text_stream
+
+
+def test_success_is_recorded_when_the_stream_ends(make_manager):
+    manager = make_manager(llm={"generate-text-stream": stream_of("a", "b")})
+    manager.breakers["llm"].record_failure()
+    stream = manager.perform_action("llm", "generate-text-stream", ["hi"])
+    # Nothing is recorded until the stream has been consumed
+    assert manager.breakers["llm"].status()["failures"] == 1
+    assert list(stream) == ["a", "b"]
+    assert manager.breakers["llm"].status()["failures"] == 0
+
+
+def test_mid_stream_error_counts_as_a_failure(make_manager):
+    manager = make_manager(
+        circuit_breaker={"failure_threshold": 1},
+        llm={"generate-text-stream": stream_of("a", error=RuntimeError("reset"))}
+    )
+    stream = manager.perform_action("llm", "generate-text-stream", ["hi"])
+    assert next(stream) == "a"
+    assert manager.breakers["llm"].state == CLOSED
+    try:
+        next(stream)
+    except RuntimeError:
+        pass
+    assert manager.breakers["llm"].state == OPEN
+    # The connection is health-checked again before its next use
+    assert "llm" not in manager.health.status()
+
+
+def test_consumer_stopping_early_is_not_a_failure(make_manager):
+    manager = make_manager(
+        circuit_breaker={"failure_threshold": 1},
+        llm={"generate-text-stream": stream_of("a", "b", "c")}
+    )
+    stream = manager.perform_action("llm", "generate-text-stream", ["hi"])
+    assert next(stream) == "a"
+    stream.close()
+    assert manager.breakers["llm"].state == CLOSED
+
+
+def half_open_manager(make_manager):
+    manager = make_manager(
+        circuit_breaker={"failure_threshold": 1, "reset_timeout": 0},
+        llm={"generate-text-stream": stream_of("a", "b")}
+    )
+    manager.breakers["llm"].record_failure()
+    assert manager.breakers["llm"].state == HALF_OPEN
+    return manager
+
+
+def test_closing_early_frees_the_half_open_trial(make_manager):
+    manager = half_open_manager(make_manager)
+    stream = manager.perform_action("llm", "generate-text-stream", ["hi"])
+    assert not manager.breakers["llm"].is_available()
+    assert next(stream) == "a"
+    stream.close()
+    assert manager.breakers["llm"].is_available()
+
+
+def test_dropping_an_unread_stream_frees_the_half_open_trial(make_manager):
+    manager = half_open_manager(make_manager)
+    stream = manager.perform_action("llm", "generate-text-stream", ["hi"])
+    assert not manager.breakers["llm"].is_available()
+    del stream
+    gc.collect()
+    assert manager.breakers["llm"].is_available()
+    assert list(manager.perform_action("llm", "generate-text-stream", ["hi"])) == ["a", "b"]
+    assert manager.breakers["llm"].state == CLOSED
+
+
+def make_agent(manager):
+    agent = object.__new__(ZerePyAgent)
+    agent.model_provider = "llm"
+    agent.connection_manager = manager
+    agent.llm_cache = None
+    agent.llm_cache_actions = set()
+    return agent
+
+
+def test_prompt_llm_stream_raises_when_the_provider_fails_mid_stream(make_manager):
+    manager = make_manager(llm={
+        "generate-text-stream": lambda prompt, system_prompt: stream_of("a", error=RuntimeError("reset"))(prompt)
+    })
+    stream = make_agent(manager).prompt_llm_stream("hi", system_prompt="sys")
+    assert next(stream) == "a"
+    with pytest.raises(RuntimeError, match="reset"):
+        next(stream)
+
+
+def test_prompt_llm_stream_raises_when_the_request_fails(make_manager):
+    def refuse(prompt, system_prompt):
+        raise RuntimeError("refused")
+
+    stream = make_agent(make_manager(llm={"generate-text-stream": refuse})).prompt_llm_stream("hi", system_prompt="sys")
+    with pytest.raises(Exception, match="Could not start streaming from llm"):
+        next(stream)
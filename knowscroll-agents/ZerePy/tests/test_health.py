@@ -0,0 +1,60 @@
+import time
+from src.health import HealthCache
+
+
+class Probe:
+    def __init__(self, healthy):
+        self.healthy = healthy
+        self.checks = 0
+
+    def is_configured(self, verbose=False):
+        self.checks += 1
+        return self.healthy
+
+
+def test_healthy_result_is_cached():
+    cache, probe = HealthCache(ttl=60), Probe(True)
+    assert cache.is_healthy("api", probe)
+    assert cache.is_healthy("api", probe)
+    assert probe.checks == 1
+
+
+def test_stale_healthy_result_refreshes_in_background():
+    cache, probe = HealthCache(ttl=0.05), Probe(True)
+    cache.is_healthy("api", probe)
+    time.sleep(0.06)
+    probe.healthy = False
+    # The stale value is served while the re-check runs
+    assert cache.is_healthy("api", probe)
+    deadline = time.monotonic() + 2
+    while cache.status()["api"]["healthy"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not cache.is_healthy("api", probe)
+    assert probe.checks == 2
+
+
+def test_unhealthy_result_is_rechecked_after_negative_ttl():
+    cache, probe = HealthCache(ttl=300, negative_ttl=0.05), Probe(False)
+    assert not cache.is_healthy("api", probe)
+    assert not cache.is_healthy("api", probe)
+    assert probe.checks == 1
+    probe.healthy = True
+    time.sleep(0.06)
+    assert cache.is_healthy("api", probe)
+    assert probe.checks == 2
+
+
+def test_invalidate_forces_a_synchronous_check():
+    cache, probe = HealthCache(ttl=60), Probe(True)
+    cache.is_healthy("api", probe)
+    probe.healthy = False
+    cache.invalidate("api")
+    assert not cache.is_healthy("api", probe)
+
+
+def test_raising_check_counts_as_unhealthy():
+    class Broken:
+        def is_configured(self, verbose=False):
+            raise RuntimeError("no network")
+
+    assert not HealthCache().is_healthy("api", Broken())
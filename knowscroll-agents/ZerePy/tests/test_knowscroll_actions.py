@@ -0,0 +1,94 @@
+import subprocess
+import sys
+from collections import deque
+from types import ModuleType, SimpleNamespace
+import pytest
+from src.action_handler import execute_action, load_action_modules
+from src.agent import ZerePyAgent
+from src.scheduler import TaskScheduler
+
+# proposal id -> (channel_id, description, content_uri, ..., executed, passed)
+PROPOSALS = {
+    1: (7, "Intro to zk proofs", "ipfs://a", None, None, None, None, None, True, True),
+    2: (7, "Rejected idea", "ipfs://b", None, None, None, None, None, True, False),
+}
+
+
+class FakeWeb3:
+    providers = []
+
+    def __init__(self, provider):
+        contract = SimpleNamespace(functions=SimpleNamespace(
+            getTotalProposalCount=lambda: SimpleNamespace(call=lambda: len(PROPOSALS)),
+            getProposalDetails=lambda proposal_id: SimpleNamespace(call=lambda: PROPOSALS[proposal_id]),
+        ))
+        self.eth = SimpleNamespace(contract=lambda address, abi: contract)
+
+    @staticmethod
+    def HTTPProvider(url):
+        FakeWeb3.providers.append(url)
+        return url
+
+
+@pytest.fixture
+def agent(make_manager, monkeypatch, tmp_path):
+    web3 = ModuleType("web3")
+    web3.Web3 = FakeWeb3
+    monkeypatch.setitem(sys.modules, "web3", web3)
+    monkeypatch.chdir(tmp_path)
+    load_action_modules([], ["check-approved-proposals"])
+    from src.actions.content_creation import check_approved_proposals
+    monkeypatch.setattr(check_approved_proposals, "load_contract_abi", lambda name: [])
+
+    agent = object.__new__(ZerePyAgent)
+    agent.model_provider = None
+    agent.connection_manager = make_manager(
+        configs={"sonic": {"name": "sonic", "network": "testnet", "rpc": "http://sonic.test"}},
+        sonic={}
+    )
+    agent.task_queue = deque()
+    agent.host = None
+    FakeWeb3.providers.clear()
+    return agent
+
+
+def test_check_approved_proposals_queues_drafts(agent):
+    result = execute_action(agent, "check-approved-proposals")
+    assert result.startswith("Found 1 newly approved proposals")
+    assert FakeWeb3.providers == ["http://sonic.test"]
+    assert [name for name, _ in agent.task_queue] == ["generate-content-draft"]
+    assert agent.task_queue[0][1]["proposal_id"] == 1
+
+    # Processed proposals are remembered
+    agent.task_queue.clear()
+    assert execute_action(agent, "check-approved-proposals") == "No new approved proposals found."
+    assert not agent.task_queue
+
+
+def test_scheduler_runs_entry_action_only_while_sonic_is_up(agent):
+    scheduler = TaskScheduler([
+        {"name": "check-approved-proposals", "weight": 3},
+        {"name": "generate-content-draft", "weight": 5},
+        {"name": "notify-approval-agent", "weight": 2},
+    ])
+    selected = scheduler.select(agent, count=3)
+    assert [task["name"] for task in selected] == ["check-approved-proposals"]
+
+    breaker = agent.connection_manager.breakers["sonic"]
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert scheduler.select(agent, count=3) == []
+
+
+def test_get_connection_config(agent):
+    assert agent.get_connection_config("sonic")["network"] == "testnet"
+    assert agent.get_connection_config("missing") == {}
+
+
+def test_registering_the_actions_does_not_import_heavy_dependencies():
+    code = (
+        "import sys, src.actions.knowscroll_actions; "
+        "print(sorted(m for m in ('web3', 'cv2') if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
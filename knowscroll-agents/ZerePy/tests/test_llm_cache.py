@@ -0,0 +1,62 @@
+import time
+from src.llm_cache import LLMResponseCache, MemoryLRU, SqliteResponseStore, cache_key
+
+
+def test_cache_key_depends_on_every_input():
+    base = cache_key("openai", "gpt", "system", "prompt", {"temperature": 0.2})
+    assert base == cache_key("openai", "gpt", "system", "prompt", {"temperature": 0.2})
+    assert base != cache_key("openai", "gpt", "system", "prompt", {"temperature": 0.7})
+    assert base != cache_key("openai", "gpt", "other", "prompt", {"temperature": 0.2})
+    assert base != cache_key("ollama", "gpt", "system", "prompt", {"temperature": 0.2})
+
+
+def test_memory_lru_evicts_least_recently_used():
+    lru = MemoryLRU(max_entries=2)
+    expires = time.time() + 60
+    lru.put("a", "1", expires)
+    lru.put("b", "2", expires)
+    lru.get("a")
+    lru.put("c", "3", expires)
+    assert lru.get("b") is None
+    assert (lru.get("a"), lru.get("c")) == ("1", "3")
+
+
+def test_memory_lru_drops_expired_entries():
+    lru = MemoryLRU()
+    lru.put("a", "1", time.time() - 1)
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+
+def test_sqlite_store_trims_to_max_entries(tmp_path):
+    store = SqliteResponseStore(str(tmp_path / "cache.db"), max_entries=2)
+    expires = time.time() + 60
+    for key in "abc":
+        store.put(key, key.upper(), expires)
+        time.sleep(0.01)
+    assert store.get("a") is None
+    assert store.get("c") == ("C", expires)
+
+
+def test_sqlite_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "cache.db")
+    LLMResponseCache(path=path).put("k", "response")
+    cache = LLMResponseCache(path=path)
+    assert cache.get("k") == "response"
+    assert cache.get("k") == "response"
+    assert cache.stats()["hits"] == {"memory": 1, "sqlite": 1}
+
+
+def test_memory_only_cache_and_ttl():
+    cache = LLMResponseCache(path=None, ttl=0.05)
+    assert cache.get("k") is None
+    cache.put("k", "response")
+    assert cache.get("k") == "response"
+    time.sleep(0.06)
+    assert cache.get("k") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_from_config():
+    cache = LLMResponseCache.from_config({"ttl": 5, "memory_size": 3, "path": None})
+    assert (cache.ttl, cache.memory.max_entries, cache.store) == (5, 3, None)
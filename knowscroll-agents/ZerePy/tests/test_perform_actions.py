@@ -0,0 +1,79 @@
+import threading
+import time
+
+
+def by_id(results):
+    return {result["id"]: result for result in results}
+
+
+def test_results_in_input_order_with_params(make_manager):
+    manager = make_manager(api={"echo": lambda text: text.upper()})
+    results = manager.perform_actions([
+        {"connection": "api", "action": "echo", "params": ["a"]},
+        {"connection": "api", "action": "echo", "params": ["b"]},
+    ])
+    assert [result["result"] for result in results] == ["A", "B"]
+    assert [result["id"] for result in results] == ["0", "1"]
+    assert all(result["status"] == "success" for result in results)
+
+
+def test_dependencies_run_first(make_manager):
+    finished = []
+
+    def step(name):
+        time.sleep(0.05 if name == "first" else 0)
+        finished.append(name)
+        return name
+
+    manager = make_manager(api={"step": step})
+    manager.perform_actions([
+        {"id": "second", "connection": "api", "action": "step", "params": ["second"], "depends_on": ["first"]},
+        {"id": "first", "connection": "api", "action": "step", "params": ["first"]},
+    ], max_concurrency=4)
+    assert finished == ["first", "second"]
+
+
+def test_failed_dependency_skips_dependents(make_manager):
+    def boom():
+        raise RuntimeError("boom")
+
+    manager = make_manager(api={"boom": boom, "ok": lambda: "ok"})
+    results = by_id(manager.perform_actions([
+        {"id": "a", "connection": "api", "action": "boom"},
+        {"id": "b", "connection": "api", "action": "ok", "depends_on": ["a"]},
+        {"id": "c", "connection": "api", "action": "ok"},
+    ]))
+    assert (results["a"]["status"], results["a"]["error"]) == ("error", "boom")
+    assert results["b"]["error"] == "Dependency 'a' failed"
+    assert results["c"]["status"] == "success"
+
+
+def test_cycles_and_unknown_dependencies_are_errors(make_manager):
+    manager = make_manager(api={"ok": lambda: "ok"})
+    results = by_id(manager.perform_actions([
+        {"id": "x", "connection": "api", "action": "ok", "depends_on": ["y"]},
+        {"id": "y", "connection": "api", "action": "ok", "depends_on": ["x"]},
+        {"id": "z", "connection": "api", "action": "ok", "depends_on": ["missing"]},
+    ]))
+    assert results["x"]["status"] == results["y"]["status"] == "error"
+    assert results["z"]["error"] == "Unknown dependency 'missing'"
+
+
+def test_connection_limit_caps_concurrency(make_manager):
+    lock = threading.Lock()
+    in_flight, peak = [0], [0]
+
+    def slow():
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+
+    manager = make_manager(api={"slow": slow})
+    manager.perform_actions(
+        [{"connection": "api", "action": "slow"} for _ in range(6)],
+        max_concurrency=6, connection_limits={"api": 2}
+    )
+    assert peak[0] == 2
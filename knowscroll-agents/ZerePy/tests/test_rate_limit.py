@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+import pytest
+from src.rate_limit import MemoryBucketStore, RateLimitExceeded, RateLimiter, SqliteBucketStore, get_rate_limiter
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteBucketStore(str(tmp_path / "buckets.db"))
+    return MemoryBucketStore()
+
+
+def test_take_allows_burst_then_reports_wait(store):
+    assert store.take("k", rate=1, capacity=2) == 0
+    assert store.take("k", rate=1, capacity=2) == 0
+    assert store.take("k", rate=1, capacity=2) == pytest.approx(1, abs=0.05)
+
+
+def test_drain_holds_bucket_back(store):
+    store.drain("k", seconds=10, rate=2)
+    assert store.take("k", rate=2, capacity=5) == pytest.approx(10.5, abs=0.05)
+
+
+def test_sqlite_state_is_shared_between_stores(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    first, second = SqliteBucketStore(path), SqliteBucketStore(path)
+    assert first.take("k", rate=1, capacity=1) == 0
+    assert second.take("k", rate=1, capacity=1) > 0
+
+
+def test_unconfigured_connection_is_not_limited():
+    assert RateLimiter().acquire("api", "anything") == 0
+
+
+def test_action_limit_and_default_bucket(store):
+    limiter = RateLimiter(store)
+    limiter.configure("api", {
+        "default": {"rate": 1, "per": 60},
+        "post": {"rate": 1, "per": 60},
+    })
+    limiter.acquire("api", "post")
+    limiter.acquire("api", "read")
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("api", "post", max_wait=1)
+    # Actions without their own limit share the default bucket
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("api", "search", max_wait=1)
+
+
+def test_acquire_waits_for_refill():
+    limiter = RateLimiter()
+    limiter.configure("api", {"default": {"rate": 20, "burst": 1}})
+    limiter.acquire("api")
+    assert limiter.acquire("api") == pytest.approx(0.05, abs=0.03)
+
+
+def test_backoff_holds_back_the_bucket_actions_use(store):
+    limiter = RateLimiter(store)
+    limiter.configure("api", {"default": {"rate": 10}})
+    assert limiter.backoff("api", 0.2) == 0.2
+    # A regular action resolves to the default bucket, so it is held back too,
+    # until one interval after the rate limited caller's retry
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("api", "send-message", max_wait=0.2)
+    assert limiter.acquire("api", "send-message", max_wait=1) == pytest.approx(0.3, abs=0.05)
+
+
+def test_backoff_without_limits_blocks_until_it_passes():
+    limiter = RateLimiter()
+    limiter.backoff("api", 0.1, "send-message")
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("api", "send-message", max_wait=0.01)
+    assert limiter.acquire("api", "send-message", max_wait=1) > 0
+
+
+def test_get_rate_limiter_is_per_store(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    assert get_rate_limiter(path) is get_rate_limiter(path)
+    assert isinstance(get_rate_limiter(path).store, SqliteBucketStore)
+    assert get_rate_limiter(str(tmp_path / "other.db")) is not get_rate_limiter(path)
+    assert isinstance(get_rate_limiter().store, MemoryBucketStore)
+
+
+def test_agents_configuring_one_bucket_get_the_stricter_limit():
+    limiter = RateLimiter()
+    limiter.configure("api", {"post": {"rate": 10, "burst": 2}, "read": {"rate": 5}})
+    limiter.configure("api", {"post": {"rate": 1, "burst": 5}})
+    assert limiter._bucket("api", "post") == ("api:post", 1.0, 2.0)
+    # Limits the second agent did not mention are kept
+    assert limiter._bucket("api", "read") == ("api:read", 5.0, 5.0)
+
+
+def test_echochambers_429_retry_takes_no_extra_token(monkeypatch):
+    from src.connections import echochambers_connection
+    from src.connections.echochambers_connection import EchochambersConnection
+
+    responses = [
+        SimpleNamespace(status_code=429, headers={"Retry-After": "1"}),
+        SimpleNamespace(status_code=200, headers={}, raise_for_status=lambda: None, json=lambda: {"ok": True}),
+    ]
+    session = SimpleNamespace(request=lambda method, url, **kwargs: responses.pop(0))
+    monkeypatch.setattr(echochambers_connection, "get_session", lambda: session)
+
+    limiter = RateLimiter()
+    limiter.configure("echochambers", {"default": {"rate": 10, "burst": 1}})
+    connection = object.__new__(EchochambersConnection)
+    connection.api_key = "key"
+    connection.rate_limiter = limiter
+
+    acquires = []
+    monkeypatch.setattr(limiter, "acquire", lambda *args, **kwargs: acquires.append(args))
+    sleeps = []
+    monkeypatch.setattr(echochambers_connection.time, "sleep", sleeps.append)
+
+    assert connection._make_request("POST", "http://echo.test", action_name="send-message") == {"ok": True}
+    assert not responses
+    assert sleeps == [1]
+    # The retry reuses the request's token instead of acquiring another
+    assert acquires == []
+    assert limiter.store.take("echochambers:*", 10, 1) == pytest.approx(1.1, abs=0.05)
@@ -0,0 +1,46 @@
+import pytest
+from src.utils.render_jobs import COMPLETED, FAILED, RenderJob, RenderJobService, validate_render_options
+
+
+@pytest.mark.parametrize("options", [
+    {"quality": "ultra"},
+    {"motion": "wild"},
+    {"transition": "wipe"},
+    {"renditions": [720, 0]},
+    {"renditions": []},
+    {"segment_duration": 0},
+])
+def test_invalid_options_are_rejected_on_submit(tmp_path, options):
+    service = RenderJobService(output_dir=str(tmp_path), workers=1)
+    with pytest.raises(ValueError):
+        service.submit("Title", "Script", **options)
+    assert service.jobs == {}
+    assert not service._threads
+
+
+def test_valid_options_pass():
+    validate_render_options({"quality": "low", "motion": "static", "renditions": [720, 360], "segment_duration": 2})
+
+
+def finish(service, status):
+    job = RenderJob(job_id=f"job_{len(service.jobs)}", title="t", script="s")
+    with service._lock:
+        service.jobs[job.job_id] = job
+        service._finish(job, status)
+    return job
+
+
+def test_oldest_finished_jobs_are_evicted_beyond_the_cap(tmp_path):
+    service = RenderJobService(output_dir=str(tmp_path), max_finished_jobs=2)
+    jobs = [finish(service, status) for status in (COMPLETED, FAILED, COMPLETED)]
+    assert list(service.jobs) == [jobs[1].job_id, jobs[2].job_id]
+
+
+def test_finished_jobs_expire_after_ttl(tmp_path):
+    service = RenderJobService(output_dir=str(tmp_path), finished_ttl=60)
+    job = finish(service, COMPLETED)
+    queued = RenderJob(job_id="queued", title="t", script="s")
+    service.jobs[queued.job_id] = queued
+    assert len(service.list_jobs()) == 2
+    job._finished_clock -= 61
+    assert service.list_jobs() == [queued]
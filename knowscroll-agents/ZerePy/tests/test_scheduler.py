@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from src.action_handler import readiness_registry
+from src.scheduler import TaskScheduler
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_agent(down=()):
+    return SimpleNamespace(
+        model_provider=None,
+        connection_manager=SimpleNamespace(is_available=lambda name: name not in down)
+    )
+
+
+def names(selected):
+    return [task["name"] for task in selected]
+
+
+def test_nearest_deadline_first_regardless_of_weight():
+    clock = FakeClock()
+    scheduler = TaskScheduler([
+        {"name": "chatty", "weight": 100},
+        {"name": "later", "weight": 50, "max_staleness": 600},
+        {"name": "report", "weight": 1, "max_staleness": 60},
+    ], clock=clock)
+    assert names(scheduler.select(make_agent(), count=3)) == ["report", "later", "chatty"]
+
+
+def test_weight_breaks_deadline_ties():
+    clock = FakeClock()
+    scheduler = TaskScheduler([
+        {"name": "light", "weight": 1, "max_staleness": 10},
+        {"name": "heavy", "weight": 5, "max_staleness": 10},
+        {"name": "undated_light", "weight": 1},
+        {"name": "undated_heavy", "weight": 3},
+    ], clock=clock)
+    assert names(scheduler.select(make_agent(), count=4)) == ["heavy", "light", "undated_heavy", "undated_light"]
+
+
+def test_running_a_task_pushes_its_deadline_back():
+    clock = FakeClock()
+    scheduler = TaskScheduler([
+        {"name": "a", "weight": 1, "max_staleness": 10},
+        {"name": "b", "weight": 1, "max_staleness": 30},
+    ], clock=clock)
+    assert names(scheduler.select(make_agent())) == ["a"]
+    scheduler.mark_run("a")
+    clock.now += 5
+    # a is now due at 1015, b at 1030
+    assert names(scheduler.select(make_agent(), count=2)) == ["a", "b"]
+    clock.now += 20
+    scheduler.mark_run("a")
+    assert names(scheduler.select(make_agent(), count=2)) == ["b", "a"]
+
+
+def test_min_interval_and_seconds_until_next():
+    clock = FakeClock()
+    scheduler = TaskScheduler([{"name": "post", "weight": 1, "min_interval": 30}], clock=clock)
+    scheduler.mark_run("post")
+    clock.now += 10
+    assert scheduler.select(make_agent()) == []
+    assert scheduler.seconds_until_next() == 20
+    clock.now += 20
+    assert names(scheduler.select(make_agent())) == ["post"]
+
+
+def test_skips_tasks_whose_connection_is_down_or_not_ready():
+    scheduler = TaskScheduler([
+        {"name": "tweet", "weight": 1, "requires": ["twitter"]},
+        {"name": "idle", "weight": 1},
+        {"name": "zero", "weight": 0},
+    ])
+    readiness_registry["idle"] = lambda agent: False
+    try:
+        assert scheduler.select(make_agent(down=("twitter",)), count=3) == []
+        assert names(scheduler.select(make_agent(), count=3)) == ["tweet"]
+    finally:
+        del readiness_registry["idle"]